@@ -0,0 +1,106 @@
+# app/bench/cold_start.py
+"""
+콜드 스타트 측정. 매번 새 프로세스를 띄워 시간을 잰다 (import 캐시가 남지 않도록).
+- help      : `finance_sum.py --help` 종료까지 (torch/kss/openai를 import 하지 않아야 빠름)
+- import    : `import app.model.finance_sum` 종료까지 + torch가 같이 import 됐는지
+- api       : uvicorn 프로세스 시작 ~ `/`가 200을 돌려줄 때까지 (API time-to-ready)
+- first-term: (--first-term) finance_sum.py --ids <id> 실행의 time-to-first-term 로그 값
+              가짜 GPT 서버를 쓰고 문장 캐시는 끈다. 모델 파일(.pth 또는 --model-dir)이 있어야 한다.
+
+사용 예) BE 폴더에서
+    python -m app.bench.cold_start --db term.db --repeat 5
+    python -m app.bench.cold_start --db term.db --first-term 1
+"""
+import argparse
+import os
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+from app.bench.db_modes import BE_DIR, _free_port
+
+FINANCE_SUM = os.path.join(BE_DIR, "app", "model", "finance_sum.py")
+FIRST_TERM_RE = re.compile(r"time-to-first-term: ([\d.]+)s")
+IMPORT_SNIPPET = "import sys, app.model.finance_sum; print('torch' in sys.modules)"
+
+
+def _timed_run(cmd: list[str], env: dict) -> tuple[float, str]:
+    started = time.perf_counter()
+    out = subprocess.run(cmd, cwd=BE_DIR, env=env, capture_output=True, text=True, check=True)
+    return time.perf_counter() - started, out.stdout + out.stderr
+
+
+def time_help(env: dict) -> float:
+    return _timed_run([sys.executable, FINANCE_SUM, "--help"], env)[0]
+
+
+def time_import(env: dict) -> tuple[float, bool]:
+    seconds, output = _timed_run([sys.executable, "-c", IMPORT_SNIPPET], env)
+    return seconds, output.strip().splitlines()[-1] == "True"
+
+
+def time_api_ready(env: dict, timeout: float = 60.0) -> float:
+    port = _free_port()
+    started = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=BE_DIR, env=env, stdout=subprocess.DEVNULL,
+    )
+    try:
+        with httpx.Client(base_url=f"http://127.0.0.1:{port}") as client:
+            while time.perf_counter() - started < timeout:
+                try:
+                    if client.get("/").status_code == 200:
+                        return time.perf_counter() - started
+                except httpx.TransportError:
+                    pass
+                if proc.poll() is not None:
+                    raise RuntimeError(f"uvicorn이 종료되었습니다 (exit {proc.returncode})")
+                time.sleep(0.02)
+        raise RuntimeError(f"서버가 {timeout:.0f}초 안에 뜨지 않았습니다")
+    finally:
+        proc.terminate()
+        proc.wait(timeout=10)
+
+
+def time_first_term(env: dict, term_id: int) -> float:
+    _, output = _timed_run([sys.executable, FINANCE_SUM, "--ids", str(term_id), "--fake-gpt-latency", "0",
+                            "--no-sentence-cache"], env)
+    m = FIRST_TERM_RE.search(output)
+    if not m:
+        raise RuntimeError(f"time-to-first-term 로그를 찾지 못했습니다:\n{output[-2000:]}")
+    return float(m.group(1))
+
+
+def _report(name: str, samples: list[float]):
+    print(f"{name:>10}: median {statistics.median(samples) * 1000:8.0f}ms  "
+          f"min {min(samples) * 1000:8.0f}ms  max {max(samples) * 1000:8.0f}ms  (n={len(samples)})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="CLI/API 콜드 스타트 시간 측정")
+    parser.add_argument("--db", default=os.path.join(BE_DIR, "term.db"), help="원본 SQLite DB (복사해서 사용)")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--first-term", type=int, default=None, metavar="TERM_ID",
+                        help="지정하면 이 약관 1건으로 finance_sum.py의 time-to-first-term도 측정")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "term.db")
+        shutil.copy(args.db, db_path)
+        env = dict(os.environ, DATABASE_URL=f"sqlite:///{db_path}")
+        cli_env = dict(env, DATABASE_URL=db_path)  # finance_sum.py는 파일 경로 형식
+
+        _report("help", [time_help(cli_env) for _ in range(args.repeat)])
+        imports = [time_import(cli_env) for _ in range(args.repeat)]
+        _report("import", [seconds for seconds, _ in imports])
+        print(f"{'':>10}  import 시 torch 로드: {'예' if any(t for _, t in imports) else '아니오'}")
+        _report("api", [time_api_ready(env) for _ in range(args.repeat)])
+        if args.first_term is not None:
+            _report("first-term", [time_first_term(cli_env, args.first_term) for _ in range(args.repeat)])
@@ -0,0 +1,128 @@
+# app/bench/db_modes.py
+"""
+동기(스레드풀) vs 비동기(aiosqlite/asyncpg) DB 경로 부하 비교.
+같은 DB 복사본으로 uvicorn을 DB_ASYNC=0 / 1로 차례로 띄우고,
+같은 동시 요청 부하를 걸어 초당 요청 수와 p50/p95/p99 지연을 비교한다.
+(조회 캐시가 결과를 가리지 않도록 기본으로 TERM_CACHE_SIZE=0)
+
+사용 예) BE 폴더에서
+    python -m app.bench.db_modes --db term.db --concurrency 64 --requests 2000
+"""
+import argparse
+import asyncio
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+BE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEFAULT_PATHS = ["/public/terms/", "/public/terms/{id}", "/public/terms/{id}/summary"]
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _percentile(sorted_values: list[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(round(q * (len(sorted_values) - 1))))]
+
+
+async def _wait_ready(base_url: str, timeout: float = 30.0):
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        while time.monotonic() < deadline:
+            try:
+                if (await client.get("/")).status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.2)
+    raise RuntimeError(f"서버가 {timeout:.0f}초 안에 뜨지 않았습니다: {base_url}")
+
+
+async def _load(base_url: str, paths: list[str], ids: list[int], total: int, concurrency: int) -> dict:
+    latencies: list[float] = []
+    errors = 0
+    counter = iter(range(total))
+
+    async def worker(client: httpx.AsyncClient):
+        nonlocal errors
+        for i in counter:
+            path = paths[i % len(paths)].format(id=ids[i % len(ids)])
+            t0 = time.perf_counter()
+            try:
+                r = await client.get(path)
+                if r.status_code >= 500:
+                    errors += 1
+            except httpx.TransportError:
+                errors += 1
+            latencies.append(time.perf_counter() - t0)
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60.0) as client:
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(client) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": len(latencies) / elapsed if elapsed else 0.0,
+        "p50_ms": _percentile(latencies, 0.50) * 1000,
+        "p95_ms": _percentile(latencies, 0.95) * 1000,
+        "p99_ms": _percentile(latencies, 0.99) * 1000,
+    }
+
+
+def run_mode(db_path: str, db_async: bool, args) -> dict:
+    port = _free_port()
+    env = dict(os.environ,
+               DATABASE_URL=f"sqlite:///{db_path}",
+               DB_ASYNC="1" if db_async else "0",
+               TERM_CACHE_SIZE=str(args.cache_size))
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=BE_DIR, env=env, stdout=subprocess.DEVNULL,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        asyncio.run(_wait_ready(base_url))
+        ids = asyncio.run(_term_ids(base_url))
+        asyncio.run(_load(base_url, args.paths, ids, min(200, args.requests), args.concurrency))  # 워밍업
+        return asyncio.run(_load(base_url, args.paths, ids, args.requests, args.concurrency))
+    finally:
+        proc.terminate()
+        proc.wait(timeout=10)
+
+
+async def _term_ids(base_url: str) -> list[int]:
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        return [t["id"] for t in (await client.get("/public/terms/")).json()] or [1]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="DB_ASYNC=0/1 부하 비교")
+    parser.add_argument("--db", default=os.path.join(BE_DIR, "term.db"), help="원본 SQLite DB (복사해서 사용)")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--paths", nargs="+", default=DEFAULT_PATHS, help="요청 경로 ({id}는 약관 id로 치환)")
+    parser.add_argument("--cache-size", type=int, default=0, help="서버의 TERM_CACHE_SIZE")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "term.db")
+        shutil.copy(args.db, db_path)
+        for db_async in (False, True):
+            st = run_mode(db_path, db_async, args)
+            print(f"DB_ASYNC={int(db_async)}: {st['rps']:.1f} req/s, p50 {st['p50_ms']:.1f}ms, "
+                  f"p95 {st['p95_ms']:.1f}ms, p99 {st['p99_ms']:.1f}ms, 오류 {st['errors']}/{st['requests']}")
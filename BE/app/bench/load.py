@@ -0,0 +1,284 @@
+# app/bench/load.py
+"""
+API 부하 테스트 + 지연 시간 회귀 검사 (릴리스 전 용량 확인용).
+임시 SQLite DB에 합성 약관 N건과 요약/키워드를 넣고, main.py의 app에
+목록/상세/요약/관리자 검색 요청을 정해진 비율로 동시에 보내 엔드포인트별 처리량과 p50/p95/p99를 잰다.
+- --mode inprocess: httpx ASGITransport로 같은 프로세스에서 호출 (네트워크/서버 오버헤드 제외)
+- --mode uvicorn:   로컬 uvicorn을 띄워 실제 HTTP로 호출
+--save-baseline으로 결과를 저장해 두고, 다음 실행에서 --baseline으로 비교하면
+p95/p99가 --max-regression(기본 20%) 넘게 늘거나 처리량이 그만큼 줄었을 때,
+또는 오류율(4xx/5xx/연결 오류)이 기준보다 --max-error-rate(기본 0) 넘게 늘었을 때 종료 코드 1로 실패한다.
+
+사용 예) BE 폴더에서
+    python -m app.bench.load --terms 2000 --requests 5000 --save-baseline load_baseline.json
+    python -m app.bench.load --terms 2000 --requests 5000 --baseline load_baseline.json
+    python -m app.bench.load --mode uvicorn --mix list=1,detail=4,summary=4,search=1 --db-async
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+from app.bench.db_modes import BE_DIR, _free_port, _percentile, _wait_ready
+
+ENDPOINTS = {
+    "list": "/public/terms/",
+    "detail": "/public/terms/{id}",
+    "summary": "/public/terms/{id}/summary",
+    "search": "/admin/terms/?q={q}",
+}
+DEFAULT_MIX = "list=2,detail=4,summary=3,search=1"
+SEARCH_QUERIES = ["개인정보", "전자금융거래", "수수료", "손해배상", "관할법원", "연체이자"]
+KEYWORDS = ["개인정보", "수수료", "손해배상", "계약해지", "연체이자", "전자금융", "보험금", "환불"]
+ADMIN_TOKEN = "load-test-token"
+COMPARED_KEYS = ("p95_ms", "p99_ms")
+
+
+def parse_mix(text: str) -> dict[str, float]:
+    """ "list=2,detail=4" → {"list": 2.0, "detail": 4.0} """
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in ENDPOINTS:
+            raise ValueError(f"알 수 없는 엔드포인트: {name} (가능: {', '.join(ENDPOINTS)})")
+        mix[name] = float(weight or 1)
+    return {k: v for k, v in mix.items() if v > 0}
+
+
+def seed_database(db_path: str, n_terms: int, articles: int, seed: int):
+    """ 약관 n건 + 약관마다 요약 1건과 키워드를 넣은 DB 생성 (FTS 색인은 app 시작 시 생성됨) """
+    from sqlalchemy import create_engine, insert
+
+    from app.db.base import Base
+    from app.model.bench import make_synthetic_term
+    from app.models.term import Term
+    from app.models.term_keyword import TermKeyword
+    from app.models.term_summary import TermSummary
+    from app.models import summary_job as _summary_job_model  # noqa: F401
+
+    rng = random.Random(seed)
+    engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        for start in range(1, n_terms + 1, 1000):
+            ids = range(start, min(n_terms, start + 999) + 1)
+            conn.execute(insert(Term), [
+                {"id": i, "title": f"합성 약관 {i}", "content": make_synthetic_term(articles, 3, rng), "is_active": 1}
+                for i in ids
+            ])
+            keywords = {i: rng.sample(KEYWORDS, 4) for i in ids}
+            conn.execute(insert(TermSummary), [
+                {"term_id": i, "summary_text": f"합성 약관 {i}의 요약입니다.", "keywords": ",".join(keywords[i])}
+                for i in ids
+            ])
+            conn.execute(insert(TermKeyword), [
+                {"term_id": i, "keyword": kw, "keyword_norm": kw.lower(), "rank": rank}
+                for i in ids for rank, kw in enumerate(keywords[i])
+            ])
+    engine.dispose()
+
+
+def _plan(mix: dict[str, float], n_terms: int, total: int, seed: int) -> list[tuple[str, str]]:
+    """ 요청 순서를 미리 정해 둔다 (같은 seed면 매번 같은 부하) """
+    rng = random.Random(seed)
+    names = rng.choices(list(mix), weights=list(mix.values()), k=total)
+    return [(name, ENDPOINTS[name].format(id=rng.randint(1, n_terms), q=rng.choice(SEARCH_QUERIES)))
+            for name in names]
+
+
+async def _drive(client: httpx.AsyncClient, plan: list[tuple[str, str]], concurrency: int) -> dict:
+    samples: dict[str, list[float]] = {name: [] for name, _ in plan}
+    errors: dict[str, int] = {name: 0 for name in samples}
+    headers = {"Authorization": f"Bearer {ADMIN_TOKEN}"}
+    it = iter(plan)
+
+    async def worker():
+        for name, path in it:
+            t0 = time.perf_counter()
+            try:
+                r = await client.get(path, headers=headers if name == "search" else None)
+                if r.status_code >= 400:
+                    errors[name] += 1
+            except httpx.TransportError:
+                errors[name] += 1
+            samples[name].append(time.perf_counter() - t0)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    endpoints = {}
+    for name, latencies in samples.items():
+        latencies.sort()
+        endpoints[name] = {
+            "requests": len(latencies),
+            "errors": errors[name],
+            "rps": len(latencies) / elapsed if elapsed else 0.0,
+            "p50_ms": _percentile(latencies, 0.50) * 1000,
+            "p95_ms": _percentile(latencies, 0.95) * 1000,
+            "p99_ms": _percentile(latencies, 0.99) * 1000,
+        }
+    everything = sorted(x for latencies in samples.values() for x in latencies)
+    return {
+        "seconds": elapsed,
+        "total": {
+            "requests": len(everything),
+            "errors": sum(errors.values()),
+            "rps": len(everything) / elapsed if elapsed else 0.0,
+            "p50_ms": _percentile(everything, 0.50) * 1000,
+            "p95_ms": _percentile(everything, 0.95) * 1000,
+            "p99_ms": _percentile(everything, 0.99) * 1000,
+        },
+        "endpoints": endpoints,
+    }
+
+
+async def _run_inprocess(plan, warmup, concurrency) -> dict:
+    from app.main import app  # DATABASE_URL 등 환경 변수를 설정한 뒤에 import
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://loadtest", limits=limits,
+                                     timeout=60.0) as client:
+            await _drive(client, warmup, concurrency)
+            return await _drive(client, plan, concurrency)
+
+
+def _run_uvicorn(plan, warmup, concurrency) -> dict:
+    port = _free_port()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=BE_DIR, env=dict(os.environ), stdout=subprocess.DEVNULL,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+
+    async def run():
+        await _wait_ready(base_url, timeout=120.0)
+        limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+        async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60.0) as client:
+            await _drive(client, warmup, concurrency)
+            return await _drive(client, plan, concurrency)
+
+    try:
+        return asyncio.run(run())
+    finally:
+        proc.terminate()
+        proc.wait(timeout=10)
+
+
+def _error_rate(stats: dict) -> float:
+    return stats["errors"] / stats["requests"] if stats["requests"] else 0.0
+
+
+def compare(baseline: dict, current: dict, max_regression: float,
+            max_error_rate: float = 0.0) -> tuple[list[str], list[str]]:
+    """
+    (비교 줄, 실패 사유). p95/p99 증가율 또는 처리량 감소율이 max_regression을 넘거나,
+    오류율이 기준 오류율 + max_error_rate를 넘으면 실패 (빨리 오류만 돌려주는 빌드가 통과하지 않도록)
+    """
+    lines, failures = [], []
+    for name, cur in [("total", current["total"]), *current["endpoints"].items()]:
+        base = baseline["total"] if name == "total" else baseline.get("endpoints", {}).get(name)
+        base_error_rate = _error_rate(base) if base else 0.0
+        if _error_rate(cur) > base_error_rate + max_error_rate:
+            failures.append(f"{name} errors {cur['errors']}/{cur['requests']} (기준 {base_error_rate:.2%})")
+        if not base:
+            lines.append(f"{name:>8}: (기준 없음), 오류 {cur['errors']}")
+            continue
+        parts = []
+        for key in COMPARED_KEYS:
+            change = (cur[key] - base[key]) / base[key] if base[key] else 0.0
+            parts.append(f"{key[:3]} {base[key]:.1f} → {cur[key]:.1f}ms ({change:+.0%})")
+            if change > max_regression:
+                failures.append(f"{name} {key} {change:+.0%}")
+        # 엔드포인트별 rps는 비율에 따라 달라지므로 전체 처리량만 비교
+        if name == "total" and base["rps"]:
+            change = (cur["rps"] - base["rps"]) / base["rps"]
+            parts.append(f"rps {base['rps']:.0f} → {cur['rps']:.0f} ({change:+.0%})")
+            if -change > max_regression:
+                failures.append(f"total rps {change:+.0%}")
+        parts.append(f"오류 {base['errors']} → {cur['errors']}")
+        lines.append(f"{name:>8}: " + ", ".join(parts))
+    return lines, failures
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="API 부하 테스트 + 지연 시간 회귀 검사")
+    parser.add_argument("--mode", choices=("inprocess", "uvicorn"), default="inprocess")
+    parser.add_argument("--terms", type=int, default=1000, help="시드 DB의 약관(=요약) 수")
+    parser.add_argument("--articles", type=int, default=5, help="합성 약관 1건당 조항 수")
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--warmup", type=int, default=200, help="측정 전에 보내는 요청 수")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"엔드포인트 비율 ({', '.join(ENDPOINTS)})")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--db-async", action="store_true", help="서버를 DB_ASYNC=1로 실행")
+    parser.add_argument("--cache-size", type=int, default=None, help="서버의 TERM_CACHE_SIZE (기본: 설정값 그대로)")
+    parser.add_argument("--out", default=None, help="결과 JSON 경로")
+    parser.add_argument("--save-baseline", default=None, help="결과를 기준 파일로 저장")
+    parser.add_argument("--baseline", default=None, help="비교할 기준 파일 (회귀 시 종료 코드 1)")
+    parser.add_argument("--max-regression", type=float, default=0.20, help="허용하는 p95/p99 증가율, 처리량 감소율")
+    parser.add_argument("--max-error-rate", type=float, default=0.0, help="기준 대비 허용하는 오류율 증가 (0.01 = 1%%p)")
+    args = parser.parse_args()
+
+    mix = parse_mix(args.mix)
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "load.db")
+        # app 모듈(config/session)이 import 되기 전에 설정 (시드 단계의 모델 import도 포함)
+        os.environ.update(DATABASE_URL=f"sqlite:///{db_path}", ADMIN_TOKEN=ADMIN_TOKEN,
+                          DB_ASYNC="1" if args.db_async else "0", PROFILING_ENABLED="0")
+        if args.cache_size is not None:
+            os.environ["TERM_CACHE_SIZE"] = str(args.cache_size)
+        t0 = time.perf_counter()
+        seed_database(db_path, args.terms, args.articles, args.seed)
+        print(f"시드 DB: 약관 {args.terms}건 ({time.perf_counter() - t0:.1f}s)")
+
+        plan = _plan(mix, args.terms, args.requests, args.seed)
+        warmup = _plan(mix, args.terms, args.warmup, args.seed + 1)
+        if args.mode == "inprocess":
+            stats = asyncio.run(_run_inprocess(plan, warmup, args.concurrency))
+        else:
+            stats = _run_uvicorn(plan, warmup, args.concurrency)
+
+    result = {
+        "meta": {
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"), "mode": args.mode, "terms": args.terms,
+            "requests": args.requests, "concurrency": args.concurrency, "mix": mix, "seed": args.seed,
+            "db_async": args.db_async, "cache_size": args.cache_size,
+            "python": platform.python_version(), "machine": platform.machine(),
+        },
+        **stats,
+    }
+    for name, st in [("total", stats["total"]), *sorted(stats["endpoints"].items())]:
+        print(f"{name:>8}: {st['requests']}건, {st['rps']:.1f} req/s, p50 {st['p50_ms']:.1f}ms, "
+              f"p95 {st['p95_ms']:.1f}ms, p99 {st['p99_ms']:.1f}ms, 오류 {st['errors']}")
+    for path in (args.out, args.save_baseline):
+        if path:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(result, f, ensure_ascii=False, indent=2)
+            print(f"결과 저장: {path}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        differs = [k for k in ("mode", "terms", "concurrency", "mix", "db_async") if baseline["meta"].get(k) != result["meta"][k]]
+        if differs:
+            print(f"주의: 기준과 설정이 다릅니다 ({', '.join(differs)})")
+        print(f"--- 기준({args.baseline}) 대비, 허용 {args.max_regression:.0%} ---")
+        lines, failures = compare(baseline, result, args.max_regression, args.max_error_rate)
+        for line in lines:
+            print(line)
+        if failures:
+            print(f"회귀: {', '.join(failures)}")
+            sys.exit(1)
+        print("회귀 없음")
@@ -0,0 +1,93 @@
+# app/bench/search.py
+"""
+관리자 약관 검색 벤치마크: 기존 LIKE '%q%' 검색 vs FTS5 bigram 인덱스.
+임시 SQLite DB에 합성 약관을 N건 넣고 같은 검색어 목록으로 지연 시간을 비교한다.
+
+사용 예) BE 폴더에서
+    python -m app.bench.search --sizes 10000 100000
+"""
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from sqlalchemy import create_engine, insert, or_
+from sqlalchemy.orm import Session
+
+from app.db.base import Base
+from app.model.bench import make_synthetic_term
+from app.models.term import Term
+from app.models import term_summary as _term_summary_model  # noqa: F401
+from app.services import term_search
+
+DEFAULT_QUERIES = ["개인정보", "전자금융거래", "수수료", "손해배상", "동의를 받아", "관할법원", "고유식별정보", "연체이자"]
+
+
+def _seed(engine, n: int, articles: int, seed: int):
+    rng = random.Random(seed)
+    with engine.begin() as conn:
+        for start in range(0, n, 1000):
+            conn.execute(insert(Term), [
+                {"title": f"합성 약관 {i}", "content": make_synthetic_term(articles, 3, rng), "is_active": 1}
+                for i in range(start, min(n, start + 1000))
+            ])
+
+
+def _time(fn, queries: list[str], repeat: int) -> dict:
+    latencies, hits = [], 0
+    for _ in range(repeat):
+        for q in queries:
+            t0 = time.perf_counter()
+            hits = len(fn(q))
+            latencies.append((time.perf_counter() - t0) * 1000)
+    latencies.sort()
+    return {
+        "p50_ms": statistics.median(latencies),
+        "p95_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+        "last_hits": hits,
+    }
+
+
+def run(size: int, queries: list[str], articles: int, repeat: int, seed: int = 0) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'search.db')}")
+        Base.metadata.create_all(bind=engine)
+        _seed(engine, size, articles, seed)
+
+        t0 = time.perf_counter()
+        term_search.ensure_fts_index(engine)
+        index_seconds = time.perf_counter() - t0
+
+        with Session(engine) as db:
+            def like_search(q):
+                like = f"%{q}%"
+                return db.query(Term.id).filter(or_(Term.title.like(like), Term.content.like(like))).all()
+
+            def fts_search(q):
+                return term_search.search_ids(db, q)
+
+            result = {
+                "size": size,
+                "fts_index_seconds": index_seconds,
+                "like": _time(like_search, queries, repeat),
+                "fts": _time(fts_search, queries, repeat),
+            }
+        engine.dispose()
+        return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="LIKE vs FTS5 약관 검색 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000], help="약관 건수")
+    parser.add_argument("--articles", type=int, default=5, help="합성 약관 1건당 조항 수")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--queries", nargs="+", default=DEFAULT_QUERIES)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        r = run(size, args.queries, args.articles, args.repeat)
+        print(f"[{size:>7}건] FTS 색인 {r['fts_index_seconds']:.1f}s")
+        for name in ("like", "fts"):
+            print(f"    {name:>4}: p50 {r[name]['p50_ms']:.2f}ms, p95 {r[name]['p95_ms']:.2f}ms")
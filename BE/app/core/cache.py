@@ -0,0 +1,116 @@
+# app/core/cache.py
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    크기 제한(LRU) + 만료 시간(TTL)이 있는 프로세스 내부 캐시.
+    여러 요청 스레드에서 동시에 쓰므로 lock으로 보호한다.
+    bypass()가 True를 돌려주는 동안 get_or_load는 캐시를 읽지도 저장하지도 않고 loader만 실행한다.
+    invalidate 계열은 세대(generation)를 올린다. loader 실행 중에 세대가 바뀌었으면 그 결과는 저장하지 않는다
+    (무효화 전에 읽기 시작한 이전 값이 무효화 뒤에 다시 들어가 TTL 동안 남지 않도록)
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0, bypass: Optional[Callable[[], bool]] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.bypass = bypass
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._generation = 0
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """ (찾았는지, 값) 반환. 만료된 항목은 지우고 miss로 처리 """
+        now = time.monotonic()
+        with self._lock:
+            item = self._data.get(key)
+            if item is not None:
+                expires_at, value = item
+                if expires_at > now:
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return True, value
+                del self._data[key]
+            self.misses += 1
+            return False, None
+
+    def set(self, key: Hashable, value: Any, generation: Optional[int] = None):
+        """ generation을 주면 그 뒤로 무효화가 없었을 때만 저장 """
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def _bypassed(self) -> bool:
+        return self.bypass is not None and self.bypass()
+
+    def _begin_load(self, key: Hashable) -> Tuple[bool, Any, Optional[int]]:
+        """ (찾았는지, 값, loader 결과를 저장할 때 쓸 세대). bypass 중이면 세대는 None (저장 안 함) """
+        if self._bypassed():
+            return False, None, None
+        with self._lock:
+            generation = self._generation
+        found, value = self.get(key)
+        return found, value, generation
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """ 캐시에 없으면 loader()로 읽어 저장. None은 저장하지 않음(404 응답이 굳지 않도록) """
+        found, value, generation = self._begin_load(key)
+        if found:
+            return value
+        value = loader()
+        if value is not None and generation is not None:
+            self.set(key, value, generation)
+        return value
+
+    async def aget_or_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """ get_or_load의 비동기 버전 (loader는 코루틴을 돌려주는 함수) """
+        found, value, generation = self._begin_load(key)
+        if found:
+            return value
+        value = await loader()
+        if value is not None and generation is not None:
+            self.set(key, value, generation)
+        return value
+
+    def invalidate(self, *keys: Hashable):
+        with self._lock:
+            self._generation += 1
+            for key in keys:
+                self._data.pop(key, None)
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]):
+        with self._lock:
+            self._generation += 1
+            for key in [k for k in self._data if predicate(k)]:
+                del self._data[key]
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._data.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / total if total else 0.0,
+                "evictions": self.evictions,
+            }
@@ -13,9 +13,67 @@ def _get_bool(key: str, default: bool = False) -> bool:
         return default
     return v.lower() in ("1", "true", "yes", "y")
 
+def _get_int(key: str, default: int) -> int:
+    v = os.getenv(key)
+    return int(v) if v not in (None, "") else default
+
+def _get_float(key: str, default: float) -> float:
+    v = os.getenv(key)
+    return float(v) if v not in (None, "") else default
+
 DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite:///./term.db")
+
+# API 요청을 비동기 엔진(aiosqlite / asyncpg)으로 처리할지 여부
+# 끄면 기존처럼 동기 세션을 스레드풀에서 실행한다 (두 경로의 부하 비교용 스위치)
+DB_ASYNC: bool = _get_bool("DB_ASYNC", False)
+
+def _async_url(url: str) -> str:
+    """ 동기 URL의 드라이버를 비동기 드라이버로 바꾼다 (이미 지정돼 있으면 그대로) """
+    scheme, sep, rest = url.partition("://")
+    if "+" in scheme:
+        return url
+    driver = {"sqlite": "sqlite+aiosqlite", "postgresql": "postgresql+asyncpg", "postgres": "postgresql+asyncpg"}
+    return driver.get(scheme, scheme) + sep + rest
+
+ASYNC_DATABASE_URL: str = os.getenv("ASYNC_DATABASE_URL") or _async_url(DATABASE_URL)
+
+# 읽기 복제본 (비우면 primary 하나만 사용). public 목록/상세/요약 조회만 여기로 보낸다
+# 로컬 테스트: 같은 스키마의 SQLite 파일 두 개 (예: DATABASE_READ_URL=sqlite:///./term_replica.db)
+DATABASE_READ_URL: str = os.getenv("DATABASE_READ_URL", "")
+ASYNC_DATABASE_READ_URL: str = os.getenv("ASYNC_DATABASE_READ_URL") or (
+    _async_url(DATABASE_READ_URL) if DATABASE_READ_URL else "")
+# 쓰기 후 이 시간(초) 동안은 해당 약관/목록 조회를 primary에서 (복제 지연 동안 이전 값이 보이지 않도록)
+READ_YOUR_WRITES_WINDOW: float = _get_float("READ_YOUR_WRITES_WINDOW", 5.0)
+# replica 조회가 DB 오류로 실패하면 이 시간(초) 동안 primary만 사용
+REPLICA_RETRY_AFTER: float = _get_float("REPLICA_RETRY_AFTER", 30.0)
+
 DEBUG: bool = _get_bool("DEBUG", True)
 
+# app.* 로거 레벨 (DEBUG면 요약 조회 등 세부 로그까지 출력)
+LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO").upper()
+
+# /metrics (Prometheus 텍스트 형식) 노출 여부
+METRICS_ENABLED: bool = _get_bool("METRICS_ENABLED", True)
+
+# 관리자 요청 프로파일링 (X-Profile: 1 또는 ?profile=1, 관리자 토큰 필요). 필요할 때만 PROFILING_ENABLED=1로 켠다
+PROFILING_ENABLED: bool = _get_bool("PROFILING_ENABLED", False)
+PROFILE_RING_SIZE: int = _get_int("PROFILE_RING_SIZE", 50)  # 메모리에 보관할 최근 리포트 수
+PROFILE_TOP_N: int = _get_int("PROFILE_TOP_N", 40)           # 리포트에 출력할 함수 수 (cumulative 순)
+
+# DB 커넥션 풀 (SQLite 파일 DB도 QueuePool을 쓰므로 같이 적용, :memory:는 제외)
+DB_POOL_SIZE: int = _get_int("DB_POOL_SIZE", 5)
+DB_MAX_OVERFLOW: int = _get_int("DB_MAX_OVERFLOW", 10)
+DB_POOL_TIMEOUT: float = _get_float("DB_POOL_TIMEOUT", 30.0)   # 커넥션 대기 최대 시간(초)
+DB_POOL_RECYCLE: int = _get_int("DB_POOL_RECYCLE", 3600)       # 초, -1이면 끔
+
+# SQLite PRAGMA (커넥션마다 connect 이벤트에서 적용)
+# WAL + busy_timeout: 배치 스크립트가 쓰는 동안에도 API 읽기가 막히지 않고, 쓰기 충돌 시 바로 실패하지 않고 기다림
+SQLITE_JOURNAL_MODE: str = os.getenv("SQLITE_JOURNAL_MODE", "WAL")
+SQLITE_BUSY_TIMEOUT_MS: int = _get_int("SQLITE_BUSY_TIMEOUT_MS", 5000)
+SQLITE_SYNCHRONOUS: str = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")  # WAL에서는 NORMAL로 충분
+SQLITE_MMAP_SIZE: int = _get_int("SQLITE_MMAP_SIZE", 256 * 1024 * 1024)  # byte, 0이면 mmap 안 씀
+SQLITE_CACHE_SIZE: int = _get_int("SQLITE_CACHE_SIZE", -64000)  # 음수는 KB 단위 (약 64MB)
+
 # CORS_ORIGINS가 * 이면 전체 허용, 아니면 콤마로 구분된 리스트
 _raw_origins = os.getenv("CORS_ORIGINS", "*")
 if _raw_origins.strip() == "*":
@@ -24,3 +82,14 @@ if _raw_origins.strip() == "*":
 else:
     CORS_ALLOW_ALL = False
     CORS_ORIGINS = [o.strip() for o in _raw_origins.split(",") if o.strip()]
+
+# public 약관 조회 캐시 (프로세스 내부 LRU + TTL)
+# 배치 스크립트 등 다른 프로세스가 쓴 요약은 TTL이 지나야 반영됨
+# (요약 워커가 끝낸 작업은 SUMMARY_JOB_WATCH_INTERVAL초마다 확인해 바로 무효화, 0이면 끔)
+TERM_CACHE_SIZE: int = _get_int("TERM_CACHE_SIZE", 1024)      # 0이면 캐시 끔
+TERM_CACHE_TTL: float = _get_float("TERM_CACHE_TTL", 300.0)   # 초
+SUMMARY_JOB_WATCH_INTERVAL: float = _get_float("SUMMARY_JOB_WATCH_INTERVAL", 2.0)
+
+# 관리자 NDJSON 일괄 등록/내보내기
+TERM_BULK_BATCH_SIZE: int = _get_int("TERM_BULK_BATCH_SIZE", 500)    # 트랜잭션 1개당 INSERT 행 수
+TERM_EXPORT_CHUNK_SIZE: int = _get_int("TERM_EXPORT_CHUNK_SIZE", 200)  # 서버 측 커서에서 한 번에 가져올 행 수
@@ -0,0 +1,180 @@
+# app/core/metrics.py
+"""
+Prometheus 텍스트 형식(/metrics) 지표.
+- 요청: 라우트(경로 템플릿)별 지연 시간 히스토그램, 상태 코드별 요청 수 (MetricsMiddleware)
+- DB: SQLAlchemy 엔진 이벤트로 쿼리 종류(SELECT/INSERT/...)별 횟수와 실행 시간, 오류 수 (instrument_engine)
+- 캐시/커넥션 풀 현황은 /metrics 요청 시점의 값을 gauge로 내보낸다 (routers/metrics.py)
+prometheus_client 없이 동작하도록 필요한 만큼만 직접 구현했다.
+"""
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import event
+
+# 초 단위 버킷 (API 응답과 SQLite 쿼리 모두 ms~수 초 범위)
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Tuple[str, ...], values: Tuple, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(f'{extra[0]}="{extra[1]}"')
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _fmt(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    def __init__(self, name: str, doc: str, labelnames: Tuple[str, ...] = ()):
+        self.name = name
+        self.doc = doc
+        self.labelnames = labelnames
+        self._values: Dict[Tuple, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labelvalues, amount: float = 1):
+        with self._lock:
+            self._values[labelvalues] = self._values.get(labelvalues, 0) + amount
+
+    def collect(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        lines = [f"# HELP {self.name} {self.doc}", f"# TYPE {self.name} counter"]
+        lines += [f"{self.name}{_labels(self.labelnames, k)} {_fmt(v)}" for k, v in items]
+        return lines
+
+
+class Histogram:
+    def __init__(self, name: str, doc: str, labelnames: Tuple[str, ...] = (),
+                 buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.name = name
+        self.doc = doc
+        self.labelnames = labelnames
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+        self._values: Dict[Tuple, list] = {}  # 라벨 → [버킷별 개수..., 합계, 개수]
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labelvalues):
+        with self._lock:
+            state = self._values.get(labelvalues)
+            if state is None:
+                state = self._values[labelvalues] = [0] * len(self.buckets) + [0.0, 0]
+            for i, upper in enumerate(self.buckets):
+                if value <= upper:
+                    state[i] += 1
+                    break
+            state[-2] += value
+            state[-1] += 1
+
+    def collect(self) -> List[str]:
+        with self._lock:
+            items = sorted((k, list(v)) for k, v in self._values.items())
+        lines = [f"# HELP {self.name} {self.doc}", f"# TYPE {self.name} histogram"]
+        for labelvalues, state in items:
+            cumulative = 0
+            for upper, n in zip(self.buckets, state):
+                cumulative += n
+                le = ("le", _fmt(upper))
+                lines.append(f"{self.name}_bucket{_labels(self.labelnames, labelvalues, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, labelvalues)} {_fmt(state[-2])}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, labelvalues)} {state[-1]}")
+        return lines
+
+
+def gauge_lines(name: str, doc: str, samples: Iterable[Tuple[Dict[str, str], float]]) -> List[str]:
+    """ 수집 시점에 계산하는 gauge ({라벨: 값}, 값) 목록 → 텍스트 줄 """
+    lines = [f"# HELP {name} {doc}", f"# TYPE {name} gauge"]
+    for labels, value in samples:
+        lines.append(f"{name}{_labels(tuple(labels), tuple(labels.values()))} {_fmt(value)}")
+    return lines
+
+
+REQUEST_LATENCY = Histogram("http_request_duration_seconds", "HTTP 요청 처리 시간(초), 라우트별",
+                            ("method", "route"))
+REQUEST_COUNT = Counter("http_requests_total", "HTTP 요청 수, 라우트/상태 코드별", ("method", "route", "status"))
+DB_QUERY_LATENCY = Histogram("db_query_duration_seconds", "SQL 실행 시간(초), 엔진/쿼리 종류별",
+                             ("engine", "operation"))
+DB_QUERY_ERRORS = Counter("db_query_errors_total", "SQL 실행 오류 수", ("engine", "operation"))
+DB_READ_ROUTE = Counter("db_read_route_total", "public 조회를 실행한 DB (replica/primary)와 그 이유",
+                        ("target", "reason"))
+
+_REGISTRY = (REQUEST_LATENCY, REQUEST_COUNT, DB_QUERY_LATENCY, DB_QUERY_ERRORS, DB_READ_ROUTE)
+
+UNMATCHED_ROUTE = "<unmatched>"  # 404 등 라우트가 없는 요청 (경로를 그대로 쓰면 라벨 수가 끝없이 늘어남)
+
+
+class MetricsMiddleware:
+    """
+    ASGI 미들웨어: 응답 본문 전송이 끝날 때까지의 시간을 라우트 템플릿(/public/terms/{term_id}) 기준으로 기록.
+    StreamingResponse(/admin/terms/export)도 마지막 청크까지 포함된다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        started = time.perf_counter()
+        status = {"code": 500}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            path = getattr(route, "path", None) or UNMATCHED_ROUTE
+            method = scope.get("method", "")
+            REQUEST_LATENCY.observe(time.perf_counter() - started, method, path)
+            REQUEST_COUNT.inc(method, path, str(status["code"]))
+
+
+def _operation(statement: str) -> str:
+    words = statement.lstrip().split(None, 1)
+    return words[0].upper() if words else "OTHER"
+
+
+def instrument_engine(engine, name: str):
+    """ 동기 Engine(비동기 엔진은 .sync_engine)에 쿼리 시간/오류 수집 이벤트를 건다 """
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("metrics_query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get("metrics_query_start")
+        if starts:
+            DB_QUERY_LATENCY.observe(time.perf_counter() - starts.pop(), name, _operation(statement))
+
+    @event.listens_for(engine, "handle_error")
+    def _error(exception_context):
+        conn = exception_context.connection
+        starts = conn.info.get("metrics_query_start") if conn is not None else None
+        if starts:
+            starts.pop()
+        DB_QUERY_ERRORS.inc(name, _operation(exception_context.statement or ""))
+
+
+def render(extra: Iterable[List[str]] = ()) -> str:
+    lines: List[str] = []
+    for metric in _REGISTRY:
+        lines += metric.collect()
+    for block in extra:
+        lines += block
+    return "\n".join(lines) + "\n"
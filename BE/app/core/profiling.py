@@ -0,0 +1,217 @@
+# app/core/profiling.py
+"""
+관리자용 요청 단위 프로파일링.
+- 관리자 토큰과 함께 `X-Profile: 1` 헤더 또는 `?profile=1`을 붙인 요청만 프로파일링한다 (그 외 요청은 비용 없음).
+- 서비스 함수(term_service의 _run/_run_async로 실행되는 fn(db, ...))를 cProfile로 측정하고,
+  그 요청에서 실행된 SQL 문과 실행 시간을 엔진 이벤트로 모은다.
+- 프로파일링 요청은 조회 캐시(TTLCache)를 거치지 않는다 (캐시 적중이면 측정할 것이 없으므로).
+  리포트의 cache_bypass는 캐시 대신 DB에서 읽은 횟수
+- 결과는 최근 PROFILE_RING_SIZE개까지 메모리에 보관하고, 응답의 X-Profile-Id 헤더 값으로
+  GET /admin/profiles/{id} 에서 텍스트 리포트를 내려받는다.
+동시에 하나의 요청만 cProfile을 켠다 (프로파일러가 겹치면 결과가 섞이므로, 다른 요청은 SQL만 기록).
+"""
+import contextvars
+import cProfile
+import io
+import itertools
+import pstats
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, List, Optional
+from urllib.parse import parse_qs
+
+from fastapi import HTTPException
+from sqlalchemy import event
+
+from app.core.auth import require_admin
+from app.core.config import PROFILE_RING_SIZE, PROFILE_TOP_N
+
+PROFILE_HEADER = "x-profile"
+PROFILE_QUERY = "profile"
+SQL_TEXT_LIMIT = 500  # 리포트에 남길 SQL 문 길이
+
+
+class ProfileReport:
+    def __init__(self, report_id: int, method: str, path: str, query: str):
+        self.id = report_id
+        self.method = method
+        self.path = path
+        self.query = query
+        self.created_at = time.strftime("%Y-%m-%dT%H:%M:%S")
+        self.status: Optional[int] = None
+        self.wall_ms = 0.0
+        self.sql: List[tuple] = []  # (ms, statement, executemany)
+        self.profiled_calls: List[str] = []
+        self.skipped_calls: List[str] = []
+        self.cache_bypass = 0
+        self._stats: Optional[pstats.Stats] = None
+        self._lock = threading.Lock()
+
+    def add_profile(self, name: str, profiler: cProfile.Profile):
+        with self._lock:
+            self.profiled_calls.append(name)
+            if self._stats is None:
+                self._stats = pstats.Stats(profiler)
+            else:
+                self._stats.add(profiler)
+
+    def add_sql(self, ms: float, statement: str, executemany: bool):
+        with self._lock:
+            self.sql.append((ms, statement, executemany))
+
+    def summary(self) -> Dict:
+        return {
+            "id": self.id, "method": self.method, "path": self.path, "query": self.query,
+            "status": self.status, "wall_ms": round(self.wall_ms, 3), "created_at": self.created_at,
+            "sql_count": len(self.sql), "sql_ms": round(sum(ms for ms, _, _ in self.sql), 3),
+            "cache_bypass": self.cache_bypass,
+        }
+
+    def render(self, top_n: int = PROFILE_TOP_N) -> str:
+        target = self.path + (f"?{self.query}" if self.query else "")
+        out = io.StringIO()
+        out.write(f"# {self.method} {target}\n")
+        out.write(f"status={self.status} wall={self.wall_ms:.2f}ms created_at={self.created_at} "
+                  f"cache_bypass={self.cache_bypass}\n\n")
+        out.write(f"## SQL ({len(self.sql)}개, 합계 {sum(ms for ms, _, _ in self.sql):.2f}ms, 실행 순서)\n")
+        for ms, statement, executemany in self.sql:
+            text = " ".join(statement.split())[:SQL_TEXT_LIMIT]
+            out.write(f"{ms:9.3f}ms  {'[many] ' if executemany else ''}{text}\n")
+        out.write(f"\n## Python 프로파일 (cumulative 상위 {top_n})\n")
+        if self.profiled_calls:
+            out.write(f"측정한 서비스 함수: {', '.join(self.profiled_calls)}\n")
+        if self.skipped_calls:
+            out.write(f"다른 프로파일이 진행 중이라 SQL만 기록: {', '.join(self.skipped_calls)}\n")
+        if self._stats is None:
+            out.write("(측정된 서비스 함수 없음)\n")
+        else:
+            self._stats.stream = out
+            self._stats.sort_stats("cumulative").print_stats(top_n)
+        return out.getvalue()
+
+
+_current: contextvars.ContextVar[Optional[ProfileReport]] = contextvars.ContextVar("profile_report", default=None)
+_reports: "deque[ProfileReport]" = deque(maxlen=PROFILE_RING_SIZE)
+_reports_lock = threading.Lock()
+_ids = itertools.count(1)
+_profiler_lock = threading.Lock()  # cProfile은 한 번에 하나만
+
+
+def profiled(fn: Callable) -> Callable:
+    """ 프로파일링 중인 요청이면 fn을 cProfile로 감싸서 실행 (아니면 그대로 실행) """
+    def wrapper(*args, **kwargs):
+        report = _current.get()
+        if report is None:
+            return fn(*args, **kwargs)
+        name = getattr(fn, "__name__", repr(fn))
+        if not _profiler_lock.acquire(blocking=False):
+            report.skipped_calls.append(name)
+            return fn(*args, **kwargs)
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                profiler.disable()
+        finally:
+            _profiler_lock.release()
+            report.add_profile(name, profiler)
+    return wrapper
+
+
+def bypass_cache() -> bool:
+    """ TTLCache의 bypass 훅: 프로파일링 중인 요청이면 캐시를 건너뛰고 횟수를 리포트에 남긴다 """
+    report = _current.get()
+    if report is None:
+        return False
+    with report._lock:
+        report.cache_bypass += 1
+    return True
+
+
+def instrument_engine(engine):
+    """ 프로파일링 중인 요청의 SQL 문/실행 시간을 기록하는 엔진 이벤트 """
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        if _current.get() is not None:
+            conn.info.setdefault("profile_query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        report = _current.get()
+        starts = conn.info.get("profile_query_start")
+        if report is not None and starts:
+            report.add_sql((time.perf_counter() - starts.pop()) * 1000, statement, executemany)
+
+    @event.listens_for(engine, "handle_error")
+    def _error(exception_context):
+        conn = exception_context.connection
+        starts = conn.info.get("profile_query_start") if conn is not None else None
+        if _current.get() is not None and starts:
+            starts.pop()
+
+
+def get_report(report_id: int) -> Optional[ProfileReport]:
+    with _reports_lock:
+        return next((r for r in _reports if r.id == report_id), None)
+
+
+def list_reports() -> List[Dict]:
+    with _reports_lock:
+        return [r.summary() for r in reversed(_reports)]
+
+
+def _wants_profile(scope) -> bool:
+    for name, value in scope.get("headers") or ():
+        if name.decode("latin-1") == PROFILE_HEADER and value.decode("latin-1") not in ("", "0", "false"):
+            return True
+    query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+    return any(v not in ("", "0", "false") for v in query.get(PROFILE_QUERY, []))
+
+
+def _is_admin(scope) -> bool:
+    authorization = next((v.decode("latin-1") for k, v in scope.get("headers") or ()
+                          if k.decode("latin-1") == "authorization"), "")
+    try:
+        require_admin(authorization)
+        return True
+    except HTTPException:
+        return False
+
+
+class ProfilingMiddleware:
+    """
+    ASGI 미들웨어: 관리자 + 프로파일 플래그가 있는 요청만 리포트를 만들고 X-Profile-Id 헤더로 알려준다.
+    관리자 토큰이 없으면 플래그는 무시된다 (일반 요청과 똑같이 처리).
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not _wants_profile(scope) or not _is_admin(scope):
+            return await self.app(scope, receive, send)
+
+        report = ProfileReport(next(_ids), scope.get("method", ""), scope.get("path", ""),
+                               scope.get("query_string", b"").decode("latin-1"))
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                report.status = message["status"]
+                headers = list(message.get("headers") or [])
+                headers.append((b"x-profile-id", str(report.id).encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        token = _current.set(report)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            report.wall_ms = (time.perf_counter() - started) * 1000
+            _current.reset(token)
+            with _reports_lock:
+                _reports.append(report)
@@ -0,0 +1,60 @@
+# app/db/migrations.py
+from sqlalchemy import inspect, text, select, insert, delete, update, or_
+from sqlalchemy.engine import Engine
+from app.db.base import Base
+from app.model.articles import ARTICLES_VERSION, article_rows
+from app.model.summary_writer import backfill_keywords
+
+
+def add_missing_columns(engine: Engine):
+    """
+    create_all은 이미 있는 테이블에 새 컬럼을 추가하지 않으므로,
+    모델에는 있고 DB에는 없는 nullable 컬럼을 ALTER TABLE ADD COLUMN으로 보충한다.
+    (배치 스크립트가 먼저 만든 term.db 등 이전 스키마 호환용)
+    """
+    insp = inspect(engine)
+    existing_tables = set(insp.get_table_names())
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            existing = {c["name"] for c in insp.get_columns(table.name)}
+            for col in table.columns:
+                if col.name in existing or not col.nullable:
+                    continue
+                col_type = col.type.compile(dialect=engine.dialect)
+                conn.execute(text(f'ALTER TABLE {table.name} ADD COLUMN {col.name} {col_type}'))
+
+
+def backfill_term_keywords(engine: Engine):
+    """
+    기존 요약으로 term_keywords를 채운다 (add_missing_columns 다음에 호출).
+    요약 배치/워커와 같은 구현(summary_writer.backfill_keywords)을 raw sqlite3 커서로 호출한다.
+    """
+    raw = engine.raw_connection()
+    try:
+        backfill_keywords(raw.cursor())
+        raw.commit()
+    finally:
+        raw.close()
+
+
+def backfill_term_articles(engine: Engine, batch_size: int = 500):
+    """
+    articles_version이 없거나 현재 파서(ARTICLES_VERSION)보다 낮은 약관만 조 단위로 다시 나눈다.
+    조가 하나도 없는 약관도 버전을 기록하므로 다음 시작 때는 건너뛴다.
+    """
+    from app.models.term import Term
+    from app.models.term_article import TermArticle
+
+    with engine.begin() as conn:
+        stale_ids = conn.execute(select(Term.id).where(or_(
+            Term.articles_version.is_(None), Term.articles_version < ARTICLES_VERSION))).scalars().all()
+        for start in range(0, len(stale_ids), batch_size):
+            chunk = stale_ids[start:start + batch_size]
+            rows = conn.execute(select(Term.id, Term.content).where(Term.id.in_(chunk))).all()
+            conn.execute(delete(TermArticle).where(TermArticle.term_id.in_(chunk)))
+            values = [v for term_id, content in rows for v in article_rows(term_id, content)]
+            if values:
+                conn.execute(insert(TermArticle), values)
+            conn.execute(update(Term).where(Term.id.in_(chunk)).values(articles_version=ARTICLES_VERSION))
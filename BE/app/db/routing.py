@@ -0,0 +1,103 @@
+# app/db/routing.py
+"""
+public 조회(목록/상세/요약)의 읽기 복제본 라우팅. DATABASE_READ_URL이 없으면 항상 primary.
+- 관리자 요청: 라우터 dependency(read_primary)로 그 요청의 조회는 모두 primary에서
+- read-your-writes: 이 프로세스에서 쓴 약관(과 목록)은 READ_YOUR_WRITES_WINDOW초 동안 primary에서
+  (다른 프로세스의 쓰기, 예: 요약 배치는 복제 지연만큼 늦게 보일 수 있음)
+- 폴백: replica 조회가 DB 오류로 실패하면 primary로 다시 실행하고 REPLICA_RETRY_AFTER초 동안 replica를 쓰지 않는다
+로컬 테스트: API를 한 번 띄워 스키마를 맞춘 primary 파일을 복사해 DATABASE_READ_URL로 지정
+(스키마 보충/백필은 primary에만 하므로 이전 term.db를 그대로 복사하면 컬럼이 없어 폴백된다)
+"""
+import logging
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, Hashable, Optional
+
+from sqlalchemy.exc import DBAPIError, TimeoutError as PoolTimeoutError
+
+from app.core.config import DATABASE_READ_URL, READ_YOUR_WRITES_WINDOW, REPLICA_RETRY_AFTER
+from app.core.metrics import DB_READ_ROUTE
+
+logger = logging.getLogger(__name__)
+
+# replica에서 이 오류가 나면 primary로 다시 읽는다 (접속 실패, 테이블 없음, 풀 대기 초과 등)
+REPLICA_ERRORS = (DBAPIError, PoolTimeoutError)
+
+_LIST_KEY = "list"  # 약관이 하나라도 바뀌면 목록도 바뀐다
+
+_force_primary: ContextVar[bool] = ContextVar("read_primary", default=False)
+_lock = threading.Lock()
+_recent_writes: Dict[Hashable, float] = {}  # 키 → primary로 읽을 마감 시각 (monotonic)
+_down_until = 0.0
+_failures = 0
+
+
+async def read_primary():
+    """
+    라우터 dependency: 이 요청 안의 조회는 primary에서 (관리자 화면의 read-your-writes).
+    require_admin 같은 동기 dependency는 스레드풀에서 실행돼 ContextVar가 요청으로 전달되지 않으므로 async로 둔다.
+    요청이 끝나면 되돌린다 (in-process ASGITransport처럼 요청들이 같은 context를 공유해도 다음 요청에 새지 않도록)
+    """
+    token = _force_primary.set(True)
+    try:
+        yield
+    finally:
+        _force_primary.reset(token)
+
+
+def mark_written(term_id: Optional[int] = None):
+    """ 쓰기 직후 호출: 해당 약관과 목록을 잠시 primary에서 읽는다 """
+    if not DATABASE_READ_URL:
+        return
+    now = time.monotonic()
+    deadline = now + READ_YOUR_WRITES_WINDOW
+    with _lock:
+        for key in [k for k, until in _recent_writes.items() if until <= now]:
+            del _recent_writes[key]
+        _recent_writes[_LIST_KEY] = deadline
+        if term_id is not None:
+            _recent_writes[term_id] = deadline
+
+
+def use_replica(term_id: Optional[int] = None) -> bool:
+    """ 이번 조회를 replica에서 할지. term_id가 None이면 목록 조회 """
+    if not DATABASE_READ_URL:
+        return False
+    if _force_primary.get():
+        reason = "admin"
+    else:
+        now = time.monotonic()
+        with _lock:
+            if now < _down_until:
+                reason = "replica_down"
+            elif _recent_writes.get(_LIST_KEY if term_id is None else term_id, 0.0) > now:
+                reason = "recent_write"
+            else:
+                reason = None
+    if reason is None:
+        DB_READ_ROUTE.inc("replica", "ok")
+        return True
+    DB_READ_ROUTE.inc("primary", reason)
+    return False
+
+
+def replica_failed(exc: BaseException):
+    """ replica 조회 실패: 잠시 primary만 사용 (호출한 쪽이 primary로 다시 읽는다) """
+    global _down_until, _failures
+    with _lock:
+        _down_until = time.monotonic() + REPLICA_RETRY_AFTER
+        _failures += 1
+    DB_READ_ROUTE.inc("primary", "fallback")
+    logger.warning("read replica 조회 실패, %.0f초 동안 primary 사용: %s", REPLICA_RETRY_AFTER, exc)
+
+
+def stats() -> Dict[str, Any]:
+    now = time.monotonic()
+    with _lock:
+        return {
+            "enabled": bool(DATABASE_READ_URL),
+            "replica_down": now < _down_until,
+            "failures": _failures,
+            "recent_writes": sum(1 for until in _recent_writes.values() if until > now),
+        }
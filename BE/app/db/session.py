@@ -1,23 +1,198 @@
 # app/db/session.py
-from sqlalchemy import create_engine
+import threading
+import time
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.orm import sessionmaker
-from app.core.config import DATABASE_URL
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from app.core import profiling
+from app.core.metrics import instrument_engine
+from app.core.config import (
+    DATABASE_URL, DB_ASYNC, ASYNC_DATABASE_URL, DATABASE_READ_URL, ASYNC_DATABASE_READ_URL,
+    DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_TIMEOUT, DB_POOL_RECYCLE,
+    SQLITE_JOURNAL_MODE, SQLITE_BUSY_TIMEOUT_MS, SQLITE_SYNCHRONOUS, SQLITE_MMAP_SIZE, SQLITE_CACHE_SIZE,
+)
 
-is_sqlite = DATABASE_URL.startswith("sqlite")
+def _is_sqlite(url: str) -> bool:
+    return url.startswith("sqlite")
+
+
+def _is_memory(url: str) -> bool:
+    # sqlite:// , sqlite+aiosqlite:// (경로 없음), :memory:, file:...?mode=memory
+    return _is_sqlite(url) and (":memory:" in url or "mode=memory" in url or url.rstrip("/").endswith(":"))
+
+
+is_sqlite = _is_sqlite(DATABASE_URL)
+
+
+class _TimedPoolMixin:
+    """
+    커넥션을 얻기까지 기다린 시간과 타임아웃 횟수를 기록하는 풀.
+    대기(waits/wait_*)는 쉬는 커넥션도 overflow 여유도 없어 실제로 막힌 checkout만 센다 (전체는 checkouts)
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._wait_lock = threading.Lock()
+        self.checkouts = 0
+        self.wait_count = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.timeouts = 0
+
+    def _at_limit(self) -> bool:
+        return self.checkedin() == 0 and -1 < self._max_overflow <= self.overflow()
+
+    def _do_get(self):
+        blocked = self._at_limit()
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            with self._wait_lock:
+                self.timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - started
+            with self._wait_lock:
+                self.checkouts += 1
+                if blocked:
+                    self.wait_count += 1
+                    self.wait_total += waited
+                    self.wait_max = max(self.wait_max, waited)
+
+    def recreate(self):
+        # dispose() 등으로 다시 만들어져도 누적 통계가 이어지도록
+        new = super().recreate()
+        new.checkouts, new.wait_count, new.wait_total, new.wait_max, new.timeouts = (
+            self.checkouts, self.wait_count, self.wait_total, self.wait_max, self.timeouts)
+        return new
+
+    def stats(self) -> dict:
+        with self._wait_lock:
+            return {
+                "size": self.size(),
+                "checked_in": self.checkedin(),
+                "checked_out": self.checkedout(),
+                "overflow": max(0, self.overflow()),
+                "max_overflow": self._max_overflow,
+                "timeout": self.timeout(),
+                "checkouts": self.checkouts,
+                "waits": self.wait_count,
+                "wait_avg_ms": self.wait_total / self.wait_count * 1000 if self.wait_count else 0.0,
+                "wait_max_ms": self.wait_max * 1000,
+                "timeouts": self.timeouts,
+            }
+
+
+class TimedQueuePool(_TimedPoolMixin, QueuePool):
+    pass
+
+
+class TimedAsyncQueuePool(_TimedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def _engine_kwargs(poolclass, url: str = DATABASE_URL) -> dict:
+    kwargs = {}
+    if _is_sqlite(url):
+        # SQLite 전용 옵션
+        kwargs["connect_args"] = {"check_same_thread": False}
+    else:
+        # MySQL/Postgres 등에서만 연결 안정화 옵션 적용
+        kwargs["pool_pre_ping"] = True
+    if not _is_memory(url):
+        kwargs.update(
+            poolclass=poolclass,
+            pool_size=DB_POOL_SIZE,
+            max_overflow=DB_MAX_OVERFLOW,
+            pool_timeout=DB_POOL_TIMEOUT,
+            pool_recycle=DB_POOL_RECYCLE,
+        )
+    return kwargs
+
+
+def _sqlite_pragmas(url: str):
+    """ 새 SQLite 커넥션마다 PRAGMA를 적용하는 connect 리스너 (journal_mode=WAL은 DB 파일에 유지됨) """
+    memory = _is_memory(url)  # 엔진마다 자기 URL 기준 (replica가 파일이면 primary가 메모리여도 WAL)
+
+    def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+        cur = dbapi_connection.cursor()
+        try:
+            if SQLITE_JOURNAL_MODE and not memory:
+                cur.execute(f"PRAGMA journal_mode={SQLITE_JOURNAL_MODE}")
+            cur.execute(f"PRAGMA busy_timeout={int(SQLITE_BUSY_TIMEOUT_MS)}")
+            if SQLITE_SYNCHRONOUS:
+                cur.execute(f"PRAGMA synchronous={SQLITE_SYNCHRONOUS}")
+            cur.execute(f"PRAGMA mmap_size={int(SQLITE_MMAP_SIZE)}")
+            cur.execute(f"PRAGMA cache_size={int(SQLITE_CACHE_SIZE)}")
+        finally:
+            cur.close()
+    return _apply_sqlite_pragmas
 
-engine_kwargs = {}
-if is_sqlite:
-    # SQLite 전용 옵션
-    engine_kwargs["connect_args"] = {"check_same_thread": False}
-else:
-    # MySQL/Postgres 등에서만 연결 안정화 옵션 적용
-    engine_kwargs["pool_pre_ping"] = True
-    engine_kwargs["pool_recycle"] = 3600
 
 engine = create_engine(
     DATABASE_URL,
-    **engine_kwargs,
+    **_engine_kwargs(TimedQueuePool),
     future=True,  # 선택
 )
+if is_sqlite:
+    event.listen(engine, "connect", _sqlite_pragmas(DATABASE_URL))
+instrument_engine(engine, "sync")
+profiling.instrument_engine(engine)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# 비동기 엔진은 DB_ASYNC=1일 때만 만든다 (aiosqlite/asyncpg는 그때만 필요)
+async_engine = None
+AsyncSessionLocal = None
+if DB_ASYNC:
+    from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+    async_engine_kwargs = _engine_kwargs(TimedAsyncQueuePool)
+    async_engine_kwargs.pop("connect_args", None)
+    async_engine = create_async_engine(ASYNC_DATABASE_URL, **async_engine_kwargs)
+    if is_sqlite:
+        event.listen(async_engine.sync_engine, "connect", _sqlite_pragmas(ASYNC_DATABASE_URL))
+    instrument_engine(async_engine.sync_engine, "async")
+    profiling.instrument_engine(async_engine.sync_engine)
+    AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+# 읽기 복제본은 DATABASE_READ_URL이 있을 때만 만든다 (라우팅/폴백은 app.db.routing)
+# 세션 info["replica"]로 복제본 세션임을 표시한다 (시드 등 쓰기를 건너뛰도록)
+read_engine = None
+ReadSessionLocal = None
+async_read_engine = None
+AsyncReadSessionLocal = None
+if DATABASE_READ_URL:
+    read_engine = create_engine(DATABASE_READ_URL, **_engine_kwargs(TimedQueuePool, DATABASE_READ_URL), future=True)
+    if _is_sqlite(DATABASE_READ_URL):
+        event.listen(read_engine, "connect", _sqlite_pragmas(DATABASE_READ_URL))
+    instrument_engine(read_engine, "read")
+    profiling.instrument_engine(read_engine)
+    ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine, info={"replica": True})
+
+    if DB_ASYNC:
+        async_read_kwargs = _engine_kwargs(TimedAsyncQueuePool, DATABASE_READ_URL)
+        async_read_kwargs.pop("connect_args", None)
+        async_read_engine = create_async_engine(ASYNC_DATABASE_READ_URL, **async_read_kwargs)
+        if _is_sqlite(DATABASE_READ_URL):
+            event.listen(async_read_engine.sync_engine, "connect", _sqlite_pragmas(ASYNC_DATABASE_READ_URL))
+        instrument_engine(async_read_engine.sync_engine, "async_read")
+        profiling.instrument_engine(async_read_engine.sync_engine)
+        AsyncReadSessionLocal = async_sessionmaker(async_read_engine, autoflush=False, expire_on_commit=False,
+                                                   info={"replica": True})
+
+
+def pool_stats() -> dict:
+    """ 엔진별 커넥션 풀 현황 (모니터링용) """
+    out = {}
+    for name, eng in (("sync", engine), ("async", async_engine.sync_engine if async_engine else None),
+                      ("read", read_engine),
+                      ("async_read", async_read_engine.sync_engine if async_read_engine else None)):
+        if eng is None:
+            continue
+        pool = eng.pool
+        out[name] = pool.stats() if isinstance(pool, _TimedPoolMixin) else {"pool": type(pool).__name__}
+    return out
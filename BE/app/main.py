@@ -1,22 +1,72 @@
 # app/main.py
+import time
+_STARTED = time.perf_counter()  # API time-to-ready 측정 기준
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager, suppress
+
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi import FastAPI
+from app.core.config import LOG_LEVEL, METRICS_ENABLED, PROFILING_ENABLED, SUMMARY_JOB_WATCH_INTERVAL
+from app.core.metrics import MetricsMiddleware
+from app.core.profiling import ProfilingMiddleware
 from app.routers import public_terms
 from app.routers import admin_terms
+from app.routers import public_keywords
+from app.routers import metrics
+from app.routers import admin_profiles
 from app.db.base import Base
 from app.db.session import engine
+from app.db.migrations import add_missing_columns, backfill_term_keywords, backfill_term_articles
+from app.services import term_search, term_service
 
 from app.models import term as _term_model  # noqa: F401
 from app.models import term_summary as _term_summary_model  # noqa: F401
+from app.models import term_keyword as _term_keyword_model  # noqa: F401
+from app.models import summary_job as _summary_job_model  # noqa: F401
+from app.models import term_article as _term_article_model  # noqa: F401
+
+logging.basicConfig(format="%(asctime)s %(levelname)s %(name)s %(message)s")
+logging.getLogger("app").setLevel(LOG_LEVEL)
+# SQLAlchemy가 풀 클래스 모듈명(app.db.session.TimedQueuePool)으로 만드는 풀 로거는 LOG_LEVEL을 따르지 않게
+logging.getLogger("app.db.session").setLevel(logging.WARNING)
+logger = logging.getLogger("app.main")
+
+
+def init_schema():
+    """ 테이블 생성, 누락 컬럼 보충, 백필, FTS 인덱스 (import 시점이 아니라 서버 시작 시 한 번) """
+    Base.metadata.create_all(bind=engine)
+    add_missing_columns(engine)
+    backfill_term_keywords(engine)
+    backfill_term_articles(engine)
+    term_search.ensure_fts_index(engine)
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    started = time.perf_counter()
+    init_schema()
+    now = time.perf_counter()
+    logger.info("API ready: time-to-ready %.2fs (schema %.2fs)", now - _STARTED, now - started)
+    watcher = None
+    if SUMMARY_JOB_WATCH_INTERVAL > 0:
+        # 요약 워커가 저장한 요약을 캐시 TTL 전에 반영
+        watcher = asyncio.create_task(term_service.watch_summary_jobs(SUMMARY_JOB_WATCH_INTERVAL))
+    yield
+    if watcher is not None:
+        watcher.cancel()
+        with suppress(asyncio.CancelledError):
+            await watcher
+
 
 app = FastAPI(
     title="프로토타입 서버",
     description="사용자 가입 및 약관 요약 API",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
-Base.metadata.create_all(bind=engine)
-
 origins = [
     "http://localhost:8080",
     "http://localhost",
@@ -27,11 +77,21 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-After-Id", "X-Profile-Id"],  # keyset 다음 커서, 프로파일 리포트 id
 )
+if PROFILING_ENABLED:
+    app.add_middleware(ProfilingMiddleware)
+if METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)  # 가장 바깥에서 CORS 처리 시간까지 포함해 측정
 
 # 라우터 포함
 app.include_router(public_terms.router)
 app.include_router(admin_terms.router)
+app.include_router(public_keywords.router)
+if METRICS_ENABLED:
+    app.include_router(metrics.router)
+if PROFILING_ENABLED:
+    app.include_router(admin_profiles.router)
 
 @app.get("/")
 def read_root():
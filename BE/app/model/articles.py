@@ -0,0 +1,105 @@
+# app/model/articles.py
+"""
+약관 본문을 조(제N조, 제N조의M) 단위로 나눈다. API(term_articles 테이블)와 요약 배치가 같이 쓴다.
+- 조 제목 줄: 줄 맨 앞의 "제 5 조 (목적)", "제5조의2(정의)", "제5조 [ 목적 ]", "제5조【목적】",
+  "제1 조  약관의 적용"(두 칸 이상 띄운 40자 이하 제목만 있는 줄) 또는 "제5조"만 있는 줄
+  ("제3조에 따라", "제7조(이용제한)에"처럼 줄바꿈으로 줄 앞에 온 본문 인용은 제외)
+- 조 번호는 증가해야 한다. 앞 번호보다 작거나 같으면 본문 인용으로 보고 건너뛴다
+- 장/절 제목("제 2 장 ...")과 부칙 줄은 앞 조의 끝. 부칙부터는 번호가 다시 1부터라 조로 나누지 않는다
+오프셋은 UTF-8 byte 기준 [start, end) (앞뒤 공백 제외).
+"""
+import re
+from typing import NamedTuple
+
+ARTICLE_RE = re.compile(
+    r"^[ \t]*(제[ \t]*(\d+)[ \t]*조(?:[ \t]*의[ \t]*(\d+))?)"
+    r"(?:[ \t]*\(([^)\n]*)\)(?![가-힣])"                       # 제5조(목적)
+    r"|[ \t]*\[([^\]\n]*)\]"                                   # 제5조 [ 목적 ]
+    r"|[ \t]*【([^】\n]*)】"                                    # 제5조【목적】
+    r"|[ \t]{2,}([^\s.(\[【][^\n.]{0,39}?)[ \t]*(?=\r?\n|\Z)"   # 제1 조  약관의 적용
+    r"|[ \t]*(?=\r?\n|\Z))",                                   # 제5조
+    re.M)
+SECTION_RE = re.compile(r"^[ \t]*제[ \t]*\d+[ \t]*[편장절관](?![가-힣])", re.M)
+ADDENDA_RE = re.compile(r"^[ \t]*부[ \t]*칙", re.M)
+
+HEADING_MAX_CHARS = 200
+# 조 나누기 규칙을 바꾸면 올린다. terms.articles_version이 이보다 낮은 약관만 API 시작 시 다시 나눈다
+ARTICLES_VERSION = 2
+
+
+class Article(NamedTuple):
+    no: int
+    sub: int       # 제5조의2 → 2, 없으면 0
+    heading: str   # 괄호 안 제목 (없으면 "")
+    start: int     # UTF-8 byte 오프셋
+    end: int
+
+    @property
+    def label(self) -> str:
+        return f"제{self.no}조" + (f"의{self.sub}" if self.sub else "")
+
+
+def _byte_offsets(content: str, positions: list[int]) -> list[int]:
+    """ 문자 위치 목록(오름차순) → UTF-8 byte 위치 """
+    out, prev_char, prev_byte = [], 0, 0
+    for pos in positions:
+        prev_byte += len(content[prev_char:pos].encode("utf-8"))
+        prev_char = pos
+        out.append(prev_byte)
+    return out
+
+
+def split_articles(content: str) -> list[Article]:
+    if not content:
+        return []
+    addenda = ADDENDA_RE.search(content)
+    body_end = addenda.start() if addenda else len(content)
+
+    found, last = [], (0, 0)
+    for m in ARTICLE_RE.finditer(content, 0, body_end):
+        key = (int(m.group(2)), int(m.group(3) or 0))
+        if key <= last:
+            continue
+        last = key
+        heading = next((g for g in m.group(4, 5, 6, 7) if g is not None), "")
+        found.append((m.start(1), key, " ".join(heading.split())[:HEADING_MAX_CHARS]))
+    if not found:
+        return []
+
+    # 조의 끝 = 다음 조/장/절 제목 또는 부칙 시작
+    boundaries = sorted({start for start, _, _ in found}
+                        | {m.start() for m in SECTION_RE.finditer(content, 0, body_end)} | {body_end})
+    spans = []
+    for start, key, heading in found:
+        end = next(b for b in boundaries if b > start)
+        while end > start and content[end - 1].isspace():
+            end -= 1
+        spans.append((start, end, key, heading))
+
+    offsets = _byte_offsets(content, sorted(p for s, e, _, _ in spans for p in (s, e)))
+    it = iter(offsets)
+    return [Article(no, sub, heading, next(it), next(it)) for _, _, (no, sub), heading in spans]
+
+
+def article_text(content: str, article: Article) -> str:
+    return content.encode("utf-8")[article.start:article.end].decode("utf-8")
+
+
+def article_rows(term_id: int, content: str) -> list[dict]:
+    """ 본문 → term_articles 테이블 행 목록 """
+    return [
+        {"term_id": term_id, "seq": seq, "article_no": a.no, "article_sub": a.sub, "heading": a.heading,
+         "start_byte": a.start, "end_byte": a.end}
+        for seq, a in enumerate(split_articles(content or ""))
+    ]
+
+
+def split_segments(content: str) -> list[str]:
+    """
+    본문 전체를 조 시작 위치에서 자른 조각 목록 (조 앞 머리말, 부칙 포함 전부).
+    요약 배치의 문장 분리에 사용: 조 제목이 앞 조의 마지막 문장에 붙지 않고, kss 입력도 짧아진다.
+    """
+    data = content.encode("utf-8")
+    cuts = [0] + [a.start for a in split_articles(content)] + [len(data)]
+    segments = [data[a:b].decode("utf-8").strip() for a, b in zip(cuts, cuts[1:])]
+    return [s for s in segments if s]
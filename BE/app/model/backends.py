@@ -0,0 +1,141 @@
+# app/model/backends.py
+"""
+BERTClassifier CPU 추론 백엔드.
+- eager: 기존 fp32 PyTorch
+- int8: nn.Linear 동적 양자화 (torch.ao.quantization.quantize_dynamic)
+- torchscript: torch.jit.trace로 내보낸 그래프 (.ts)
+- onnx: ONNX Runtime (.onnx, onnxruntime 설치 필요)
+
+모든 백엔드는 model(input_ids=..., attention_mask=..., token_type_ids=...) -> logits 형태로 호출된다.
+torch는 실제로 모델을 다룰 때 import 한다 (--help 등에서 torch 로딩을 피하려고).
+"""
+from __future__ import annotations
+
+import os
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import torch.nn as nn
+
+BACKENDS = ("eager", "int8", "torchscript", "onnx")
+EXPORTABLE = ("torchscript", "onnx")
+EXPORT_SUFFIX = {"torchscript": ".ts", "onnx": ".onnx"}
+
+
+def default_export_path(model_path: str, backend: str) -> str:
+    return os.path.splitext(model_path)[0] + EXPORT_SUFFIX[backend]
+
+
+def _example_inputs(tokenizer, device) -> tuple:
+    import torch
+    enc = tokenizer(["제1조(목적) 이 약관은 서비스 이용 조건을 정합니다.", "제2조(정의)"],
+                    padding=True, truncation=True, max_length=128, return_tensors="pt").to(device)
+    token_type_ids = enc.get("token_type_ids")
+    if token_type_ids is None:
+        token_type_ids = torch.zeros_like(enc["input_ids"])
+    return enc["input_ids"], enc["attention_mask"], token_type_ids
+
+
+def export_model(model: nn.Module, tokenizer, backend: str, export_path: str, device=None) -> str:
+    """ fp32 모델을 TorchScript(.ts) 또는 ONNX(.onnx)로 한 번 내보낸다 """
+    import torch
+
+    device = device or torch.device("cpu")
+    model.eval()
+    example = _example_inputs(tokenizer, device)
+    with torch.no_grad():
+        if backend == "torchscript":
+            traced = torch.jit.trace(model, example, strict=False)
+            traced = torch.jit.freeze(traced)
+            traced.save(export_path)
+        elif backend == "onnx":
+            torch.onnx.export(
+                model, example, export_path,
+                input_names=["input_ids", "attention_mask", "token_type_ids"],
+                output_names=["logits"],
+                dynamic_axes={
+                    "input_ids": {0: "batch", 1: "seq"},
+                    "attention_mask": {0: "batch", 1: "seq"},
+                    "token_type_ids": {0: "batch", 1: "seq"},
+                    "logits": {0: "batch"},
+                },
+                opset_version=17,
+            )
+        else:
+            raise ValueError(f"내보낼 수 없는 백엔드: {backend} (가능: {', '.join(EXPORTABLE)})")
+    return export_path
+
+
+class _TorchScriptModel:
+    def __init__(self, path: str, device):
+        import torch
+
+        self.module = torch.jit.load(path, map_location=device)
+        self.module.eval()
+
+    def __call__(self, input_ids, attention_mask, token_type_ids=None):
+        import torch
+
+        if token_type_ids is None:
+            token_type_ids = torch.zeros_like(input_ids)
+        return self.module(input_ids, attention_mask, token_type_ids)
+
+
+class _OnnxModel:
+    def __init__(self, path: str, num_threads: int | None = None):
+        import onnxruntime as ort  # 선택 의존성: onnx 백엔드를 쓸 때만 필요
+
+        opts = ort.SessionOptions()
+        if num_threads:
+            opts.intra_op_num_threads = num_threads
+        self.session = ort.InferenceSession(path, opts, providers=["CPUExecutionProvider"])
+
+    def __call__(self, input_ids, attention_mask, token_type_ids=None):
+        import torch
+
+        if token_type_ids is None:
+            token_type_ids = torch.zeros_like(input_ids)
+        feeds = {
+            "input_ids": input_ids.cpu().numpy(),
+            "attention_mask": attention_mask.cpu().numpy(),
+            "token_type_ids": token_type_ids.cpu().numpy(),
+        }
+        return torch.from_numpy(self.session.run(["logits"], feeds)[0])
+
+
+def prepare_backend(model: nn.Module, backend: str, device, export_path: str | None = None):
+    """
+    로드된 fp32 모델을 선택한 백엔드로 감싸서 반환한다.
+    torchscript/onnx는 export_model로 미리 내보낸 파일(export_path)이 있어야 한다.
+    """
+    import torch
+    import torch.nn as nn
+
+    if backend == "eager":
+        return model
+    if torch.device(device).type != "cpu":
+        raise ValueError(f"{backend} 백엔드는 CPU 전용입니다.")
+    if backend == "int8":
+        return torch.ao.quantization.quantize_dynamic(model, {nn.Linear}, dtype=torch.qint8).eval()
+    if backend in EXPORTABLE:
+        if not export_path or not os.path.exists(export_path):
+            raise FileNotFoundError(f"{backend} 파일이 없습니다: {export_path} (--export-backend {backend} 먼저 실행)")
+        if backend == "torchscript":
+            return _TorchScriptModel(export_path, device)
+        return _OnnxModel(export_path, num_threads=torch.get_num_threads())
+    raise ValueError(f"알 수 없는 백엔드: {backend} (가능: {', '.join(BACKENDS)})")
+
+
+class TimedModel:
+    """ forward 호출마다 걸린 시간을 기록하는 래퍼 (백엔드 비교용) """
+
+    def __init__(self, model):
+        self.model = model
+        self.latencies: list[float] = []
+
+    def __call__(self, **inputs):
+        started = time.perf_counter()
+        out = self.model(**inputs)
+        self.latencies.append(time.perf_counter() - started)
+        return out
@@ -0,0 +1,308 @@
+# app/model/bench.py
+"""
+요약 파이프라인 단계별 벤치마크.
+합성 약관(제N조 ...)을 만들어 각 단계를 따로 측정하고, 결과를 JSON으로 저장한다.
+  split     split_term_sentences (조 단위로 자른 뒤 kss, 요약 배치와 같은 문장 분리)
+  tokenize  KoBERTTokenizer (약관 1건의 문장 전체)
+  forward   BERTClassifier forward (약관 1건 = 1배치)
+  keywords  extract_keywords (--analyzer, 기본 okt)
+  gpt       generate_gpt_summary (가짜 클라이언트, 네트워크 없음)
+  save      save_summary_to_db (임시 DB)
+
+--long-doc N: 조항 N개짜리 아주 긴 약관 1건으로 핵심 문장 추출의 최대 메모리(peak RSS)를 비교한다.
+  one_shot  문장 전체를 패딩된 배치 하나로 추론 (개선 전 extract_key_sentences)
+  bounded   window개씩 토크나이즈 + max_tokens 미니배치 + top-N 힙 (현재 extract_key_sentences)
+  각 방식은 별도 프로세스에서 돌려 peak RSS가 섞이지 않게 한다.
+
+사용 예)
+    python bench.py --docs 50 --articles 20 --out bench_before.json
+    python bench.py --docs 50 --articles 20 --out bench_after.json --baseline bench_before.json
+    python bench.py --long-doc 800 --max-tokens 4096 --score-window 512
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+
+# `python bench.py`로 직접 실행해도 app 패키지를 import 할 수 있도록 BE 경로 추가
+BE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if BE_DIR not in sys.path:
+    sys.path.insert(0, BE_DIR)
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+_HEADINGS = ["목적", "용어의 정의", "약관의 효력 및 변경", "계약의 성립", "서비스의 제공", "이용료 및 수수료",
+             "개인정보의 보호", "회원의 의무", "회사의 의무", "계약의 해지", "손해배상", "면책", "분쟁의 해결", "관할법원"]
+_SUBJECTS = ["회사는", "회원은", "고객은", "이용자는", "은행은", "카드사는", "본인은"]
+_OBJECTS = ["개인정보를", "서비스 이용료를", "전자금융거래 내역을", "계좌 정보를", "수수료를", "약관의 내용을",
+            "이용 계약을", "거래 내역을", "고유식별정보를", "연체이자를"]
+_CONDITIONS = ["관련 법령에 따라", "고객의 동의를 받아", "사전 통지 후", "부득이한 사유가 있는 경우", "영업일 기준 3일 이내에",
+               "전자적 방법으로", "회사가 정한 절차에 따라"]
+_PREDICATES = ["처리합니다.", "고지하여야 합니다.", "제3자에게 제공하지 않습니다.", "지체 없이 통지합니다.",
+               "변경할 수 있습니다.", "책임을 지지 않습니다.", "30일 전까지 공지합니다.", "청구할 수 있습니다."]
+_CIRCLED = "①②③④⑤⑥⑦⑧⑨⑩"
+
+
+def make_synthetic_term(articles: int = 15, sentences_per_article: int = 4, rng: random.Random | None = None) -> str:
+    """ '제N조(제목)' 조항 articles개, 조항마다 ①②… 문장 sentences_per_article개인 합성 약관 """
+    rng = rng or random.Random()
+    lines = []
+    for n in range(1, articles + 1):
+        lines.append(f"제{n}조({rng.choice(_HEADINGS)})")
+        for k in range(sentences_per_article):
+            mark = _CIRCLED[k] if k < len(_CIRCLED) else f"({k + 1})"
+            lines.append(f"{mark} {rng.choice(_SUBJECTS)} {rng.choice(_CONDITIONS)} "
+                         f"{rng.choice(_OBJECTS)} {rng.choice(_PREDICATES)}")
+    return "\n".join(lines)
+
+
+def make_synthetic_terms(docs: int, articles: int = 15, sentences_per_article: int = 4, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    return [make_synthetic_term(articles, sentences_per_article, rng) for _ in range(docs)]
+
+
+def peak_rss_mb() -> float | None:
+    """ 현재 프로세스의 최대 RSS(MB). 프로세스 시작 이후 누적 최대값이다. """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 byte 단위
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _percentile(sorted_values: list[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    idx = min(len(sorted_values) - 1, int(round(q * (len(sorted_values) - 1))))
+    return sorted_values[idx]
+
+
+def measure(fn, items: list, units=None) -> tuple[dict, list]:
+    """
+    items 각각에 fn을 호출해 호출당 지연(p50/p95)과 처리량을 잰다.
+    units(item)이 주어지면 처리량을 그 단위(예: 문장 수)로 계산한다.
+    """
+    latencies, outputs, n_units = [], [], 0
+    started = time.perf_counter()
+    for item in items:
+        t0 = time.perf_counter()
+        outputs.append(fn(item))
+        latencies.append(time.perf_counter() - t0)
+        n_units += units(item) if units else 1
+    total = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "calls": len(items),
+        "units": n_units,
+        "p50_ms": _percentile(latencies, 0.50) * 1000,
+        "p95_ms": _percentile(latencies, 0.95) * 1000,
+        "mean_ms": (sum(latencies) / len(latencies) * 1000) if latencies else 0.0,
+        "throughput_per_sec": n_units / total if total else 0.0,
+        "peak_rss_mb": peak_rss_mb(),
+    }, outputs
+
+
+def run_benchmark(texts: list[str], model, tokenizer, device, tagger, gpt_client, db_path: str) -> dict:
+    import torch
+    from app.model.finance_sum import (
+        MAX_SEQ_LEN, extract_keywords, generate_gpt_summary, save_summary_to_db, split_term_sentences,
+    )
+
+    stages: dict[str, dict] = {}
+
+    stages["split"], split_docs = measure(split_term_sentences, texts)
+    stages["split"]["unit"] = "docs"
+
+    def tokenize(sentences):
+        return tokenizer(sentences, padding=True, truncation=True, return_tensors="pt", max_length=MAX_SEQ_LEN)
+    stages["tokenize"], encoded = measure(tokenize, split_docs, units=len)
+    stages["tokenize"]["unit"] = "sentences"
+
+    def forward(inputs):
+        with torch.no_grad():
+            probs = torch.softmax(model(**inputs.to(device)), dim=1)[:, 1].cpu()
+        return probs
+    stages["forward"], probs = measure(forward, encoded, units=lambda inputs: inputs["input_ids"].shape[0])
+    stages["forward"]["unit"] = "sentences"
+
+    key_sentences = [[sentences[i] for i in p.argsort(descending=True)[:3].tolist()]
+                     for sentences, p in zip(split_docs, probs)]
+    stages["keywords"], raw_keywords = measure(lambda ks: extract_keywords(ks, tagger), key_sentences)
+    stages["keywords"]["unit"] = "docs"
+
+    stages["gpt"], summaries = measure(lambda job: generate_gpt_summary(job[0], job[1], gpt_client),
+                                       list(zip(key_sentences, raw_keywords)))
+    stages["gpt"]["unit"] = "docs"
+
+    def save(job):
+        term_id, (summary, keywords) = job
+        save_summary_to_db(db_path, term_id, summary, keywords)
+    stages["save"], _ = measure(save, list(enumerate(summaries, start=1)))
+    stages["save"]["unit"] = "docs"
+    return stages
+
+
+def _long_doc_child(mode: str, cfg: dict, result_q):
+    """ spawn 자식 프로세스: 모델 로드 후 한 가지 방식만 실행하고 peak RSS 증가분을 보고 """
+    import torch
+    from app.model.finance_sum import (
+        extract_key_sentences, load_summarization_model, one_shot_key_sentences, split_term_sentences,
+    )
+
+    try:
+        device = torch.device("cpu")
+        loader = cfg.get("loader")
+        if loader is not None:
+            tokenizer, model = loader()
+        else:
+            tokenizer, model = load_summarization_model(cfg["model_path"], device, backend=cfg["backend"])
+        text = make_synthetic_term(cfg["articles"], cfg["sentences_per_article"], random.Random(cfg["seed"]))
+        sentences = split_term_sentences(text)  # bounded(extract_key_sentences)와 같은 문장 집합
+        rss_before = peak_rss_mb()
+
+        started = time.perf_counter()
+        if mode == "one_shot":
+            selected = one_shot_key_sentences(sentences, model, tokenizer, device)
+        else:
+            selected = extract_key_sentences(text, model, tokenizer, device, batch_size=cfg["batch_size"],
+                                             max_tokens=cfg["max_tokens"], window=cfg["window"])
+        seconds = time.perf_counter() - started
+        rss_after = peak_rss_mb()
+        result_q.put({
+            "mode": mode, "ok": True, "sentences": len(sentences), "seconds": seconds, "selected": selected,
+            "peak_rss_mb": rss_after,
+            "scoring_rss_mb": (rss_after - rss_before) if rss_before is not None else None,
+        })
+    except Exception as e:  # OOM 등도 결과로 남긴다
+        result_q.put({"mode": mode, "ok": False, "error": f"{type(e).__name__}: {e}"})
+
+
+def run_long_document(cfg: dict, modes=("one_shot", "bounded")) -> dict:
+    """ 방식별로 새 프로세스를 띄워 아주 긴 약관 1건의 핵심 문장 추출 peak RSS/시간을 잰다 """
+    import multiprocessing as mp
+
+    ctx = mp.get_context("spawn")
+    results = {}
+    for mode in modes:
+        q = ctx.Queue()
+        proc = ctx.Process(target=_long_doc_child, args=(mode, cfg, q))
+        proc.start()
+        proc.join()
+        results[mode] = q.get() if not q.empty() else {"mode": mode, "ok": False,
+                                                        "error": f"프로세스 종료 코드 {proc.exitcode} (OOM 가능)"}
+    if all(results.get(m, {}).get("ok") for m in modes) and len(modes) > 1:
+        first = results[modes[0]]["selected"]
+        results["same_selection"] = all(results[m]["selected"] == first for m in modes[1:])
+    return results
+
+
+def diff_against(baseline: dict, current: dict) -> list[str]:
+    """ 기준 결과 대비 단계별 p50/p95/처리량 변화율 """
+    lines = []
+    for name, cur in current["stages"].items():
+        base = baseline.get("stages", {}).get(name)
+        if not base:
+            lines.append(f"{name:>9}: (기준 없음)")
+            continue
+
+        def pct(key):
+            return (cur[key] - base[key]) / base[key] * 100 if base[key] else 0.0
+        lines.append(f"{name:>9}: p50 {base['p50_ms']:.2f} → {cur['p50_ms']:.2f}ms ({pct('p50_ms'):+.1f}%), "
+                     f"p95 {base['p95_ms']:.2f} → {cur['p95_ms']:.2f}ms ({pct('p95_ms'):+.1f}%), "
+                     f"처리량 {pct('throughput_per_sec'):+.1f}%")
+    return lines
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="약관 요약 파이프라인 단계별 벤치마크")
+    parser.add_argument("--docs", type=int, default=20, help="합성 약관 수")
+    parser.add_argument("--articles", type=int, default=15, help="약관당 조항(제N조) 수")
+    parser.add_argument("--sentences", type=int, default=4, help="조항당 문장 수")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--backend", default="eager", help="KoBERT 추론 백엔드 (finance_sum.py --backend와 동일)")
+    parser.add_argument("--analyzer", default="okt", help="키워드 추출 형태소 분석기 (okt/kiwi/mecab)")
+    parser.add_argument("--gpt-latency", type=float, default=0.0, help="가짜 GPT 클라이언트 응답 지연(초)")
+    parser.add_argument("--out", default="bench_result.json", help="결과 JSON 경로")
+    parser.add_argument("--baseline", default=None, help="비교할 이전 결과 JSON")
+    parser.add_argument("--long-doc", type=int, default=None, metavar="N",
+                        help="조항 N개짜리 긴 약관 1건으로 핵심 문장 추출 peak RSS만 비교하고 종료")
+    parser.add_argument("--batch-size", type=int, default=None, help="--long-doc: 미니배치 문장 수")
+    parser.add_argument("--max-tokens", type=int, default=None, help="--long-doc: 미니배치 토큰 상한")
+    parser.add_argument("--score-window", type=int, default=None, help="--long-doc: 한 번에 토크나이즈하는 문장 수")
+    args = parser.parse_args()
+
+    import torch
+    from app.model.fake_openai import MockChatClient
+    from app.model.finance_sum import load_summarization_model
+    from app.model.morph import make_analyzer
+
+    logging.getLogger().setLevel(logging.WARNING)
+    SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+    MODEL_PATH = os.path.join(SCRIPT_DIR, "kobert_summarization_model.pth")
+    device = torch.device("cpu")
+
+    if args.long_doc:
+        from app.model.finance_sum import DEFAULT_BATCH_SIZE, DEFAULT_MAX_TOKENS, DEFAULT_SCORE_WINDOW
+        cfg = {
+            "model_path": MODEL_PATH, "backend": args.backend, "seed": args.seed,
+            "articles": args.long_doc, "sentences_per_article": args.sentences,
+            "batch_size": args.batch_size or DEFAULT_BATCH_SIZE, "max_tokens": args.max_tokens or DEFAULT_MAX_TOKENS,
+            "window": args.score_window or DEFAULT_SCORE_WINDOW,
+        }
+        report = run_long_document(cfg)
+        for mode in ("one_shot", "bounded"):
+            r = report[mode]
+            if r["ok"]:
+                print(f"{mode:>9}: 문장 {r['sentences']}개, {r['seconds']:.1f}s, "
+                      f"peak RSS {r['peak_rss_mb']:.0f}MB (추론 중 증가 {r['scoring_rss_mb']:.0f}MB)")
+            else:
+                print(f"{mode:>9}: 실패 - {r['error']}")
+        if "same_selection" in report:
+            print(f"선택된 핵심 문장 동일: {report['same_selection']}")
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump({"meta": {**{k: v for k, v in cfg.items() if k != "model_path"},
+                                "created_at": time.strftime("%Y-%m-%dT%H:%M:%S")},
+                       "long_doc": report}, f, ensure_ascii=False, indent=2)
+        print(f"결과 저장: {args.out}")
+        sys.exit(0)
+
+    texts = make_synthetic_terms(args.docs, args.articles, args.sentences, args.seed)
+    tokenizer, model = load_summarization_model(MODEL_PATH, device, backend=args.backend)
+    tagger = make_analyzer(args.analyzer)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        stages = run_benchmark(texts, model, tokenizer, device, tagger, MockChatClient(args.gpt_latency),
+                               os.path.join(tmp, "bench.db"))
+
+    result = {
+        "meta": {
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "docs": args.docs, "articles": args.articles, "sentences_per_article": args.sentences,
+            "seed": args.seed, "backend": args.backend, "analyzer": args.analyzer, "gpt_latency": args.gpt_latency,
+            "torch": torch.__version__, "torch_threads": torch.get_num_threads(),
+            "python": platform.python_version(), "machine": platform.machine(),
+        },
+        "stages": stages,
+    }
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+
+    for name, st in stages.items():
+        print(f"{name:>9}: p50 {st['p50_ms']:.2f}ms, p95 {st['p95_ms']:.2f}ms, "
+              f"{st['throughput_per_sec']:.1f} {st['unit']}/s, peak RSS {st['peak_rss_mb'] or 0:.0f}MB")
+    print(f"결과 저장: {args.out}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        print(f"--- 기준({args.baseline}) 대비 ---")
+        for line in diff_against(baseline, result):
+            print(line)
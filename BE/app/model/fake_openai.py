@@ -0,0 +1,161 @@
+# app/model/fake_openai.py
+"""
+로컬 개발/테스트용 OpenAI 호환 가짜 서버.
+POST /v1/chat/completions 요청에 지연(latency)을 넣어 응답하고, 일정 확률로 429/500을 돌려준다.
+script를 주면 처음 요청들은 그 순서대로 응답한다 (재시도 테스트용). 항목은 상태 코드, (상태 코드, Retry-After초),
+또는 "timeout"(timeout_delay초 기다렸다가 응답 없이 끊음). 다 쓰면 평소처럼 응답한다.
+응답 내용은 프롬프트의 '핵심 문장'과 '초벌 키워드'를 그대로 JSON으로 돌려주는 수준.
+
+사용 예)
+    python fake_openai.py --port 8089 --latency 0.5 --error-rate 0.1
+    python finance_sum.py --gpt-base-url http://127.0.0.1:8089/v1
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from types import SimpleNamespace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterable
+
+
+def fake_completion(prompt: str) -> dict:
+    sentences, keywords, section = [], [], None
+    for line in prompt.splitlines():
+        if line.startswith("## 핵심 문장"):
+            section = "sentences"
+        elif line.startswith("## 초벌 키워드"):
+            section = "keywords"
+        elif line.startswith("#"):
+            section = None
+        elif section == "sentences" and line.startswith("- "):
+            sentences.append(line[2:].strip())
+        elif section == "keywords" and line.strip():
+            keywords.extend(k.strip() for k in line.split(",") if k.strip())
+    content = json.dumps({"refined_keywords": keywords, "summary_text": " ".join(sentences)}, ensure_ascii=False)
+    return {
+        "id": "chatcmpl-fake",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": "fake-gpt",
+        "choices": [{
+            "index": 0,
+            "message": {"role": "assistant", "content": content},
+            "finish_reason": "stop",
+        }],
+        "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+    }
+
+
+class MockChatClient:
+    """ HTTP 없이 같은 프로세스 안에서 응답하는 OpenAI 클라이언트 대용 (벤치마크용) """
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.requests = 0
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    def _create(self, messages: list[dict], **kwargs):
+        self.requests += 1
+        if self.latency:
+            time.sleep(self.latency)
+        content = fake_completion("".join(m.get("content", "") for m in messages))["choices"][0]["message"]["content"]
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+class FakeOpenAIServer:
+    """ 백그라운드 스레드에서 도는 가짜 chat.completions 서버 """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0,
+                 latency: float = 0.2, jitter: float = 0.0, error_rate: float = 0.0,
+                 script: Iterable | None = None, timeout_delay: float = 2.0):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.script = list(script or [])
+        self.timeout_delay = timeout_delay
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):  # 요청마다 stderr 출력하지 않음
+                pass
+
+            def _send(self, status: int, body: dict, retry_after: float | None = None):
+                data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+                self.send_response(status)
+                if retry_after is not None:
+                    self.send_header("Retry-After", str(retry_after))
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                payload = json.loads(self.rfile.read(length) or b"{}")
+                with server._lock:
+                    server.requests += 1
+                    scripted = server.script.pop(0) if server.script else None
+
+                time.sleep(max(0.0, server.latency + random.uniform(-server.jitter, server.jitter)))
+                if not self.path.rstrip("/").endswith("/chat/completions"):
+                    return self._send(404, {"error": {"message": "not found"}})
+                if scripted == "timeout":
+                    time.sleep(server.timeout_delay)  # 클라이언트는 이미 포기했으므로 응답하지 않는다
+                    return
+                if scripted is not None:
+                    status, retry_after = scripted if isinstance(scripted, tuple) else (scripted, None)
+                    return self._send(status, {"error": {"message": "scripted error", "code": status}}, retry_after)
+                if random.random() < server.error_rate:
+                    status = random.choice((429, 500))
+                    return self._send(status, {"error": {"message": "injected error", "code": status}})
+
+                prompt = "".join(m.get("content", "") for m in payload.get("messages", []))
+                self._send(200, fake_completion(prompt))
+
+        return Handler
+
+    def start(self) -> "FakeOpenAIServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="OpenAI 호환 가짜 chat.completions 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--latency", type=float, default=0.5, help="응답 지연(초)")
+    parser.add_argument("--jitter", type=float, default=0.1, help="지연 편차(초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="429/500 응답 확률 (0~1)")
+    args = parser.parse_args()
+
+    fake = FakeOpenAIServer(args.host, args.port, args.latency, args.jitter, args.error_rate)
+    print(f"fake OpenAI server: {fake.base_url}")
+    try:
+        fake._httpd.serve_forever()
+    except KeyboardInterrupt:
+        fake.stop()
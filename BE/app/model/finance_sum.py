@@ -1,71 +1,293 @@
 # batch_process_summaries.py (ID별 처리 기능 추가 최종 버전)
+# torch/transformers/kss/openai는 실제로 쓰는 함수 안에서 import 한다
+# (--help, 처리할 약관이 없는 실행, API 서버의 import가 수 초씩 걸리지 않도록)
+from __future__ import annotations
+
+import time
+_STARTED = time.perf_counter()  # time-to-first-term 측정 기준
 
 import os
-import torch
-import torch.nn as nn
-import torch.nn.functional as F
-import kss
+import sys
+import hashlib
+import heapq
+import queue
+import multiprocessing as mp
 import sqlite3
-from transformers import BertModel
-from kobert_tokenizer import KoBERTTokenizer
-from konlpy.tag import Okt # Mecab 대신 Okt 사용
-from collections import Counter
-from openai import OpenAI
-from tqdm import tqdm
 import logging
+from typing import TYPE_CHECKING
 import argparse # [추가] 커맨드 라인 인자 처리를 위한 라이브러리
 from dotenv import load_dotenv
 import json
 #load_dotenv()
 
+# `python finance_sum.py`로 직접 실행해도 app 패키지를 import 할 수 있도록 BE 경로 추가
+BE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if BE_DIR not in sys.path:
+    sys.path.insert(0, BE_DIR)
+
+from app.model.gpt_stage import (
+    DEFAULT_CONCURRENCY, DEFAULT_MAX_RETRIES, DEFAULT_TIMEOUT,
+    create_with_retry, make_gpt_client,
+)
+from app.model.sentence_cache import DEFAULT_MAX_ENTRIES, SentenceScoreCache, model_fingerprint
+from app.model.summary_writer import DEFAULT_FLUSH_SIZE, SummaryWriter, ensure_summary_schema
+from app.model.pipeline import Stage, StreamingPipeline
+from app.model.backends import BACKENDS, EXPORTABLE, TimedModel, default_export_path, export_model, prepare_backend
+from app.model.articles import split_segments
+from app.model.morph import ANALYZERS, DEFAULT_ANALYZER, as_analyzer, make_analyzer, rank_keywords
+
+if TYPE_CHECKING:
+    from openai import OpenAI
+    from app.model.kobert import BERTClassifier
+
 # --- 기본 로깅 설정 ---
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
 # --- 설정 (Configuration) ---
 BASE_MODEL_NAME = "skt/kobert-base-v1"
+MAX_SEQ_LEN = 128            # 문장당 최대 토큰 길이 (초과분은 잘라냄)
+DEFAULT_BATCH_SIZE = 64      # 한 번의 forward에 넣는 최대 문장 수
+DEFAULT_MAX_TOKENS = 4096    # 한 배치의 (문장 수 x 패딩 길이) 상한
+TERMS_PER_CHUNK = 256        # DB cursor에서 한 번에 읽어 오는 약관 수
+CLASSIFY_TERMS_PER_BATCH = 32  # 문장을 모아 함께 추론할 약관 수 (파이프라인 classify 단계)
+DEFAULT_SCORE_WINDOW = 512     # 한 번에 토크나이즈/정렬하는 문장 수 (아주 긴 약관도 메모리 사용량이 일정)
+
+def __getattr__(name):
+    # BERTClassifier는 app.model.kobert로 옮겼다 (torch import를 모델이 필요할 때로 미룸)
+    if name == "BERTClassifier":
+        from app.model.kobert import BERTClassifier
+        return BERTClassifier
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def default_model_dir() -> str:
+    """ 오프라인 모델 폴더 (KOBERT_MODEL_DIR, 기본 app/model/kobert_local) """
+    return os.getenv("KOBERT_MODEL_DIR") or os.path.join(os.path.dirname(os.path.abspath(__file__)), "kobert_local")
+
+
+def split_term_sentences(content: str) -> list[str]:
+    """ 조(제N조) 단위로 자른 뒤 문장 분리 (조 제목이 앞 조 문장에 붙지 않고, 긴 약관도 kss 입력이 짧음) """
+    import kss
+    return [s for segment in split_segments(content) for s in kss.split_sentences(segment)]
+
+
+def extract_key_sentences(text: str, model: BERTClassifier, tokenizer, device, top_n: int = 3,
+                          batch_size: int = DEFAULT_BATCH_SIZE, max_tokens: int = DEFAULT_MAX_TOKENS,
+                          window: int = DEFAULT_SCORE_WINDOW) -> list[str]:
+    """
+    약관 1건의 top_n 핵심 문장.
+    문장 전체를 한 배치로 넣지 않고 window개씩 잘라 토크나이즈 → 길이별 미니배치 추론 → top_n 힙만 유지하므로
+    문장이 수천 개여도 메모리 사용량은 (window, max_tokens)에만 비례한다.
+    """
+    sentences = split_term_sentences(text)
+    if not sentences: return []
+    scored = iter_sentence_scores(sentences, model, tokenizer, device, batch_size, max_tokens, window)
+    return [sentences[idx] for idx in top_n_indices(scored, top_n)]
+
+
+# --- 약관 여러 건을 묶어서 추론하는 배치 엔진 ---
+def _length_buckets(order: list[int], lengths: list[int], batch_size: int, max_tokens: int):
+    """
+    토큰 길이 오름차순으로 정렬된 인덱스(order)를 배치로 나눈다.
+    배치의 문장 수가 batch_size를 넘거나 (문장 수 x 최대 길이)가 max_tokens를 넘으면 새 배치를 시작.
+    """
+    batch: list[int] = []
+    for idx in order:
+        padded_len = lengths[idx]  # 정렬되어 있으므로 마지막 문장이 배치의 최대 길이
+        if batch and (len(batch) >= batch_size or (len(batch) + 1) * padded_len > max_tokens):
+            yield batch
+            batch = []
+        batch.append(idx)
+    if batch:
+        yield batch
+
+
+def iter_sentence_scores(sentences: list[str], model: BERTClassifier, tokenizer, device,
+                         batch_size: int = DEFAULT_BATCH_SIZE, max_tokens: int = DEFAULT_MAX_TOKENS,
+                         window: int = DEFAULT_SCORE_WINDOW):
+    """
+    (문장 index, 핵심문장 확률)을 계산되는 순서대로 내보낸다.
+    window개씩만 토크나이즈하고, 그 안에서 길이가 비슷한 문장끼리 묶어 패딩 낭비를 줄인다.
+    한 번에 메모리에 올라오는 텐서는 최대 batch_size 문장 / max_tokens 토큰.
+    """
+    import torch
+    import torch.nn.functional as F
+
+    with torch.no_grad():
+        for start in range(0, len(sentences), window):
+            chunk = sentences[start:start + window]
+            encoded = tokenizer(chunk, truncation=True, max_length=MAX_SEQ_LEN)
+            features = [{key: encoded[key][i] for key in encoded.keys()} for i in range(len(chunk))]
+            lengths = [len(f["input_ids"]) for f in features]
+            order = sorted(range(len(chunk)), key=lengths.__getitem__)
+            for batch in _length_buckets(order, lengths, batch_size, max_tokens):
+                inputs = tokenizer.pad([features[i] for i in batch], padding=True, return_tensors="pt").to(device)
+                probs = F.softmax(model(**inputs), dim=1)[:, 1].cpu().tolist()
+                for idx, p in zip(batch, probs):
+                    yield start + idx, p
+
+
+def top_n_indices(scored, top_n: int) -> list[int]:
+    """
+    (index, 확률) 스트림에서 확률이 높은 top_n개의 index를 높은 순으로.
+    크기 top_n인 최소 힙만 유지한다 (동점이면 뒤쪽 문장 우선, argsort(kind="stable")[::-1]과 같은 순서).
+    """
+    heap: list[tuple[float, int]] = []
+    for idx, p in scored:
+        item = (p, idx)
+        if len(heap) < top_n:
+            heapq.heappush(heap, item)
+        elif item > heap[0]:
+            heapq.heapreplace(heap, item)
+    return [idx for _, idx in sorted(heap, reverse=True)]
+
+
+def score_sentences(sentences: list[str], model: BERTClassifier, tokenizer, device,
+                    batch_size: int = DEFAULT_BATCH_SIZE, max_tokens: int = DEFAULT_MAX_TOKENS,
+                    cache: SentenceScoreCache | None = None, window: int = DEFAULT_SCORE_WINDOW) -> list[float]:
+    """
+    문장별 핵심문장 확률(class 1)을 입력 순서 그대로 반환한다.
+    window개씩 토크나이즈하고 길이가 비슷한 문장끼리 묶어 추론한다 (iter_sentence_scores).
+    cache가 주어지면 이미 점수를 아는 문장은 건너뛰고 처음 보는 문장만 모델에 넣는다.
+    """
+    if not sentences: return []
+    if cache is not None:
+        cached = cache.get_many(sentences)
+        missing = [i for i in range(len(sentences)) if i not in cached]
+        if missing:
+            # 같은 문장이 여러 번 나와도 한 번만 추론
+            unique = list(dict.fromkeys(sentences[i] for i in missing))
+            scores = dict(zip(unique, score_sentences(unique, model, tokenizer, device, batch_size, max_tokens,
+                                                      window=window)))
+            cache.put_many(unique, [scores[s] for s in unique])
+            for i in missing:
+                cached[i] = scores[sentences[i]]
+        return [cached[i] for i in range(len(sentences))]
+
+    core_probs = [0.0] * len(sentences)
+    for idx, p in iter_sentence_scores(sentences, model, tokenizer, device, batch_size, max_tokens, window):
+        core_probs[idx] = p
+    return core_probs
 
-# (이전과 동일한 클래스 및 함수 정의는 생략)
-# ... BERTClassifier, BERTSumDataset, extract_key_sentences, extract_keywords, generate_gpt_summary ...
-class BERTClassifier(nn.Module):
-    def __init__(self, bert, hidden_size=768, num_classes=2, dr_rate=None):
-        super().__init__()
-        self.bert = bert
-        self.classifier = nn.Linear(hidden_size, num_classes)
-        self.dr_rate = dr_rate
-        if dr_rate:
-            self.dropout = nn.Dropout(p=dr_rate)
-
-    def forward(self, input_ids, attention_mask, token_type_ids=None):
-        _, pooler_output = self.bert(input_ids=input_ids,
-                                 attention_mask=attention_mask,
-                                 token_type_ids=token_type_ids)
-        out = self.dropout(pooler_output) if self.dr_rate and self.training else pooler_output
-        return self.classifier(out)
-
-
-def extract_key_sentences(text: str, model: BERTClassifier, tokenizer, device, top_n: int = 3) -> list[str]:
+
+def extract_key_sentences_batch(texts: list[str], model: BERTClassifier, tokenizer, device, top_n: int = 3,
+                                batch_size: int = DEFAULT_BATCH_SIZE, max_tokens: int = DEFAULT_MAX_TOKENS,
+                                stats: dict | None = None, cache: SentenceScoreCache | None = None,
+                                window: int = DEFAULT_SCORE_WINDOW) -> list[list[str]]:
+    """
+    여러 약관의 문장을 한꺼번에 모아 배치 추론한 뒤, 약관별로 확률을 되돌려 top_n 문장을 고른다.
+    stats가 주어지면 처리한 문장 수(sentences)와 추론 시간(seconds)을 누적한다.
+    """
+    split_docs = [split_term_sentences(text) for text in texts]
+    return rank_key_sentences(split_docs, model, tokenizer, device, top_n=top_n, batch_size=batch_size,
+                              max_tokens=max_tokens, stats=stats, cache=cache, window=window)
+
+
+def rank_key_sentences(split_docs: list[list[str]], model: BERTClassifier, tokenizer, device, top_n: int = 3,
+                       batch_size: int = DEFAULT_BATCH_SIZE, max_tokens: int = DEFAULT_MAX_TOKENS,
+                       stats: dict | None = None, cache: SentenceScoreCache | None = None,
+                       window: int = DEFAULT_SCORE_WINDOW) -> list[list[str]]:
+    """ 이미 문장 분리된 약관들(split_docs)을 한꺼번에 추론해 약관별 top_n 문장을 고른다 """
+    flat = [s for sentences in split_docs for s in sentences]
+
+    started = time.perf_counter()
+    flat_probs = score_sentences(flat, model, tokenizer, device, batch_size=batch_size, max_tokens=max_tokens,
+                                 cache=cache, window=window)
+    if stats is not None:
+        stats["sentences"] = stats.get("sentences", 0) + len(flat)
+        stats["seconds"] = stats.get("seconds", 0.0) + (time.perf_counter() - started)
+
+    results: list[list[str]] = []
+    offset = 0
+    for sentences in split_docs:
+        doc_probs = flat_probs[offset:offset + len(sentences)]
+        offset += len(sentences)
+        results.append([sentences[idx] for idx in top_n_indices(enumerate(doc_probs), top_n)])
+    return results
+
+
+def one_shot_key_sentences(sentences: list[str], model: BERTClassifier, tokenizer, device,
+                           top_n: int = 3) -> list[str]:
+    """
+    개선 전 방식 (비교 기준으로 고정, 수정하지 말 것): 약관 하나의 문장 전체를 패딩된 배치 하나로 추론.
+    extract_key_sentences는 길이 버킷 mini-batch를 쓰므로 기준으로 쓰면 안 된다.
+    """
+    import torch
+    import torch.nn.functional as F
+
+    if not sentences:
+        return []
     with torch.no_grad():
-        sentences = kss.split_sentences(text)
-        if not sentences: return []
-        inputs = tokenizer(sentences, padding=True, truncation=True, return_tensors="pt", max_length=128).to(device)
-        outputs = model(**inputs); probs = F.softmax(outputs, dim=1); core_probs = probs[:, 1].cpu().numpy()
-        sorted_indices = core_probs.argsort()[::-1]
-        return [sentences[idx] for idx in sorted_indices[:top_n]]
-def extract_keywords(sentences_list: list[str], tagger) -> list[str]:
-    full_text = " ".join(sentences_list); nouns = tagger.nouns(full_text)
-    meaningful_nouns = [n for n in nouns if len(n) > 1]
-    if not meaningful_nouns: return []
-    return list(Counter(meaningful_nouns).keys())
-
-def extract_keywords(sentences_list: list[str], tagger) -> list[str]:
-    full_text = " ".join(sentences_list)
-    nouns = tagger.nouns(full_text)
-    meaningful_nouns = [n for n in nouns if len(n) > 1]
-    return list(Counter(meaningful_nouns).keys())
+        inputs = tokenizer(sentences, padding=True, truncation=True, return_tensors="pt",
+                           max_length=MAX_SEQ_LEN).to(device)
+        core_probs = F.softmax(model(**inputs), dim=1)[:, 1].cpu().numpy()
+    # 동점 순서가 정해지도록 stable 정렬 (top_n_indices와 같은 규칙: 동점이면 뒤쪽 문장 우선)
+    return [sentences[idx] for idx in core_probs.argsort(kind="stable")[::-1][:top_n]]
+
+
+def compare_batching(texts: list[str], model: BERTClassifier, tokenizer, device, top_n: int = 3,
+                     batch_size: int = DEFAULT_BATCH_SIZE, max_tokens: int = DEFAULT_MAX_TOKENS) -> dict:
+    """ 개선 전 약관 단위 추론(one_shot_key_sentences)과 배치 엔진의 처리량(sentences/sec)과 top_n 일치율을 비교 """
+    split_docs = [split_term_sentences(text) for text in texts]  # 문장 분리 시간은 양쪽 모두 제외
+    started = time.perf_counter()
+    legacy = [one_shot_key_sentences(sentences, model, tokenizer, device, top_n=top_n) for sentences in split_docs]
+    legacy_seconds = time.perf_counter() - started
+
+    stats: dict = {}
+    started = time.perf_counter()
+    batched = rank_key_sentences(split_docs, model, tokenizer, device, top_n=top_n,
+                                 batch_size=batch_size, max_tokens=max_tokens, stats=stats)
+    batched_seconds = time.perf_counter() - started
+
+    n_sentences = stats.get("sentences", 0)
+    same = sum(1 for a, b in zip(legacy, batched) if set(a) == set(b))
+    return {
+        "terms": len(texts),
+        "sentences": n_sentences,
+        "legacy_sent_per_sec": n_sentences / legacy_seconds if legacy_seconds else 0.0,
+        "batched_sent_per_sec": n_sentences / batched_seconds if batched_seconds else 0.0,
+        "top_n_agreement": same / len(texts) if texts else 1.0,
+    }
+def compare_backends(texts: list[str], backends: dict, tokenizer, device, top_n: int = 3,
+                     batch_size: int = DEFAULT_BATCH_SIZE, max_tokens: int = DEFAULT_MAX_TOKENS) -> list[dict]:
+    """
+    백엔드별(예: {"eager": fp32 모델, "int8": 양자화 모델}) 배치당 지연 시간과
+    fp32(eager) 대비 top_n 문장 일치율을 비교한다.
+    """
+    split_docs = [split_term_sentences(text) for text in texts]
+    baseline = None
+    report = []
+    for name, model in backends.items():
+        timed = TimedModel(model)
+        started = time.perf_counter()
+        selected = rank_key_sentences(split_docs, timed, tokenizer, device, top_n=top_n,
+                                      batch_size=batch_size, max_tokens=max_tokens)
+        total = time.perf_counter() - started
+        if baseline is None:
+            baseline = selected
+        latencies = sorted(timed.latencies)
+        same = sum(1 for a, b in zip(baseline, selected) if set(a) == set(b))
+        report.append({
+            "backend": name,
+            "batches": len(latencies),
+            "batch_ms_p50": latencies[len(latencies) // 2] * 1000 if latencies else 0.0,
+            "batch_ms_mean": sum(latencies) / len(latencies) * 1000 if latencies else 0.0,
+            "total_seconds": total,
+            "top_n_agreement": same / len(texts) if texts else 1.0,
+        })
+    return report
+
+
+def extract_keywords(sentences_list: list[str], tagger, top_k: int | None = None) -> list[str]:
+    """ 핵심 문장의 명사를 빈도순으로 반환. tagger는 morph 분석기(문장별 메모이제이션) 또는 nouns()가 있는 객체 """
+    ranked = rank_keywords(sentences_list, tagger)
+    return [noun for noun, _count in (ranked[:top_k] if top_k else ranked)]
 
 # --- GPT 요약 생성 ---
-def generate_gpt_summary(key_sentences: list[str], raw_keywords: list[str], client: OpenAI) -> str:
-    if not key_sentences: return ""
+def generate_gpt_summary(key_sentences: list[str], raw_keywords: list[str], client: OpenAI,
+                         timeout: float = DEFAULT_TIMEOUT, max_retries: int = DEFAULT_MAX_RETRIES) -> tuple[str, list[str]]:
+    if not key_sentences: return "", raw_keywords
+    bullet_sentences = "- " + "\n- ".join(key_sentences)  # f-string 안 백슬래시는 3.12 미만에서 SyntaxError
     prompt = f"""# 지시사항
 당신은 금융 및 법률 약관을 분석하고 요약하는 최고 수준의 AI 전문가입니다.
 1차 AI가 추출한 '핵심 문장'과 '초벌 키워드'가 주어집니다.
@@ -81,7 +303,7 @@ def generate_gpt_summary(key_sentences: list[str], raw_keywords: list[str], clie
 
 # 입력 데이터
 ## 핵심 문장
-{'- ' + '\n- '.join(key_sentences)}
+{bullet_sentences}
 
 ## 초벌 키워드
 {', '.join(raw_keywords)}
@@ -89,7 +311,8 @@ def generate_gpt_summary(key_sentences: list[str], raw_keywords: list[str], clie
 # 출력 (JSON 형식):
 """
     try:
-        completion = client.chat.completions.create(
+        completion = create_with_retry(
+            client, max_retries=max_retries, timeout=timeout,
             model="gpt-4o",
             response_format={"type": "json_object"}, # JSON 출력 모드 사용
             messages=[{"role": "user", "content": prompt}]
@@ -105,16 +328,42 @@ def generate_gpt_summary(key_sentences: list[str], raw_keywords: list[str], clie
         logging.error(f"GPT API 호출 또는 JSON 파싱 오류: {e}")
         # 오류 발생 시, 정제 없이 기존 결과 반환
         return " ".join(key_sentences), raw_keywords
-        
-        
-    
+
+
 # --- [수정됨] DB 연동 함수 ---
-def get_all_terms(DB_PATH: str):
-    """ DB에서 '모든' 약관을 불러오는 함수 """
+def iter_terms(DB_PATH: str, term_ids: list[int] | None = None, chunk_size: int = TERMS_PER_CHUNK,
+               shard: tuple[int, int] | None = None):
+    """
+    약관을 cursor에서 chunk_size개씩 읽어 (id, title, content)를 하나씩 내보낸다.
+    fetchall 없이 읽으므로 테이블 크기와 무관하게 메모리 사용량이 일정하다.
+    shard=(N, k)이면 id % N == k 인 약관만 읽는다 (--workers 샤딩용).
+    """
+    conditions, params = [], []
+    if term_ids:
+        conditions.append(f"id IN ({','.join('?' for _ in term_ids)})")
+        params.extend(term_ids)
+    if shard is not None:
+        conditions.append("id % ? = ?")
+        params.extend(shard)
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
     with sqlite3.connect(DB_PATH) as conn:
         cur = conn.cursor()
-        cur.execute("SELECT id, title, content FROM terms")
-        return cur.fetchall()
+        cur.execute(f"SELECT id, title, content FROM terms {where} ORDER BY id", params)
+        while True:
+            rows = cur.fetchmany(chunk_size)
+            if not rows:
+                break
+            yield from rows
+
+
+def count_terms(DB_PATH: str, term_ids: list[int] | None = None) -> int:
+    with sqlite3.connect(DB_PATH) as conn:
+        if term_ids:
+            placeholders = ','.join('?' for _ in term_ids)
+            return conn.execute(f"SELECT COUNT(*) FROM terms WHERE id IN ({placeholders})", term_ids).fetchone()[0]
+        return conn.execute("SELECT COUNT(*) FROM terms").fetchone()[0]
+
 
 def get_terms_by_ids(DB_PATH: str, term_ids: list[int]):
     """ [추가됨] DB에서 '지정된 ID'의 약관들만 불러오는 함수 """
@@ -126,53 +375,207 @@ def get_terms_by_ids(DB_PATH: str, term_ids: list[int]):
         cur.execute(query, term_ids)
         return cur.fetchall()
 
-def save_summary_to_db(DB_PATH: str, term_id: int, summary_text: str, keywords: list[str]):
-    """
-    term_summaries 테이블에 요약 저장
-    revision_version은 동일 term_id 내에서 존재하는 버전을 기준으로 자동 생성
-    """
-    keywords_str = ','.join(keywords)
+def content_hash(content: str) -> str:
+    """ 약관 본문의 sha256 (요약 당시 원문과 현재 원문이 같은지 비교용) """
+    return hashlib.sha256((content or "").encode("utf-8")).hexdigest()
+
 
+def get_latest_content_hashes(DB_PATH: str) -> dict[int, str | None]:
+    """ term_id별 가장 최근 요약에 저장된 원문 해시 """
     with sqlite3.connect(DB_PATH) as conn:
         cur = conn.cursor()
-        # 테이블 생성 (없으면)
+        ensure_summary_schema(cur)
         cur.execute("""
-            CREATE TABLE IF NOT EXISTS term_summaries (
-                id               INTEGER      NOT NULL PRIMARY KEY AUTOINCREMENT,
-                term_id          INTEGER      NOT NULL REFERENCES terms (id) ON DELETE CASCADE,
-                revision_version VARCHAR(50)  NOT NULL,
-                summary_text     TEXT,
-                created_at       DATETIME     NOT NULL DEFAULT CURRENT_TIMESTAMP,
-                keywords         TEXT,
-                CONSTRAINT uq_term_revision UNIQUE(term_id, revision_version)
-            )
+            SELECT s.term_id, s.content_hash
+            FROM term_summaries s
+            JOIN (SELECT term_id, MAX(id) AS max_id FROM term_summaries GROUP BY term_id) latest
+              ON latest.max_id = s.id
         """)
-        cur.execute("CREATE INDEX IF NOT EXISTS ix_term_summaries_term_id ON term_summaries (term_id)")
+        return dict(cur.fetchall())
 
-        # 기존 revision_version 조회
-        cur.execute("""
-            SELECT revision_version
-            FROM term_summaries
-            WHERE term_id = ?
-        """, (term_id,))
-        existing_versions = cur.fetchall()  # [('v1',), ('v2',), ...]
-
-        # 다음 버전 계산
-        if not existing_versions:
-            next_version = 1
+
+def iter_changed_terms(DB_PATH: str, terms, counter: dict | None = None):
+    """
+    최신 요약의 content_hash와 현재 본문 해시가 같은 약관은 건너뛴다.
+    counter가 주어지면 건너뛴 개수를 counter["skipped"]에 누적한다.
+    """
+    latest = get_latest_content_hashes(DB_PATH)
+    for term in terms:
+        if latest.get(term[0]) == content_hash(term[2]):
+            if counter is not None:
+                counter["skipped"] = counter.get("skipped", 0) + 1
+            continue
+        yield term
+
+
+def save_summary_to_db(DB_PATH: str, term_id: int, summary_text: str, keywords: list[str],
+                       content_hash: str | None = None):
+    """
+    term_summaries 테이블에 요약 1건 저장 (여러 건이면 SummaryWriter를 직접 사용)
+    revision_version은 동일 term_id 내 최대 리비전 + 1로 자동 생성
+    content_hash는 요약 대상이었던 약관 본문의 해시 (--changed-only 판단용)
+    """
+    with SummaryWriter(DB_PATH) as writer:
+        writer.add(term_id, summary_text, keywords, content_hash=content_hash)
+# --- 스트리밍 파이프라인 단계 구성 ---
+def build_summary_stages(model: BERTClassifier, tokenizer, device, tagger, gpt_client, writer: SummaryWriter,
+                         batch_size: int = DEFAULT_BATCH_SIZE, max_tokens: int = DEFAULT_MAX_TOKENS,
+                         gpt_concurrency: int = DEFAULT_CONCURRENCY, gpt_timeout: float = DEFAULT_TIMEOUT,
+                         gpt_retries: int = DEFAULT_MAX_RETRIES, infer_stats: dict | None = None,
+                         cache: SentenceScoreCache | None = None, on_saved=None,
+                         score_window: int = DEFAULT_SCORE_WINDOW) -> list[Stage]:
+    """
+    split → classify → keywords → gpt → write 단계.
+    tagger는 morph.make_analyzer()로 만든 분석기 (nouns()만 있는 Okt 등도 감싸서 사용).
+    각 단계는 (term_id, content, ...) 튜플을 받아 다음 단계로 넘긴다.
+    """
+    tagger = as_analyzer(tagger)
+
+    def split(term):
+        term_id, _title, content = term
+        return term_id, content, split_term_sentences(content)
+
+    def classify(items):
+        key_sentences_list = rank_key_sentences([sentences for _, _, sentences in items], model, tokenizer, device,
+                                                top_n=3, batch_size=batch_size, max_tokens=max_tokens,
+                                                stats=infer_stats, cache=cache, window=score_window)
+        return [(term_id, content, key_sentences)
+                for (term_id, content, _), key_sentences in zip(items, key_sentences_list)]
+
+    def keywords(items):
+        # 여러 약관의 핵심 문장을 한 번에 분석기로 넘긴다 (처음 보는 문장만 실제로 분석됨)
+        tagger.nouns_batch([s for _, _, key_sentences in items for s in key_sentences])
+        return [(term_id, content, key_sentences, extract_keywords(key_sentences, tagger))
+                for term_id, content, key_sentences in items]
+
+    def gpt(item):
+        term_id, content, key_sentences, raw_keywords = item
+        summary, refined = generate_gpt_summary(key_sentences, raw_keywords, gpt_client,
+                                                timeout=gpt_timeout, max_retries=gpt_retries)
+        return term_id, content, summary, refined
+
+    def write(item):
+        term_id, content, summary, refined = item
+        writer.add(term_id, summary, refined, content_hash=content_hash(content))
+        if on_saved is not None:
+            on_saved(term_id)
+
+    return [
+        Stage("split", split),
+        Stage("classify", classify, batch_size=CLASSIFY_TERMS_PER_BATCH, queue_size=CLASSIFY_TERMS_PER_BATCH * 2),
+        Stage("keywords", keywords, batch_size=CLASSIFY_TERMS_PER_BATCH, queue_size=CLASSIFY_TERMS_PER_BATCH * 2),
+        # GPT 요청은 동시에 보내되 결과는 약관 입력 순서대로 저장 단계에 넘긴다
+        Stage("gpt", gpt, workers=gpt_concurrency, queue_size=max(gpt_concurrency * 2, 8), ordered=True),
+        Stage("write", write),
+    ]
+
+
+# --- 모델 로드 ---
+def load_summarization_model(model_path: str, device, backend: str = "eager", model_dir: str | None = None) -> tuple:
+    """
+    (tokenizer, BERTClassifier) 로드. backend가 eager가 아니면 해당 추론 백엔드로 감싸서 반환.
+    model_dir(기본 default_model_dir())에 --export-local-model로 만든 폴더가 있으면
+    허브 없이 config + safetensors(mmap)로 로드한다.
+    """
+    from app.model.kobert import build_model, load_state_dict, load_weights
+
+    model_dir = model_dir or default_model_dir()
+    tokenizer, model = build_model(BASE_MODEL_NAME, device, model_dir=model_dir)
+    load_weights(model, load_state_dict(model_path, device, model_dir=model_dir), device)
+    model.eval()
+    if backend != "eager":
+        export_path = default_export_path(model_path, backend) if backend in EXPORTABLE else None
+        model = prepare_backend(model, backend, device, export_path)
+    return tokenizer, model
+
+
+# --- 멀티 프로세스 샤딩 (--workers N) ---
+class _QueueWriter:
+    """ 워커 프로세스의 write 단계: 요약을 DB 대신 메인 프로세스의 단일 writer로 보낸다 """
+
+    def __init__(self, result_q):
+        self.result_q = result_q
+
+    def add(self, term_id: int, summary_text: str, keywords: list[str], content_hash: str | None = None):
+        self.result_q.put(("row", term_id, summary_text, list(keywords), content_hash))
+
+
+def _shard_worker(worker_idx: int, n_workers: int, cfg: dict, result_q):
+    """ id % n_workers == worker_idx 인 약관을 처리하는 워커 프로세스 """
+    skipped, ok = 0, False
+    try:
+        import torch
+        torch.set_num_threads(cfg["num_threads"])
+        device = torch.device("cpu")
+        tokenizer, model = load_summarization_model(cfg["model_path"], device, backend=cfg["backend"],
+                                                    model_dir=cfg.get("model_dir"))
+        tagger = make_analyzer(cfg.get("analyzer", DEFAULT_ANALYZER))
+        gpt_client = make_gpt_client(api_key=cfg["api_key"], base_url=cfg["gpt_base_url"], timeout=cfg["gpt_timeout"])
+        cache = None
+        if cfg["cache_path"]:
+            cache = SentenceScoreCache(cfg["cache_path"], cfg["cache_fingerprint"], max_entries=cfg["cache_max_entries"])
+
+        counter = {"skipped": 0}
+        terms = iter_terms(cfg["db_path"], cfg["ids"], shard=(n_workers, worker_idx))
+        if cfg["changed_only"]:
+            terms = iter_changed_terms(cfg["db_path"], terms, counter)
+        stages = build_summary_stages(
+            model, tokenizer, device, tagger, gpt_client, _QueueWriter(result_q),
+            batch_size=cfg["batch_size"], max_tokens=cfg["max_tokens"],
+            gpt_concurrency=cfg["gpt_concurrency"], gpt_timeout=cfg["gpt_timeout"], gpt_retries=cfg["gpt_retries"],
+            cache=cache, score_window=cfg.get("score_window", DEFAULT_SCORE_WINDOW),
+        )
+        pipeline = StreamingPipeline(terms, stages)
+        pipeline.run()
+        logging.info(f"[worker {worker_idx}] 완료 (torch threads={cfg['num_threads']})")
+        pipeline.log_stats()
+        if cache is not None:
+            cache.close()
+        skipped, ok = counter["skipped"], True
+    except Exception:
+        logging.exception(f"[worker {worker_idx}] 처리 중 오류")
+    finally:
+        result_q.put(("done", worker_idx, skipped, ok))
+
+
+def run_sharded(cfg: dict, n_workers: int, writer: SummaryWriter, on_saved=None) -> dict:
+    """
+    약관 id를 n_workers개 프로세스로 나누어 처리하고, 결과는 이 프로세스의 writer 하나로 저장한다.
+    각 워커는 모델/토크나이저/형태소 분석기를 한 번만 로드하고 CPU 코어를 나눠 쓴다.
+    """
+    ctx = mp.get_context("spawn")  # torch/JVM 상태를 fork로 복제하지 않도록 spawn 사용
+    result_q = ctx.Queue(maxsize=256)
+    procs = [ctx.Process(target=_shard_worker, args=(i, n_workers, cfg, result_q), name=f"summary-worker-{i}")
+             for i in range(n_workers)]
+    for proc in procs:
+        proc.start()
+
+    finished, saved, skipped, failed = 0, 0, 0, 0
+    while finished < n_workers:
+        try:
+            msg = result_q.get(timeout=1.0)
+        except queue.Empty:
+            if not any(proc.is_alive() for proc in procs):
+                logging.error("워커 프로세스가 종료 신호 없이 끝났습니다.")
+                break
+            continue
+        if msg[0] == "row":
+            _, term_id, summary_text, keywords, c_hash = msg
+            writer.add(term_id, summary_text, keywords, content_hash=c_hash)
+            saved += 1
+            if on_saved is not None:
+                on_saved(term_id)
         else:
-            # 'v숫자' 형태에서 숫자만 뽑아 최대값 + 1
-            max_v = max(int(v[0].lstrip('v')) for v in existing_versions)
-            next_version = max_v + 1
+            _, _worker_idx, worker_skipped, ok = msg
+            finished += 1
+            skipped += worker_skipped
+            failed += 0 if ok else 1
+
+    for proc in procs:
+        proc.join()
+    return {"saved": saved, "skipped": skipped, "failed_workers": failed}
 
-        revision_version = f"v{next_version}"
 
-        # 데이터 삽입
-        cur.execute("""
-            INSERT INTO term_summaries (term_id, revision_version, summary_text, keywords)
-            VALUES (?, ?, ?, ?)
-        """, (term_id, revision_version, summary_text, keywords_str))
-        conn.commit()
 # ========================================================================================
 # 4. 메인 실행 로직
 # ========================================================================================
@@ -205,49 +608,212 @@ if __name__ == "__main__":
         type=int,
         help="처리할 특정 약관 ID 목록. 지정하지 않으면 DB의 모든 약관을 처리합니다."
     )
+    parser.add_argument("--changed-only", action="store_true",
+                        help="최신 요약 이후 본문(content)이 바뀐 약관만 처리합니다.")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+                        help="KoBERT forward 한 번에 넣을 최대 문장 수 (약관 여러 건의 문장을 길이별로 묶음)")
+    parser.add_argument("--max-tokens", type=int, default=DEFAULT_MAX_TOKENS,
+                        help="한 배치의 (문장 수 x 패딩 길이) 상한")
+    parser.add_argument("--score-window", type=int, default=DEFAULT_SCORE_WINDOW,
+                        help="한 번에 토크나이즈하는 문장 수 (긴 약관의 메모리 상한, --max-tokens와 함께 조절)")
+    parser.add_argument("--analyzer", choices=ANALYZERS, default=DEFAULT_ANALYZER,
+                        help="키워드 추출용 형태소 분석기 (okt=JVM, kiwi/mecab=네이티브로 더 빠름)")
+    parser.add_argument("--compare-batching", action="store_true",
+                        help="DB에 저장하지 않고 기존 약관 단위 추론과 배치 추론의 sentences/sec를 비교만 합니다.")
+    parser.add_argument("--write-batch", type=int, default=DEFAULT_FLUSH_SIZE,
+                        help="요약을 모아서 한 트랜잭션으로 저장할 건수")
+    parser.add_argument("--sentence-cache", default=None,
+                        help="문장 점수 캐시(SQLite) 경로. 기본값: 모델 폴더의 sentence_cache.db")
+    parser.add_argument("--no-sentence-cache", action="store_true", help="문장 점수 캐시를 사용하지 않습니다.")
+    parser.add_argument("--cache-max-entries", type=int, default=DEFAULT_MAX_ENTRIES,
+                        help="문장 점수 캐시 최대 항목 수 (초과 시 오래 안 쓴 항목부터 삭제)")
+    parser.add_argument("--gpt-concurrency", type=int, default=DEFAULT_CONCURRENCY,
+                        help="동시에 보낼 GPT 요청 수")
+    parser.add_argument("--gpt-timeout", type=float, default=DEFAULT_TIMEOUT, help="GPT 요청 1건당 타임아웃(초)")
+    parser.add_argument("--gpt-retries", type=int, default=DEFAULT_MAX_RETRIES, help="429/5xx/타임아웃 시 최대 재시도 횟수")
+    parser.add_argument("--gpt-base-url", default=os.getenv("OPENAI_BASE_URL"),
+                        help="OpenAI 호환 서버 주소 (예: 로컬 가짜 서버 http://127.0.0.1:8089/v1)")
+    parser.add_argument("--backend", choices=BACKENDS, default="eager",
+                        help="KoBERT 추론 백엔드 (eager=fp32, int8=동적 양자화, torchscript/onnx=내보낸 그래프)")
+    parser.add_argument("--export-backend", choices=EXPORTABLE, default=None,
+                        help="fp32 모델을 TorchScript/ONNX 파일로 내보내고 종료합니다 (최초 1회).")
+    parser.add_argument("--compare-backends", action="store_true",
+                        help="DB에 저장하지 않고 사용 가능한 백엔드의 배치 지연 시간과 fp32 대비 top-3 일치율을 비교합니다.")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="약관 id를 N개 프로세스로 나눠 처리합니다 (CPU 전용 서버용). 저장은 메인 프로세스 하나가 담당.")
+    parser.add_argument("--fake-gpt-latency", type=float, default=None,
+                        help="지정하면 OpenAI 대신 이 지연(초)을 가진 로컬 가짜 서버를 띄워 사용합니다.")
+    parser.add_argument("--model-dir", default=default_model_dir(),
+                        help="오프라인 모델 폴더 (config/토크나이저/safetensors). 없으면 허브 이름 + .pth로 로드")
+    parser.add_argument("--export-local-model", action="store_true",
+                        help="허브 토크나이저/config와 .pth 가중치를 --model-dir에 오프라인 폴더로 저장하고 종료합니다 (최초 1회).")
     args = parser.parse_args()
 
+    if args.export_local_model:
+        from app.model.kobert import export_local_model
+        export_local_model(MODEL_PATH, BASE_MODEL_NAME, args.model_dir)
+        logging.info(f"오프라인 모델 폴더 저장 완료: {args.model_dir}")
+        sys.exit(0)
+
+    # 처리할 약관이 없으면 모델/외부 라이브러리를 로드하기 전에 끝낸다
+    total_terms = count_terms(DB_PATH, args.ids)
+    if total_terms == 0 and not args.export_backend:
+        logging.warning("처리할 약관 데이터가 없습니다.")
+        sys.exit(0)
+
+    import torch
+    from tqdm import tqdm
+
     # --- 1. AI 모델 및 리소스 로드 ---
+    # --workers 모드에서는 각 워커 프로세스가 모델을 로드하므로 메인 프로세스는 로드하지 않음
+    use_workers = args.workers > 1 and not (args.compare_batching or args.compare_backends)
     device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
-    logging.info(f"Using device: {device}")
-    
-    try:
-        tokenizer = KoBERTTokenizer.from_pretrained(BASE_MODEL_NAME)
-        bertmodel = BertModel.from_pretrained(BASE_MODEL_NAME, return_dict=False)
-        summarization_model = BERTClassifier(bertmodel, num_classes=2, dr_rate=0.5).to(device)
-        summarization_model.load_state_dict(torch.load(MODEL_PATH, map_location=device))
-        summarization_model.eval()
-        logging.info("✅ 최종 요약 모델 로드 완료.")
-    except Exception as e:
-        logging.error(f"모델 로딩 중 치명적 오류 발생: {e}")
-        exit()
-    
+    if args.backend != "eager" or args.export_backend or args.compare_backends:
+        device = torch.device("cpu")  # 양자화/내보낸 그래프는 CPU 전용
+    if not use_workers:
+        logging.info(f"Using device: {device}")
+        try:
+            # 내보내기/비교는 fp32 원본이 필요
+            backend = "eager" if (args.export_backend or args.compare_backends) else args.backend
+            load_started = time.perf_counter()
+            tokenizer, summarization_model = load_summarization_model(MODEL_PATH, device, backend=backend,
+                                                                      model_dir=args.model_dir)
+            logging.info(f"✅ 최종 요약 모델 로드 완료. (backend={backend}, "
+                         f"{time.perf_counter() - load_started:.1f}s, 시작 후 {time.perf_counter() - _STARTED:.1f}s)")
+        except Exception as e:
+            logging.error(f"모델 로딩 중 치명적 오류 발생: {e}")
+            exit()
+
+    if args.export_backend:
+        export_path = default_export_path(MODEL_PATH, args.export_backend)
+        export_model(summarization_model, tokenizer, args.export_backend, export_path, device)
+        logging.info(f"{args.export_backend} 모델 내보내기 완료: {export_path}")
+        sys.exit(0)
+
 
     api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key:
+    gpt_base_url = args.gpt_base_url
+    fake_server = None
+    if args.fake_gpt_latency is not None:
+        from app.model.fake_openai import FakeOpenAIServer
+        fake_server = FakeOpenAIServer(latency=args.fake_gpt_latency).start()
+        gpt_base_url = fake_server.base_url
+        logging.info(f"로컬 가짜 GPT 서버 사용: {gpt_base_url} (latency={args.fake_gpt_latency}s)")
+    elif not api_key:
         logging.warning("OPENAI_API_KEY 환경 변수가 설정되지 않았습니다. GPT 요약은 추출 문장 조합으로 대체됩니다.")
-    gpt_client = OpenAI(api_key=api_key)
-    okt_tagger = Okt()
+    gpt_client = make_gpt_client(api_key=api_key, base_url=gpt_base_url, timeout=args.gpt_timeout)
+    tagger = None if use_workers else make_analyzer(args.analyzer)
 
-    # --- [수정됨] 2. 인자에 따라 DB에서 약관 원문 불러오기 ---
+    sentence_cache = None
+    cache_path, fingerprint = None, None
+    if not args.no_sentence_cache:
+        cache_path = args.sentence_cache or os.path.join(SCRIPT_DIR, "sentence_cache.db")
+        from app.model.kobert import weights_path
+        # 백엔드마다 점수가 미세하게 다르므로 지문에 포함
+        fingerprint = model_fingerprint(weights_path(MODEL_PATH, args.model_dir), BASE_MODEL_NAME, MAX_SEQ_LEN,
+                                        args.backend)
+        logging.info(f"문장 점수 캐시: {cache_path} (model={fingerprint})")
+        if not use_workers:
+            sentence_cache = SentenceScoreCache(cache_path, fingerprint, max_entries=args.cache_max_entries)
+
+    # --- 2. 인자에 따라 처리할 약관 결정 (원문은 파이프라인이 cursor에서 chunk 단위로 읽음) ---
     if args.ids:
-        # --ids 인자가 주어졌으면, 해당 ID의 약관만 불러오기
-        terms_to_process = get_terms_by_ids(DB_PATH, args.ids)
-        logging.info(f"지정된 {len(terms_to_process)}개의 약관에 대해 처리를 시작합니다: {args.ids}")
+        logging.info(f"지정된 {total_terms}개의 약관에 대해 처리를 시작합니다: {args.ids}")
     else:
-        # --ids 인자가 없으면, 모든 약관 불러오기
-        terms_to_process = get_all_terms(DB_PATH)
-        logging.info(f"총 {len(terms_to_process)}개의 모든 약관에 대해 배치 처리를 시작합니다.")
+        logging.info(f"총 {total_terms}개의 모든 약관에 대해 배치 처리를 시작합니다.")
+
+    skip_counter = {"skipped": 0}
+    terms_stream = iter_terms(DB_PATH, args.ids)
+    if args.changed_only:
+        terms_stream = iter_changed_terms(DB_PATH, terms_stream, skip_counter)
 
     # --- 3. 배치 처리 실행 ---
-    # --- 배치 처리 ---
-    if not terms_to_process:
+    processed_count = 0
+    first_saved_at = None
+
+    def on_saved(_term_id):
+        global first_saved_at
+        if first_saved_at is None:
+            first_saved_at = time.perf_counter() - _STARTED
+            logging.info(f"time-to-first-term: {first_saved_at:.1f}s (프로세스 시작 ~ 첫 요약 저장)")
+        pbar.update(1)
+
+    if total_terms == 0:
         logging.warning("처리할 약관 데이터가 없습니다.")
+    elif args.compare_batching:
+        report = compare_batching([row[2] for row in terms_stream], summarization_model, tokenizer, device,
+                                  top_n=3, batch_size=args.batch_size, max_tokens=args.max_tokens)
+        logging.info(f"문장 {report['sentences']}개 / 약관 {report['terms']}건")
+        logging.info(f"기존(약관 단위): {report['legacy_sent_per_sec']:.1f} sentences/sec")
+        logging.info(f"배치 엔진: {report['batched_sent_per_sec']:.1f} sentences/sec")
+        logging.info(f"top-3 일치율: {report['top_n_agreement']:.1%}")
+    elif args.compare_backends:
+        candidates = {"eager": summarization_model}
+        for name in BACKENDS[1:]:
+            export_path = default_export_path(MODEL_PATH, name) if name in EXPORTABLE else None
+            try:
+                candidates[name] = prepare_backend(summarization_model, name, device, export_path)
+            except (FileNotFoundError, ImportError) as e:
+                logging.warning(f"{name} 백엔드 건너뜀: {e}")
+        for row in compare_backends([row[2] for row in terms_stream], candidates, tokenizer, device, top_n=3,
+                                    batch_size=args.batch_size, max_tokens=args.max_tokens):
+            logging.info(
+                f"[{row['backend']:>11}] 배치 {row['batches']}개, p50 {row['batch_ms_p50']:.1f}ms, "
+                f"평균 {row['batch_ms_mean']:.1f}ms, 총 {row['total_seconds']:.1f}s, "
+                f"fp32 대비 top-3 일치율 {row['top_n_agreement']:.1%}"
+            )
+    elif use_workers:
+        worker_cfg = {
+            "db_path": DB_PATH, "model_path": MODEL_PATH, "ids": args.ids, "changed_only": args.changed_only,
+            "num_threads": max(1, (os.cpu_count() or 1) // args.workers),
+            "backend": args.backend, "batch_size": args.batch_size, "max_tokens": args.max_tokens,
+            "score_window": args.score_window, "analyzer": args.analyzer, "model_dir": args.model_dir,
+            "api_key": api_key, "gpt_base_url": gpt_base_url, "gpt_timeout": args.gpt_timeout,
+            "gpt_concurrency": args.gpt_concurrency, "gpt_retries": args.gpt_retries,
+            "cache_path": cache_path, "cache_fingerprint": fingerprint, "cache_max_entries": args.cache_max_entries,
+        }
+        logging.info(f"워커 {args.workers}개로 분산 처리 (워커당 torch threads={worker_cfg['num_threads']})")
+        with SummaryWriter(DB_PATH, flush_size=args.write_batch) as summary_writer, \
+                tqdm(total=total_terms, desc="전체 약관 요약 처리 중") as pbar:
+            result = run_sharded(worker_cfg, args.workers, summary_writer, on_saved=on_saved)
+        processed_count = result["saved"]
+        skip_counter["skipped"] = result["skipped"]
+        if result["failed_workers"]:
+            logging.error(f"실패한 워커 {result['failed_workers']}개 (로그 확인 필요)")
     else:
-        for term_id, title, content in tqdm(terms_to_process, desc="전체 약관 요약 처리 중"):
-            key_sentences = extract_key_sentences(content, summarization_model, tokenizer, device, top_n=3)
-            keywords = extract_keywords(key_sentences, okt_tagger)
-            final_summary, refined_keywords = generate_gpt_summary(key_sentences, keywords, gpt_client)
-            save_summary_to_db(DB_PATH, term_id, final_summary, refined_keywords)
+        infer_stats: dict = {}
+        with SummaryWriter(DB_PATH, flush_size=args.write_batch) as summary_writer, \
+                tqdm(total=total_terms, desc="전체 약관 요약 처리 중") as pbar:
+            stages = build_summary_stages(
+                summarization_model, tokenizer, device, tagger, gpt_client, summary_writer,
+                batch_size=args.batch_size, max_tokens=args.max_tokens,
+                gpt_concurrency=args.gpt_concurrency, gpt_timeout=args.gpt_timeout, gpt_retries=args.gpt_retries,
+                infer_stats=infer_stats, cache=sentence_cache, on_saved=on_saved,
+                score_window=args.score_window,
+            )
+            pipeline = StreamingPipeline(terms_stream, stages)
+            pipeline.run()
+        pipeline.log_stats()
+        processed_count = stages[-1].items - stages[-1].errors
+
+        if infer_stats.get("seconds"):
+            logging.info(
+                f"문장 추론: {infer_stats['sentences']}문장 / {infer_stats['seconds']:.1f}s "
+                f"({infer_stats['sentences'] / infer_stats['seconds']:.1f} sentences/sec)"
+            )
+
+    if fake_server is not None:
+        fake_server.stop()
+
+    if sentence_cache is not None:
+        cs = sentence_cache.stats()
+        logging.info(
+            f"문장 캐시: hit {cs['hits']} / miss {cs['misses']} ({cs['hit_ratio']:.1%}), "
+            f"항목 {cs['entries']}개, 삭제 {cs['evicted']}개"
+        )
+        sentence_cache.close()
+
+    if not (args.compare_batching or args.compare_backends):
+        logging.info(f"처리 {processed_count}건 / 건너뜀 {skip_counter['skipped']}건")
 
     logging.info("🎉 작업이 성공적으로 완료되었습니다.")
\ No newline at end of file
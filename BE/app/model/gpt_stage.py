@@ -0,0 +1,75 @@
+# app/model/gpt_stage.py
+"""
+GPT 요약 단계를 동시에 여러 건 실행하기 위한 도구 모음.
+- make_gpt_client: OpenAI 호환 서버(실서버/로컬 가짜 서버)에 붙는 클라이언트 생성
+- create_with_retry: 429/5xx/타임아웃에 지수 백오프로 재시도
+openai 패키지는 클라이언트를 만들 때 import 한다 (배치 스크립트 시작 시간 단축).
+"""
+from __future__ import annotations
+
+import logging
+import random
+import time
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from openai import OpenAI
+
+DEFAULT_CONCURRENCY = 8
+DEFAULT_TIMEOUT = 30.0       # 요청 1건당 타임아웃(초)
+DEFAULT_MAX_RETRIES = 4
+BASE_BACKOFF = 0.5           # 첫 재시도 대기(초), 이후 2배씩 증가
+MAX_BACKOFF = 20.0
+
+
+def make_gpt_client(api_key: Optional[str] = None, base_url: Optional[str] = None,
+                    timeout: float = DEFAULT_TIMEOUT) -> OpenAI:
+    """
+    OpenAI 호환 클라이언트 생성. base_url을 주면 로컬 가짜 서버 등 다른 엔드포인트로 보낸다.
+    재시도는 create_with_retry에서 직접 제어하므로 SDK 자체 재시도는 끈다.
+    """
+    from openai import OpenAI
+
+    return OpenAI(api_key=api_key or "not-needed", base_url=base_url, timeout=timeout, max_retries=0)
+
+
+def _is_retryable(e: Exception) -> bool:
+    from openai import APIConnectionError, APIStatusError, APITimeoutError
+
+    if isinstance(e, (APITimeoutError, APIConnectionError)):
+        return True
+    if isinstance(e, APIStatusError):
+        return e.status_code == 429 or e.status_code >= 500
+    return False
+
+
+def _backoff_delay(attempt: int, e: Exception) -> float:
+    # 서버가 Retry-After를 알려주면 우선 사용
+    response = getattr(e, "response", None)
+    retry_after = response.headers.get("retry-after") if response is not None else None
+    if retry_after:
+        try:
+            return min(float(retry_after), MAX_BACKOFF)
+        except ValueError:
+            pass
+    delay = min(BASE_BACKOFF * (2 ** attempt), MAX_BACKOFF)
+    return delay + random.uniform(0, BASE_BACKOFF)
+
+
+def create_with_retry(client, max_retries: int = DEFAULT_MAX_RETRIES,
+                      timeout: float = DEFAULT_TIMEOUT, **kwargs):
+    """
+    client.chat.completions.create를 호출하고, 재시도 가능한 오류(429/5xx/타임아웃/연결 오류)는
+    지수 백오프로 최대 max_retries번 다시 시도한다. 그 외 오류나 재시도 소진 시 예외를 그대로 올린다.
+    """
+    attempt = 0
+    while True:
+        try:
+            return client.chat.completions.create(timeout=timeout, **kwargs)
+        except Exception as e:
+            if attempt >= max_retries or not _is_retryable(e):
+                raise
+            delay = _backoff_delay(attempt, e)
+            logging.warning(f"GPT 요청 실패({type(e).__name__}), {delay:.1f}s 후 재시도 ({attempt + 1}/{max_retries})")
+            time.sleep(delay)
+            attempt += 1
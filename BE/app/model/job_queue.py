@@ -0,0 +1,130 @@
+# app/model/job_queue.py
+"""
+요약 작업 큐 (term.db의 summary_jobs 테이블).
+- API가 POST /admin/terms/{id}/summarize로 작업을 넣고(term_service._enqueue_summary), 상주 워커(summary_worker.py)가 꺼내 처리한다.
+- 같은 약관의 대기(queued) 작업은 하나만 둔다 (부분 유니크 인덱스). 중복 요청은 기존 작업에 합쳐지고 requested만 늘어난다.
+- 상태: queued → running → done / failed
+- running 작업은 처리 중인 워커가 heartbeat_at을 주기적으로 갱신한다.
+  lease_seconds 동안 갱신이 없는 작업만 죽은 워커의 작업으로 보고 대기열로 되돌린다 (다른 워커가 살아 있어도 안전)
+"""
+import sqlite3
+import threading
+
+BUSY_TIMEOUT_MS = 30_000
+DEFAULT_LEASE_SECONDS = 300.0  # heartbeat가 이 시간 동안 없으면 running 작업을 되돌린다
+
+QUEUED, RUNNING, DONE, FAILED = "queued", "running", "done", "failed"
+
+
+def ensure_job_schema(cur: sqlite3.Cursor):
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS summary_jobs (
+            id           INTEGER      NOT NULL PRIMARY KEY AUTOINCREMENT,
+            term_id      INTEGER      NOT NULL REFERENCES terms (id) ON DELETE CASCADE,
+            status       VARCHAR(16)  NOT NULL,
+            requested    INTEGER      NOT NULL DEFAULT 1,
+            error        TEXT,
+            created_at   DATETIME     NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            started_at   DATETIME,
+            finished_at  DATETIME,
+            heartbeat_at DATETIME
+        )
+    """)
+    columns = {row[1] for row in cur.execute("PRAGMA table_info(summary_jobs)")}
+    if "heartbeat_at" not in columns:
+        cur.execute("ALTER TABLE summary_jobs ADD COLUMN heartbeat_at DATETIME")
+    cur.execute("CREATE INDEX IF NOT EXISTS ix_summary_jobs_status_id ON summary_jobs (status, id)")
+    cur.execute("CREATE INDEX IF NOT EXISTS ix_summary_jobs_term_id ON summary_jobs (term_id)")
+    cur.execute(f"""
+        CREATE UNIQUE INDEX IF NOT EXISTS ux_summary_jobs_queued_term
+        ON summary_jobs (term_id) WHERE status = '{QUEUED}'
+    """)
+
+
+class JobQueue:
+    def __init__(self, db_path: str, lease_seconds: float = DEFAULT_LEASE_SECONDS):
+        self.lease_seconds = lease_seconds
+        # isolation_level=None: 트랜잭션 경계를 직접 BEGIN/COMMIT으로 관리
+        # heartbeat는 워커의 다른 스레드에서 호출하므로 연결을 공유하고 트랜잭션은 _lock으로 하나씩
+        self._conn = sqlite3.connect(db_path, isolation_level=None, timeout=BUSY_TIMEOUT_MS / 1000,
+                                     check_same_thread=False)
+        self._lock = threading.Lock()
+        self._conn.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}")
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._tx(lambda cur: ensure_job_schema(cur))
+
+    def _tx(self, fn):
+        with self._lock:
+            cur = self._conn.cursor()
+            cur.execute("BEGIN IMMEDIATE")
+            try:
+                result = fn(cur)
+                cur.execute("COMMIT")
+                return result
+            except Exception:
+                cur.execute("ROLLBACK")
+                raise
+
+    def claim(self, limit: int) -> list[tuple[int, int]]:
+        """ 오래된 대기 작업부터 limit개를 running으로 바꾸고 [(job_id, term_id)] 반환 """
+        def run(cur):
+            rows = cur.execute(f"SELECT id, term_id FROM summary_jobs WHERE status = '{QUEUED}' ORDER BY id LIMIT ?",
+                               (limit,)).fetchall()
+            cur.executemany(f"UPDATE summary_jobs SET status = '{RUNNING}', started_at = CURRENT_TIMESTAMP, "
+                            f"heartbeat_at = CURRENT_TIMESTAMP WHERE id = ?", [(job_id,) for job_id, _ in rows])
+            return rows
+        return self._tx(run)
+
+    def finish(self, job_ids: list[int], error: str | None = None):
+        """ error가 없으면 done, 있으면 failed로 기록 """
+        if not job_ids:
+            return
+        status = FAILED if error else DONE
+        self._tx(lambda cur: cur.executemany(
+            "UPDATE summary_jobs SET status = ?, error = ?, finished_at = CURRENT_TIMESTAMP WHERE id = ?",
+            [(status, error, job_id) for job_id in job_ids],
+        ))
+
+    def heartbeat(self, job_ids: list[int]):
+        """ 처리 중인 작업의 lease 연장 (워커가 lease_seconds보다 짧은 주기로 호출) """
+        if not job_ids:
+            return
+        self._tx(lambda cur: cur.executemany(
+            f"UPDATE summary_jobs SET heartbeat_at = CURRENT_TIMESTAMP WHERE id = ? AND status = '{RUNNING}'",
+            [(job_id,) for job_id in job_ids],
+        ))
+
+    def requeue_running(self) -> int:
+        """
+        lease가 끝난(heartbeat_at이 lease_seconds보다 오래된) running 작업을 다시 대기열로 돌린다.
+        죽은 워커가 처리하다 만 작업만 해당하고, 살아 있는 다른 워커의 작업은 건드리지 않는다.
+        같은 약관의 대기 작업이 이미 있으면 그 작업에 합친다 (요청 횟수 requested도 더한다).
+        """
+        def run(cur):
+            stale = cur.execute(f"""
+                SELECT id, term_id, requested FROM summary_jobs
+                WHERE status = '{RUNNING}'
+                  AND COALESCE(heartbeat_at, started_at, created_at) < datetime('now', ?)
+                ORDER BY id
+            """, (f"-{self.lease_seconds:g} seconds",)).fetchall()
+            for job_id, term_id, requested in stale:
+                queued = cur.execute(f"SELECT id FROM summary_jobs WHERE term_id = ? AND status = '{QUEUED}'",
+                                     (term_id,)).fetchone()
+                if queued:
+                    cur.execute("UPDATE summary_jobs SET requested = requested + ? WHERE id = ?",
+                                (requested, queued[0]))
+                    cur.execute("DELETE FROM summary_jobs WHERE id = ?", (job_id,))
+                else:
+                    cur.execute(f"UPDATE summary_jobs SET status = '{QUEUED}', started_at = NULL, "
+                                f"heartbeat_at = NULL WHERE id = ?", (job_id,))
+            return len(stale)
+        return self._tx(run)
+
+    def close(self):
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,113 @@
+# app/model/kobert.py
+"""
+KoBERT 핵심 문장 분류 모델 정의와 로딩.
+torch/transformers를 import 하므로 finance_sum 등에서는 모델이 필요할 때만 import 한다.
+
+로컬 모델 폴더(기본 app/model/kobert_local, KOBERT_MODEL_DIR로 변경)가 있으면 네트워크 없이 로드한다.
+- config.json + 토크나이저 파일: BertModel을 meta 장치에서 config로만 만든다
+  (허브의 사전학습 가중치도, 어차피 덮어쓸 랜덤 초기화 가중치도 만들지 않음)
+- classifier.safetensors: 학습된 가중치를 mmap으로 읽어 복사 없이 모델에 그대로 붙인다 (load_weights, assign=True)
+폴더는 `python finance_sum.py --export-local-model`로 한 번 만든다.
+폴더가 없으면 이전처럼 허브 이름(skt/kobert-base-v1) + .pth를 사용한다 (.pth도 가능하면 mmap으로 읽음).
+"""
+import os
+
+import torch
+import torch.nn as nn
+
+WEIGHTS_FILE = "classifier.safetensors"
+
+
+class BERTClassifier(nn.Module):
+    def __init__(self, bert, hidden_size=768, num_classes=2, dr_rate=None):
+        super().__init__()
+        self.bert = bert
+        self.classifier = nn.Linear(hidden_size, num_classes)
+        self.dr_rate = dr_rate
+        if dr_rate:
+            self.dropout = nn.Dropout(p=dr_rate)
+
+    def forward(self, input_ids, attention_mask, token_type_ids=None):
+        _, pooler_output = self.bert(input_ids=input_ids,
+                                 attention_mask=attention_mask,
+                                 token_type_ids=token_type_ids)
+        out = self.dropout(pooler_output) if self.dr_rate and self.training else pooler_output
+        return self.classifier(out)
+
+
+def is_local_model_dir(model_dir: str | None) -> bool:
+    return bool(model_dir) and os.path.isfile(os.path.join(model_dir, "config.json"))
+
+
+def weights_path(model_path: str, model_dir: str | None = None) -> str:
+    """ load_state_dict가 실제로 읽을 가중치 파일 경로 """
+    st_path = os.path.join(model_dir, WEIGHTS_FILE) if model_dir else None
+    return st_path if st_path and os.path.isfile(st_path) else model_path
+
+
+def load_state_dict(model_path: str, device, model_dir: str | None = None) -> dict:
+    """ 로컬 폴더의 safetensors(mmap)가 있으면 그것을, 없으면 .pth를 읽는다 """
+    path = weights_path(model_path, model_dir)
+    if path != model_path:
+        from safetensors.torch import load_file
+        return load_file(path, device=str(device))
+    try:
+        # zip 형식 체크포인트는 mmap으로 필요한 텐서만 페이지 단위로 읽는다 (torch 2.1+)
+        return torch.load(model_path, map_location=device, mmap=True, weights_only=True)
+    except (TypeError, RuntimeError):
+        return torch.load(model_path, map_location=device)
+
+
+def build_model(base_model_name: str, device, model_dir: str | None = None, dr_rate: float = 0.5) -> tuple:
+    """
+    (tokenizer, 가중치를 아직 읽지 않은 BERTClassifier). 가중치는 load_weights로 읽는다.
+    로컬 폴더면 모델은 meta 장치에 있다 (저장 공간 없음)
+    """
+    from kobert_tokenizer import KoBERTTokenizer
+    from transformers import BertConfig, BertModel
+
+    if is_local_model_dir(model_dir):
+        tokenizer = KoBERTTokenizer.from_pretrained(model_dir, local_files_only=True)
+        config = BertConfig.from_pretrained(model_dir, local_files_only=True)
+        config.return_dict = False
+        # 가중치는 학습된 state_dict로 붙이므로 meta 장치에서 모양만 만든다 (랜덤 초기화/메모리 할당 없음)
+        with torch.device("meta"):
+            return tokenizer, BERTClassifier(BertModel(config), num_classes=2, dr_rate=dr_rate)
+    tokenizer = KoBERTTokenizer.from_pretrained(base_model_name)
+    bert = BertModel.from_pretrained(base_model_name, return_dict=False)
+    return tokenizer, BERTClassifier(bert, num_classes=2, dr_rate=dr_rate).to(device)
+
+
+def load_weights(model: BERTClassifier, state_dict: dict, device) -> BERTClassifier:
+    """
+    build_model의 모델에 state_dict를 읽는다.
+    meta 장치 모델은 텐서를 복사하지 않고 그대로 붙이고(assign=True, mmap 텐서 유지),
+    state_dict에 없는 non-persistent 버퍼(BertEmbeddings의 position_ids/token_type_ids)는 device에 새로 만든다.
+    """
+    if not any(p.is_meta for p in model.parameters()):
+        model.load_state_dict(state_dict)
+        return model
+    model.load_state_dict(state_dict, assign=True)
+    embeddings = model.bert.embeddings
+    positions = embeddings.position_ids.shape[-1]
+    embeddings.position_ids = torch.arange(positions, device=device).expand((1, -1))
+    embeddings.token_type_ids = torch.zeros((1, positions), dtype=torch.long, device=device)
+    left = [name for name, t in [*model.named_parameters(), *model.named_buffers()] if t.is_meta]
+    if left:
+        raise RuntimeError(f"가중치 파일에 없는 텐서가 있습니다: {', '.join(left)}")
+    return model.to(device)
+
+
+def export_local_model(model_path: str, base_model_name: str, model_dir: str) -> str:
+    """ 허브 토크나이저/config와 학습된 .pth 가중치를 오프라인 폴더(config + 토크나이저 + safetensors)로 저장 """
+    from safetensors.torch import save_file
+
+    device = torch.device("cpu")
+    tokenizer, model = build_model(base_model_name, device)
+    model.load_state_dict(torch.load(model_path, map_location=device))
+    os.makedirs(model_dir, exist_ok=True)
+    tokenizer.save_pretrained(model_dir)
+    model.bert.config.save_pretrained(model_dir)
+    # safetensors는 메모리를 공유하는 텐서를 허용하지 않으므로 contiguous 복사본으로 저장
+    save_file({k: v.contiguous() for k, v in model.state_dict().items()}, os.path.join(model_dir, WEIGHTS_FILE))
+    return model_dir
@@ -0,0 +1,195 @@
+# app/model/morph.py
+"""
+키워드 추출용 형태소 분석기(명사 추출) 백엔드.
+- okt:   konlpy Okt (JVM 기반, 기존 기본값). konlpy에 일괄 API가 없어 문장마다 호출
+- kiwi:  kiwipiepy (C++ 네이티브, JVM 없음). Kiwi.tokenize(문장 목록)으로 한 번에 일괄 분석
+- mecab: python-mecab-ko (C++ 네이티브). 없으면 konlpy.tag.Mecab 사용
+
+모든 백엔드는 nouns_batch(문장 목록) -> 문장별 명사 목록 형태로 호출된다.
+CachedAnalyzer로 감싸면 같은 문장은 한 번만 분석하고(LRU), 처음 보는 문장만 모아 한 번에 분석기에 넘긴다.
+
+사용 예) 백엔드 비교 (BE 폴더에서)
+    python -m app.model.morph --analyzers okt kiwi mecab --db term.db
+"""
+import threading
+from collections import Counter, OrderedDict
+
+ANALYZERS = ("okt", "kiwi", "mecab")
+DEFAULT_ANALYZER = "okt"
+DEFAULT_CACHE_SIZE = 50_000  # 문장 수
+MIN_NOUN_LEN = 2
+
+
+class OktAnalyzer:
+    name = "okt"
+
+    def __init__(self):
+        from konlpy.tag import Okt
+        self.tagger = Okt()
+
+    def nouns_batch(self, sentences: list[str]) -> list[list[str]]:
+        return [self.tagger.nouns(s) for s in sentences]
+
+
+class KiwiAnalyzer:
+    name = "kiwi"
+    NOUN_TAGS = ("NNG", "NNP")
+
+    def __init__(self, num_workers: int = 0):
+        from kiwipiepy import Kiwi  # 선택 의존성: kiwi 백엔드를 쓸 때만 필요
+        self.kiwi = Kiwi(num_workers=num_workers)
+
+    def nouns_batch(self, sentences: list[str]) -> list[list[str]]:
+        return [[t.form for t in tokens if t.tag in self.NOUN_TAGS] for tokens in self.kiwi.tokenize(sentences)]
+
+
+class MecabAnalyzer:
+    name = "mecab"
+
+    def __init__(self):
+        try:
+            from mecab import MeCab  # python-mecab-ko (사전 포함)
+            self.tagger = MeCab()
+        except ImportError:
+            from konlpy.tag import Mecab  # 시스템에 mecab-ko-dic이 설치된 경우
+            self.tagger = Mecab()
+
+    def nouns_batch(self, sentences: list[str]) -> list[list[str]]:
+        return [self.tagger.nouns(s) for s in sentences]
+
+
+class TaggerAnalyzer:
+    """ nouns(text)만 있는 기존 tagger 객체(Okt() 등)를 분석기 인터페이스로 감싼다 """
+
+    def __init__(self, tagger):
+        self.tagger = tagger
+        self.name = type(tagger).__name__.lower()
+
+    def nouns_batch(self, sentences: list[str]) -> list[list[str]]:
+        return [self.tagger.nouns(s) for s in sentences]
+
+
+class CachedAnalyzer:
+    """
+    문장 → 명사 목록 LRU 메모이제이션.
+    약관에는 같은 문장(고지 문구, 조항 서식 등)이 반복되므로 분석기 호출 수가 크게 준다.
+    파이프라인의 keywords 단계가 여러 스레드에서 쓸 수 있어 lock으로 보호한다.
+    """
+
+    def __init__(self, analyzer, maxsize: int = DEFAULT_CACHE_SIZE):
+        self.analyzer = analyzer
+        self.name = analyzer.name
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[str, list[str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def nouns_batch(self, sentences: list[str]) -> list[list[str]]:
+        found: dict[str, list[str]] = {}
+        with self._lock:
+            for s in sentences:
+                if s in self._data:
+                    self._data.move_to_end(s)
+                    found[s] = self._data[s]
+            missing = list(dict.fromkeys(s for s in sentences if s not in found))
+            self.hits += len(sentences) - len(missing)
+            self.misses += len(missing)
+        if missing:
+            analyzed = self.analyzer.nouns_batch(missing)  # 처음 보는 문장만 한 번에 분석
+            with self._lock:
+                for s, nouns in zip(missing, analyzed):
+                    found[s] = nouns
+                    if self.maxsize > 0:
+                        self._data[s] = nouns
+                        self._data.move_to_end(s)
+                while len(self._data) > self.maxsize:
+                    self._data.popitem(last=False)
+        return [found[s] for s in sentences]
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {"entries": len(self._data), "hits": self.hits, "misses": self.misses,
+                "hit_ratio": self.hits / total if total else 0.0}
+
+
+def make_analyzer(name: str = DEFAULT_ANALYZER, cache_size: int = DEFAULT_CACHE_SIZE) -> CachedAnalyzer:
+    """ 이름으로 분석기를 만들어 메모이제이션 래퍼로 감싼다 """
+    if name == "okt":
+        analyzer = OktAnalyzer()
+    elif name == "kiwi":
+        analyzer = KiwiAnalyzer()
+    elif name == "mecab":
+        analyzer = MecabAnalyzer()
+    else:
+        raise ValueError(f"알 수 없는 형태소 분석기: {name} (가능: {', '.join(ANALYZERS)})")
+    return CachedAnalyzer(analyzer, maxsize=cache_size)
+
+
+def as_analyzer(tagger):
+    """ 분석기(nouns_batch 보유)는 그대로, nouns()만 있는 tagger는 메모이제이션 래퍼로 감싸서 반환 """
+    if hasattr(tagger, "nouns_batch"):
+        return tagger
+    return CachedAnalyzer(TaggerAnalyzer(tagger))
+
+
+def rank_keywords(sentences: list[str], analyzer, min_len: int = MIN_NOUN_LEN) -> list[tuple[str, int]]:
+    """ 문장들의 명사 빈도 순위 [(명사, 횟수)]. 빈도가 같으면 먼저 나온 명사가 앞 """
+    counts: Counter = Counter()
+    for nouns in as_analyzer(analyzer).nouns_batch(sentences):
+        counts.update(n for n in nouns if len(n) >= min_len)
+    return counts.most_common()  # Counter.most_common은 동점이면 처음 나온 순서를 유지
+
+
+if __name__ == "__main__":
+    import argparse
+    import os
+    import sqlite3
+    import sys
+    import time
+
+    BE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    if BE_DIR not in sys.path:
+        sys.path.insert(0, BE_DIR)
+
+    parser = argparse.ArgumentParser(description="형태소 분석기 백엔드별 명사 추출 속도/결과 비교")
+    parser.add_argument("--analyzers", nargs="+", choices=ANALYZERS, default=list(ANALYZERS))
+    parser.add_argument("--db", default=os.path.join(BE_DIR, "term.db"), help="약관 본문을 읽을 SQLite DB")
+    parser.add_argument("--limit", type=int, default=None, help="사용할 약관 수")
+    parser.add_argument("--top-k", type=int, default=10, help="okt 대비 일치율을 볼 상위 키워드 수")
+    args = parser.parse_args()
+
+    import kss
+
+    with sqlite3.connect(args.db) as conn:
+        sql = "SELECT content FROM terms ORDER BY id" + (f" LIMIT {int(args.limit)}" if args.limit else "")
+        docs = [kss.split_sentences(row[0] or "") for row in conn.execute(sql)]
+    n_sentences = sum(len(d) for d in docs)
+    print(f"약관 {len(docs)}건, 문장 {n_sentences}개")
+
+    reference = None
+    for name in args.analyzers:
+        started = time.perf_counter()
+        try:
+            analyzer = make_analyzer(name)
+        except ImportError as e:
+            print(f"{name:>6}: 건너뜀 ({e})")
+            continue
+        init_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        ranked = [rank_keywords(d, analyzer) for d in docs]
+        cold = time.perf_counter() - started
+        started = time.perf_counter()
+        for d in docs:
+            rank_keywords(d, analyzer)
+        warm = time.perf_counter() - started  # 같은 문장 재처리 = 메모이제이션 효과
+
+        top = [{k for k, _ in r[:args.top_k]} for r in ranked]
+        if reference is None:
+            reference = top
+        overlap = [len(a & b) / max(1, len(a)) for a, b in zip(reference, top)]
+        cs = analyzer.stats()
+        print(f"{name:>6}: 초기화 {init_seconds:.2f}s, 분석 {cold:.2f}s ({n_sentences / cold if cold else 0:.0f} 문장/s), "
+              f"캐시 재처리 {warm * 1000:.1f}ms, 문장 중복 적중 {cs['hits']}/{cs['hits'] + cs['misses']}, "
+              f"상위 {args.top_k}개 {args.analyzers[0]} 대비 일치 {sum(overlap) / max(1, len(overlap)):.0%}")
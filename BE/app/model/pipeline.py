@@ -0,0 +1,201 @@
+# app/model/pipeline.py
+"""
+단계(stage)별 스레드를 크기 제한 큐로 연결한 스트리밍 파이프라인.
+앞 단계가 다음 약관을 처리하는 동안 뒤 단계가 이전 약관을 처리하므로 단계들이 겹쳐서 돈다.
+큐 크기가 제한되어 있어 테이블이 아무리 커도 메모리에 올라오는 약관 수는 일정하다.
+ordered=True인 단계는 워커가 여러 개여도 결과를 입력 순서대로 다음 단계에 넘긴다 (재정렬 버퍼).
+"""
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, Iterable
+
+DEFAULT_QUEUE_SIZE = 32
+_DONE = object()  # 스트림 종료 표시
+
+
+class Stage:
+    """
+    name: 통계 출력용 이름
+    fn: batch_size == 1 이면 fn(item) -> 결과 (None이면 다음 단계로 넘기지 않음)
+        batch_size > 1 이면 fn(items) -> 결과 리스트 (큐에 쌓여 있는 만큼 최대 batch_size개씩 모아 호출)
+    workers: 이 단계를 동시에 실행할 스레드 수
+    ordered: workers > 1이어도 결과를 입력 순서대로 내보낸다 (먼저 끝난 결과는 앞 순번이 끝날 때까지 버퍼에서 대기)
+    """
+
+    def __init__(self, name: str, fn: Callable, workers: int = 1, batch_size: int = 1,
+                 queue_size: int = DEFAULT_QUEUE_SIZE, ordered: bool = False):
+        self.name = name
+        self.fn = fn
+        self.workers = max(1, workers)
+        self.batch_size = max(1, batch_size)
+        self.queue_size = queue_size
+        self.ordered = ordered and self.workers > 1
+
+        # 재정렬 버퍼: 꺼낸 순번 → 결과. _emit_seq 순번부터 차례로 내보낸다
+        # 앞 순번 하나가 오래 걸려도 버퍼가 끝없이 커지지 않도록 아직 못 내보낸 건수를 queue_size로 제한
+        self._take_lock = threading.Lock()
+        self._emit_lock = threading.Lock()
+        self._emitted = threading.Condition(self._emit_lock)
+        self._next_seq = 0
+        self._emit_seq = 0
+        self._pending: dict[int, list] = {}
+
+        self.items = 0
+        self.errors = 0
+        self.busy_seconds = 0.0
+        self.depth_samples = 0
+        self.depth_total = 0
+        self.depth_max = 0
+        self._lock = threading.Lock()
+
+    def _record(self, n_items: int, seconds: float, error: bool = False):
+        with self._lock:
+            self.items += n_items
+            self.busy_seconds += seconds
+            if error:
+                self.errors += n_items
+
+    def _sample_depth(self, depth: int):
+        with self._lock:
+            self.depth_samples += 1
+            self.depth_total += depth
+            self.depth_max = max(self.depth_max, depth)
+
+    def stats(self) -> dict:
+        return {
+            "stage": self.name,
+            "items": self.items,
+            "errors": self.errors,
+            "busy_seconds": self.busy_seconds,
+            # 스레드 1개 기준 처리량 (workers개가 동시에 돌면 그만큼 곱해짐)
+            "items_per_sec": self.items / self.busy_seconds if self.busy_seconds else 0.0,
+            "queue_depth_avg": self.depth_total / self.depth_samples if self.depth_samples else 0.0,
+            "queue_depth_max": self.depth_max,
+        }
+
+
+class StreamingPipeline:
+    def __init__(self, source: Iterable[Any], stages: list[Stage]):
+        self.source = source
+        self.stages = stages
+        self.read_count = 0
+        self.elapsed = 0.0
+
+    def _put(self, stage: Stage, q: queue.Queue, item):
+        q.put(item)
+        stage._sample_depth(q.qsize())
+
+    def _reader(self, out_stage: Stage, out_q: queue.Queue):
+        try:
+            for item in self.source:
+                self.read_count += 1
+                self._put(out_stage, out_q, item)
+        except Exception:
+            logging.exception("입력 스트림 읽기 중 오류")
+        finally:
+            out_q.put(_DONE)
+
+    def _take(self, stage: Stage, in_q: queue.Queue) -> tuple[list, bool]:
+        """ 입력 큐에서 1개는 기다려서, 나머지는 쌓여 있는 만큼 batch_size까지 꺼낸다 """
+        first = in_q.get()
+        if first is _DONE:
+            return [], True
+        batch = [first]
+        while len(batch) < stage.batch_size:
+            try:
+                item = in_q.get_nowait()
+            except queue.Empty:
+                break
+            if item is _DONE:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _take_ordered(self, stage: Stage, in_q: queue.Queue) -> tuple[list, bool, int]:
+        """ 꺼낸 순서대로 순번을 매긴다 (꺼내기와 순번 매기기를 한 번에 해야 순서가 입력과 같음) """
+        with stage._take_lock:
+            with stage._emitted:
+                stage._emitted.wait_for(lambda: stage._next_seq - stage._emit_seq < max(stage.queue_size, 1))
+            batch, done = self._take(stage, in_q)
+            seq = stage._next_seq
+            if batch:
+                stage._next_seq += 1
+        return batch, done, seq
+
+    def _emit(self, stage: Stage, next_stage: Stage | None, out_q: queue.Queue | None, results: list):
+        if out_q is not None:
+            for result in results:
+                if result is not None:
+                    self._put(next_stage, out_q, result)
+
+    def _emit_ordered(self, stage: Stage, next_stage: Stage | None, out_q: queue.Queue | None,
+                      seq: int, results: list):
+        """ seq의 결과를 버퍼에 넣고, 앞 순번이 모두 끝났으면 이어지는 순번까지 차례로 내보낸다 """
+        with stage._emit_lock:
+            stage._pending[seq] = results
+            while stage._emit_seq in stage._pending:
+                self._emit(stage, next_stage, out_q, stage._pending.pop(stage._emit_seq))
+                stage._emit_seq += 1
+            stage._emitted.notify_all()
+
+    def _worker(self, idx: int, in_q: queue.Queue, out_q: queue.Queue | None, remaining: list):
+        stage = self.stages[idx]
+        next_stage = self.stages[idx + 1] if out_q is not None else None
+        while True:
+            if stage.ordered:
+                batch, done, seq = self._take_ordered(stage, in_q)
+            else:
+                batch, done = self._take(stage, in_q)
+            if batch:
+                started = time.perf_counter()
+                try:
+                    if stage.batch_size > 1:
+                        results = stage.fn(batch)
+                    else:
+                        results = [stage.fn(batch[0])]
+                    stage._record(len(batch), time.perf_counter() - started)
+                except Exception:
+                    logging.exception(f"[{stage.name}] 단계 처리 중 오류 ({len(batch)}건 건너뜀)")
+                    stage._record(len(batch), time.perf_counter() - started, error=True)
+                    results = []  # 실패한 순번도 버퍼에 넣어야 뒤 순번이 막히지 않는다
+                if stage.ordered:
+                    self._emit_ordered(stage, next_stage, out_q, seq, results)
+                else:
+                    self._emit(stage, next_stage, out_q, results)
+            if done:
+                in_q.put(_DONE)  # 같은 단계의 다른 워커도 종료하도록 되돌려 놓음
+                with stage._lock:
+                    remaining[idx] -= 1
+                    last = remaining[idx] == 0
+                if last and out_q is not None:
+                    out_q.put(_DONE)
+                return
+
+    def run(self) -> list[dict]:
+        started = time.perf_counter()
+        queues = [queue.Queue(maxsize=stage.queue_size) for stage in self.stages]
+        remaining = [stage.workers for stage in self.stages]
+
+        threads = [threading.Thread(target=self._reader, args=(self.stages[0], queues[0]),
+                                    name="pipeline-read", daemon=True)]
+        for idx, stage in enumerate(self.stages):
+            out_q = queues[idx + 1] if idx + 1 < len(self.stages) else None
+            for w in range(stage.workers):
+                threads.append(threading.Thread(target=self._worker, args=(idx, queues[idx], out_q, remaining),
+                                                name=f"pipeline-{stage.name}-{w}", daemon=True))
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.elapsed = time.perf_counter() - started
+        return [stage.stats() for stage in self.stages]
+
+    def log_stats(self):
+        logging.info(f"파이프라인: 입력 {self.read_count}건, 총 {self.elapsed:.1f}s")
+        for s in (stage.stats() for stage in self.stages):
+            logging.info(
+                f"  [{s['stage']:>8}] {s['items']}건 (오류 {s['errors']}), busy {s['busy_seconds']:.1f}s, "
+                f"{s['items_per_sec']:.1f}건/s, 입력 큐 평균 {s['queue_depth_avg']:.1f} / 최대 {s['queue_depth_max']}"
+            )
@@ -0,0 +1,144 @@
+# app/model/sentence_cache.py
+"""
+KoBERT 문장 분류 결과(핵심문장 확률)를 디스크에 보관하는 SQLite 캐시.
+키 = sha256(문장) + 모델 지문(fingerprint). 모델 가중치가 바뀌면 지문이 달라져 자동으로 무효화된다.
+max_entries를 넘으면 가장 오래 사용되지 않은 항목부터 지운다(LRU).
+항목 수는 파일 안의 카운터 행(sentence_cache_size)으로 센다. --workers 프로세스들이 같은 파일을 쓰므로
+프로세스마다 따로 세지 않고, INSERT와 같은 쓰기 트랜잭션 안에서 카운터를 갱신/확인해 넘친 만큼만 지운다.
+조회(hit) 시각은 메모리에 모아 두었다가 다음 put_many 트랜잭션(또는 close, TOUCH_FLUSH_SIZE개 초과 시)에 한 번에 쓴다.
+"""
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+
+DEFAULT_MAX_ENTRIES = 1_000_000
+_SQL_CHUNK = 500  # IN (...) 파라미터 개수 제한 대비
+TOUCH_FLUSH_SIZE = 10_000  # put_many 없이 hit만 계속될 때 last_used를 쓰는 기준
+
+
+def model_fingerprint(weights_path: str, *extra) -> str:
+    """
+    실제로 읽는 가중치 파일(kobert.weights_path)과 추론 설정(extra)으로 만든 모델 지문.
+    시작할 때마다 수백 MB를 읽지 않도록 내용 대신 파일 이름/크기/수정 시각을 쓴다 (다시 저장하면 바뀜)
+    """
+    h = hashlib.sha256()
+    if weights_path and os.path.exists(weights_path):
+        st = os.stat(weights_path)
+        h.update(f"{os.path.basename(weights_path)}:{st.st_size}:{st.st_mtime_ns}".encode("utf-8"))
+    for value in extra:
+        h.update(repr(value).encode("utf-8"))
+    return h.hexdigest()[:16]
+
+
+class SentenceScoreCache:
+    def __init__(self, path: str, fingerprint: str, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.path = path
+        self.fingerprint = fingerprint
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evicted = 0
+        self._touched: dict[str, int] = {}  # 아직 쓰지 않은 key -> 마지막 조회 시각
+        self._touch_lock = threading.Lock()
+
+        # 파이프라인 스레드/--workers 프로세스가 같은 파일을 함께 쓰므로 잠금 대기 시간을 둔다
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS sentence_scores (
+                key        TEXT    NOT NULL PRIMARY KEY,
+                prob       REAL    NOT NULL,
+                last_used  INTEGER NOT NULL
+            ) WITHOUT ROWID
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS ix_sentence_scores_last_used ON sentence_scores (last_used)")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS sentence_cache_size (
+                id       INTEGER NOT NULL PRIMARY KEY CHECK (id = 1),
+                entries  INTEGER NOT NULL
+            )
+        """)
+        with self._conn:
+            # 카운터가 없던 캐시 파일은 한 번만 센다 (여러 프로세스가 동시에 열어도 한 행만 들어감)
+            self._conn.execute("INSERT OR IGNORE INTO sentence_cache_size (id, entries) "
+                               "SELECT 1, COUNT(*) FROM sentence_scores")
+
+    def _key(self, sentence: str) -> str:
+        return self.fingerprint + ":" + hashlib.sha256(sentence.encode("utf-8")).hexdigest()
+
+    def get_many(self, sentences: list[str]) -> dict[int, float]:
+        """ 캐시에 있는 문장만 {입력 인덱스: 확률}로 반환. 조회된 항목의 사용 시각은 모아 두었다가 나중에 쓴다 """
+        keys = [self._key(s) for s in sentences]
+        found: dict[str, float] = {}
+        for start in range(0, len(keys), _SQL_CHUNK):
+            chunk = keys[start:start + _SQL_CHUNK]
+            placeholders = ",".join("?" for _ in chunk)
+            found.update(self._conn.execute(
+                f"SELECT key, prob FROM sentence_scores WHERE key IN ({placeholders})", chunk
+            ).fetchall())
+
+        result = {i: found[k] for i, k in enumerate(keys) if k in found}
+        self.hits += len(result)
+        self.misses += len(keys) - len(result)
+        if found:
+            now = time.time_ns()
+            with self._touch_lock:
+                self._touched.update(dict.fromkeys(found, now))
+                full = len(self._touched) >= TOUCH_FLUSH_SIZE
+            if full:
+                with self._conn:
+                    self._write_touched()
+        return result
+
+    def _write_touched(self):
+        """ 모아 둔 조회 시각을 현재 트랜잭션에서 쓴다 """
+        with self._touch_lock:
+            touched, self._touched = self._touched, {}
+        if touched:
+            self._conn.executemany("UPDATE sentence_scores SET last_used = ? WHERE key = ?",
+                                   [(ts, k) for k, ts in touched.items()])
+
+    def put_many(self, sentences: list[str], probs: list[float]):
+        if not sentences:
+            return
+        now = time.time_ns()
+        with self._conn:  # 첫 INSERT가 쓰기 잠금을 잡으므로 카운터 확인/삭제까지 다른 프로세스와 겹치지 않는다
+            self._write_touched()  # 최근 조회한 항목이 바로 아래 LRU 삭제 대상이 되지 않도록 먼저 쓴다
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO sentence_scores (key, prob, last_used) VALUES (?, ?, ?)",
+                [(self._key(s), float(p), now) for s, p in zip(sentences, probs)],
+            )
+            added = self._conn.total_changes - before
+            if added:
+                self._conn.execute("UPDATE sentence_cache_size SET entries = entries + ? WHERE id = 1", (added,))
+            overflow = self._entries() - self.max_entries
+            if overflow > 0:
+                removed = self._conn.execute("""
+                    DELETE FROM sentence_scores WHERE key IN (
+                        SELECT key FROM sentence_scores ORDER BY last_used ASC LIMIT ?
+                    )
+                """, (overflow,)).rowcount
+                self._conn.execute("UPDATE sentence_cache_size SET entries = entries - ? WHERE id = 1", (removed,))
+                self.evicted += removed
+
+    def _entries(self) -> int:
+        return self._conn.execute("SELECT entries FROM sentence_cache_size WHERE id = 1").fetchone()[0]
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / total if total else 0.0,
+            "entries": self._entries(),
+            "evicted": self.evicted,
+        }
+
+    def close(self):
+        with self._conn:
+            self._write_touched()
+        self._conn.close()
@@ -0,0 +1,204 @@
+# app/model/summary_worker.py
+"""
+상주 요약 워커.
+KoBERT/토크나이저/형태소 분석기/GPT 클라이언트를 한 번만 로드해 두고,
+summary_jobs 큐(POST /admin/terms/{id}/summarize)에 쌓인 작업을 묶어서 finance_sum 파이프라인으로 처리한다.
+새로 등록/수정된 약관의 요약이 모델 로딩 없이 몇 초 안에 저장된다.
+처리 중에는 작업의 heartbeat를 갱신하고, 대기열이 비면 lease가 끝난(죽은 워커의) 작업을 되찾는다.
+워커를 여러 개 띄워도 서로의 작업을 빼앗지 않는다.
+
+사용 예) BE 폴더에서 API 서버와 함께 실행
+    python app/model/summary_worker.py --batch 16 --poll 1.0
+"""
+import argparse
+import logging
+import os
+import sys
+import threading
+import time
+
+# `python summary_worker.py`로 직접 실행해도 app 패키지를 import 할 수 있도록 BE 경로 추가
+BE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if BE_DIR not in sys.path:
+    sys.path.insert(0, BE_DIR)
+
+from app.model.job_queue import DEFAULT_LEASE_SECONDS, JobQueue
+from app.model.summary_writer import SummaryWriter
+
+DEFAULT_BATCH = 16
+DEFAULT_POLL_SECONDS = 1.0
+
+
+def resolve_db_path(url: str) -> str:
+    """ DATABASE_URL(sqlite:///./term.db 등) → BE 폴더 기준 절대 경로 """
+    path = url
+    for prefix in ("sqlite:///", "sqlite:"):
+        if url.startswith(prefix):
+            path = url[len(prefix):]
+            break
+    return path if os.path.isabs(path) else os.path.abspath(os.path.join(BE_DIR, path))
+
+
+class SummaryWorker:
+    """ 모델/리소스를 들고 있다가 작업 묶음마다 스트리밍 파이프라인을 한 번씩 돌린다 """
+
+    def __init__(self, db_path: str, model, tokenizer, device, tagger, gpt_client,
+                 batch: int = DEFAULT_BATCH, cache=None, lease_seconds: float = DEFAULT_LEASE_SECONDS,
+                 **stage_kwargs):
+        self.db_path = db_path
+        self.model = model
+        self.tokenizer = tokenizer
+        self.device = device
+        self.tagger = tagger
+        self.gpt_client = gpt_client
+        self.batch = batch
+        self.cache = cache
+        self.stage_kwargs = stage_kwargs
+        self.queue = JobQueue(db_path, lease_seconds=lease_seconds)
+        self.writer = SummaryWriter(db_path, flush_size=max(batch, 1))
+        self.processed = 0
+        self.failed = 0
+
+    def run_once(self) -> int:
+        """ 대기 작업을 최대 batch개 처리하고 처리한 작업 수를 반환 (없으면 0) """
+        jobs = self.queue.claim(self.batch)
+        if not jobs:
+            return 0
+        stop = threading.Event()
+        keep_alive = threading.Thread(target=self._heartbeat, args=([job_id for job_id, _ in jobs], stop),
+                                      name="summary-heartbeat", daemon=True)
+        keep_alive.start()
+        try:
+            return self._process(jobs)
+        finally:
+            stop.set()
+            keep_alive.join()
+
+    def _heartbeat(self, job_ids: list[int], stop: threading.Event):
+        """ 처리가 끝날 때까지 lease의 1/3 주기로 heartbeat 갱신 """
+        while not stop.wait(self.queue.lease_seconds / 3):
+            try:
+                self.queue.heartbeat(job_ids)
+            except Exception:
+                logging.exception("작업 heartbeat 갱신 실패")
+
+    def _process(self, jobs: list[tuple[int, int]]) -> int:
+        from app.model.finance_sum import build_summary_stages, get_terms_by_ids
+        from app.model.pipeline import StreamingPipeline
+
+        jobs_by_term: dict[int, list[int]] = {}
+        for job_id, term_id in jobs:
+            jobs_by_term.setdefault(term_id, []).append(job_id)
+
+        terms = get_terms_by_ids(self.db_path, list(jobs_by_term))
+        missing = set(jobs_by_term) - {row[0] for row in terms}
+        if missing:
+            self.queue.finish([j for tid in missing for j in jobs_by_term[tid]], error="약관을 찾을 수 없습니다.")
+
+        saved: set[int] = set()
+        started = time.perf_counter()
+        stages = build_summary_stages(self.model, self.tokenizer, self.device, self.tagger, self.gpt_client,
+                                      self.writer, cache=self.cache, on_saved=saved.add, **self.stage_kwargs)
+        try:
+            StreamingPipeline(terms, stages).run()
+            self.writer.flush()  # 저장이 끝난 뒤에 done으로 표시
+        except Exception as e:
+            logging.exception("요약 작업 처리 중 오류")
+            self.queue.finish([j for tid in jobs_by_term if tid not in missing for j in jobs_by_term[tid]],
+                              error=f"{type(e).__name__}: {e}")
+            self.failed += len(jobs)
+            return len(jobs)
+
+        done = [j for tid in saved for j in jobs_by_term[tid]]
+        failed = [j for tid in jobs_by_term if tid not in saved and tid not in missing for j in jobs_by_term[tid]]
+        self.queue.finish(done)
+        self.queue.finish(failed, error="요약 파이프라인 단계에서 실패했습니다 (워커 로그 확인).")
+        self.processed += len(done)
+        self.failed += len(failed) + sum(len(jobs_by_term[tid]) for tid in missing)
+        logging.info(f"작업 {len(jobs)}건 처리: 완료 {len(done)}, 실패 {len(jobs) - len(done)} "
+                     f"({time.perf_counter() - started:.1f}s)")
+        return len(jobs)
+
+    def recover_stale(self) -> int:
+        """ lease가 끝난 running 작업(죽은 워커가 처리하다 만 작업)을 대기열로 되돌린다 """
+        recovered = self.queue.requeue_running()
+        if recovered:
+            logging.info(f"lease가 끝난 작업 {recovered}건을 대기열로 되돌렸습니다.")
+        return recovered
+
+    def serve(self, poll_seconds: float = DEFAULT_POLL_SECONDS, stop_when_idle: bool = False):
+        self.recover_stale()
+        logging.info(f"요약 작업 대기 중 (batch={self.batch}, poll={poll_seconds}s, "
+                     f"lease={self.queue.lease_seconds:g}s)")
+        while True:
+            if self.run_once():
+                continue  # 밀린 작업이 있으면 쉬지 않고 이어서 처리
+            if self.recover_stale():
+                continue
+            if stop_when_idle:
+                return
+            time.sleep(poll_seconds)
+
+    def close(self):
+        self.writer.close()
+        self.queue.close()
+
+
+if __name__ == "__main__":
+    from dotenv import load_dotenv
+
+    from app.model.backends import BACKENDS
+    from app.model.gpt_stage import DEFAULT_CONCURRENCY, DEFAULT_MAX_RETRIES, DEFAULT_TIMEOUT
+    from app.model.morph import ANALYZERS, DEFAULT_ANALYZER, make_analyzer
+
+    load_dotenv(os.path.join(BE_DIR, ".env"))
+    parser = argparse.ArgumentParser(description="summary_jobs 큐를 처리하는 상주 요약 워커")
+    parser.add_argument("--batch", type=int, default=DEFAULT_BATCH, help="한 번에 꺼내 처리할 작업 수")
+    parser.add_argument("--poll", type=float, default=DEFAULT_POLL_SECONDS, help="대기열이 비었을 때 확인 주기(초)")
+    parser.add_argument("--lease", type=float, default=DEFAULT_LEASE_SECONDS,
+                        help="처리 중 작업의 heartbeat가 이 시간(초) 동안 없으면 다른 워커가 되가져간다")
+    parser.add_argument("--once", action="store_true", help="쌓인 작업만 처리하고 종료합니다.")
+    parser.add_argument("--backend", choices=BACKENDS, default="eager", help="KoBERT 추론 백엔드")
+    parser.add_argument("--analyzer", choices=ANALYZERS, default=DEFAULT_ANALYZER, help="키워드 추출 형태소 분석기")
+    parser.add_argument("--no-sentence-cache", action="store_true", help="문장 점수 캐시를 사용하지 않습니다.")
+    parser.add_argument("--gpt-concurrency", type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument("--gpt-timeout", type=float, default=DEFAULT_TIMEOUT)
+    parser.add_argument("--gpt-retries", type=int, default=DEFAULT_MAX_RETRIES)
+    parser.add_argument("--gpt-base-url", default=os.getenv("OPENAI_BASE_URL"))
+    args = parser.parse_args()
+
+    import torch
+    from app.model.finance_sum import BASE_MODEL_NAME, MAX_SEQ_LEN, default_model_dir, load_summarization_model
+    from app.model.kobert import weights_path
+    from app.model.gpt_stage import make_gpt_client
+    from app.model.sentence_cache import SentenceScoreCache, model_fingerprint
+
+    db_path = resolve_db_path(os.getenv("DATABASE_URL", "sqlite:///./term.db"))
+    model_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "kobert_summarization_model.pth")
+    device = torch.device("cuda" if torch.cuda.is_available() and args.backend == "eager" else "cpu")
+
+    started = time.perf_counter()
+    tokenizer, model = load_summarization_model(model_path, device, backend=args.backend)
+    tagger = make_analyzer(args.analyzer)
+    tagger.nouns_batch(["워밍업"])  # okt의 JVM 기동 등을 첫 작업 전에 끝내 둔다
+    cache = None
+    if not args.no_sentence_cache:
+        cache = SentenceScoreCache(os.path.join(os.path.dirname(model_path), "sentence_cache.db"),
+                                   model_fingerprint(weights_path(model_path, default_model_dir()),
+                                                     BASE_MODEL_NAME, MAX_SEQ_LEN, args.backend))
+    gpt_client = make_gpt_client(api_key=os.getenv("OPENAI_API_KEY"), base_url=args.gpt_base_url,
+                                 timeout=args.gpt_timeout)
+    logging.info(f"모델/리소스 로드 완료 ({time.perf_counter() - started:.1f}s), DB: {db_path}")
+
+    worker = SummaryWorker(db_path, model, tokenizer, device, tagger, gpt_client, batch=args.batch, cache=cache,
+                           lease_seconds=args.lease, gpt_concurrency=args.gpt_concurrency, gpt_timeout=args.gpt_timeout,
+                           gpt_retries=args.gpt_retries)
+    try:
+        worker.serve(poll_seconds=args.poll, stop_when_idle=args.once)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        worker.close()
+        if cache is not None:
+            cache.close()
+        logging.info(f"종료: 완료 {worker.processed}건, 실패 {worker.failed}건")
@@ -0,0 +1,213 @@
+# app/model/summary_writer.py
+"""
+term_summaries 일괄 저장기.
+- 커넥션 1개를 유지하고 스키마 준비는 처음 한 번만 수행
+- 다음 리비전은 정수 컬럼(revision_no)의 MAX 집계로 계산 (term_id, revision_no 인덱스 사용)
+- 모아둔 요약을 트랜잭션 하나에서 executemany로 저장, WAL 모드
+- BEGIN IMMEDIATE로 쓰기 잠금을 먼저 잡은 뒤 리비전을 계산하므로,
+  두 배치가 동시에 돌아도 uq_term_revision(term_id, revision_version) 충돌이 나지 않는다.
+- 같은 트랜잭션에서 약관별 최신 키워드를 term_keywords(term_id, keyword, keyword_norm, rank)로 교체 저장
+  keyword는 표시용 원래 형태("KB STAR CLUB"), keyword_norm은 중복 제거/조회용 소문자 키
+  (키워드 → 약관 조회는 ix_term_keywords_norm 인덱스 사용)
+- 기존 요약으로 term_keywords를 채우는 백필은 backfill_keywords 하나로, 끝나면 schema_meta에 버전을 기록한다
+"""
+import re
+import sqlite3
+import unicodedata
+
+DEFAULT_FLUSH_SIZE = 100
+BUSY_TIMEOUT_MS = 30_000
+_SQL_CHUNK = 500
+MAX_KEYWORD_LEN = 100
+_KEYWORD_SPLIT_RE = re.compile(r"[,\n;/|、，·•]")
+KEYWORDS_BACKFILL_VERSION = 1  # 키워드 저장 형식이 바뀌면 올려서 다시 채운다
+
+
+def normalize_keyword(keyword: str) -> str:
+    """ 저장/표시용 정규화: NFC, 앞뒤 공백 제거, 연속 공백 하나로 (대소문자는 그대로) """
+    keyword = unicodedata.normalize("NFC", keyword or "")
+    return " ".join(keyword.split())[:MAX_KEYWORD_LEN]
+
+
+def keyword_key(keyword: str) -> str:
+    """ 중복 제거/조회용 키 (term_keywords.keyword_norm): normalize_keyword + 영문 소문자 """
+    return normalize_keyword(keyword).lower()
+
+
+def normalize_keywords(keywords) -> list[str]:
+    """
+    키워드 목록(또는 구분자로 이어 붙인 문자열)을 정규화하고 순서를 유지한 채 중복 제거.
+    대소문자만 다른 키워드는 처음 나온 표시 형태를 남긴다.
+    """
+    if isinstance(keywords, str):
+        keywords = _KEYWORD_SPLIT_RE.split(keywords)
+    out: list[str] = []
+    seen: set[str] = set()
+    for k in keywords or []:
+        k = normalize_keyword(k)
+        key = k.lower()
+        if k and key not in seen:
+            seen.add(key)
+            out.append(k)
+    return out
+
+
+def ensure_summary_schema(cur: sqlite3.Cursor):
+    """ term_summaries 테이블/인덱스 생성 + 이전 버전 DB에 없는 컬럼(content_hash, revision_no) 추가 """
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS term_summaries (
+            id               INTEGER      NOT NULL PRIMARY KEY AUTOINCREMENT,
+            term_id          INTEGER      NOT NULL REFERENCES terms (id) ON DELETE CASCADE,
+            revision_version VARCHAR(50)  NOT NULL,
+            summary_text     TEXT,
+            created_at       DATETIME     NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            keywords         TEXT,
+            content_hash     VARCHAR(64),
+            revision_no      INTEGER,
+            CONSTRAINT uq_term_revision UNIQUE(term_id, revision_version)
+        )
+    """)
+    cur.execute("CREATE INDEX IF NOT EXISTS ix_term_summaries_term_id ON term_summaries (term_id)")
+    columns = {row[1] for row in cur.execute("PRAGMA table_info(term_summaries)")}
+    if "content_hash" not in columns:
+        cur.execute("ALTER TABLE term_summaries ADD COLUMN content_hash VARCHAR(64)")
+    if "revision_no" not in columns:
+        cur.execute("ALTER TABLE term_summaries ADD COLUMN revision_no INTEGER")
+    # 'v숫자' 문자열만 있던 기존 행은 정수 리비전을 채워 둔다
+    cur.execute("""
+        UPDATE term_summaries
+        SET revision_no = CAST(SUBSTR(revision_version, 2) AS INTEGER)
+        WHERE revision_no IS NULL AND revision_version LIKE 'v%'
+    """)
+    cur.execute("CREATE INDEX IF NOT EXISTS ix_term_summaries_term_rev_no ON term_summaries (term_id, revision_no)")
+    ensure_keyword_schema(cur)
+
+
+def ensure_keyword_schema(cur: sqlite3.Cursor):
+    """ term_keywords 테이블/인덱스 생성 + backfill_keywords """
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS term_keywords (
+            term_id      INTEGER       NOT NULL REFERENCES terms (id) ON DELETE CASCADE,
+            keyword      VARCHAR(100)  NOT NULL,
+            rank         INTEGER       NOT NULL,
+            keyword_norm VARCHAR(100),
+            PRIMARY KEY (term_id, keyword)
+        )
+    """)
+    columns = {row[1] for row in cur.execute("PRAGMA table_info(term_keywords)")}
+    if "keyword_norm" not in columns:
+        cur.execute("ALTER TABLE term_keywords ADD COLUMN keyword_norm VARCHAR(100)")
+    cur.execute("CREATE INDEX IF NOT EXISTS ix_term_keywords_norm ON term_keywords (keyword_norm, term_id)")
+    backfill_keywords(cur)
+
+
+def backfill_keywords(cur: sqlite3.Cursor):
+    """
+    약관별 최신 요약의 keywords 문자열로 term_keywords를 다시 채운다 (term_keywords/term_summaries가 있어야 함).
+    schema_meta에 현재 버전이 기록돼 있고 keyword_norm이 없는 이전 행(소문자로 저장됨)도 없으면 건너뛴다.
+    "비어 있음"으로 판단하지 않으므로 키워드가 없는 요약만 있는 DB도 시작할 때마다 다시 채우지 않는다.
+    """
+    cur.execute("CREATE TABLE IF NOT EXISTS schema_meta (name TEXT NOT NULL PRIMARY KEY, value INTEGER NOT NULL)")
+    done = cur.execute("SELECT value FROM schema_meta WHERE name = 'term_keywords_backfill'").fetchone()
+    if done is not None and done[0] >= KEYWORDS_BACKFILL_VERSION \
+            and cur.execute("SELECT 1 FROM term_keywords WHERE keyword_norm IS NULL LIMIT 1").fetchone() is None:
+        return
+    cur.execute("DELETE FROM term_keywords")
+    latest = cur.execute("""
+        SELECT term_id, keywords FROM term_summaries
+        WHERE id IN (SELECT MAX(id) FROM term_summaries GROUP BY term_id)
+    """).fetchall()
+    replace_keywords(cur, {term_id: normalize_keywords(raw) for term_id, raw in latest})
+    cur.execute("INSERT OR REPLACE INTO schema_meta (name, value) VALUES ('term_keywords_backfill', ?)",
+                (KEYWORDS_BACKFILL_VERSION,))
+
+
+def replace_keywords(cur: sqlite3.Cursor, keywords_by_term: dict[int, list[str]]):
+    """ 약관별 키워드를 통째로 교체 (keywords는 normalize_keywords를 거친 목록) """
+    if not keywords_by_term:
+        return
+    cur.executemany("DELETE FROM term_keywords WHERE term_id = ?", [(tid,) for tid in keywords_by_term])
+    cur.executemany(
+        "INSERT INTO term_keywords (term_id, keyword, keyword_norm, rank) VALUES (?, ?, ?, ?)",
+        [(tid, kw, kw.lower(), rank) for tid, kws in keywords_by_term.items() for rank, kw in enumerate(kws)],
+    )
+
+
+class SummaryWriter:
+    def __init__(self, db_path: str, flush_size: int = DEFAULT_FLUSH_SIZE):
+        self.db_path = db_path
+        self.flush_size = flush_size
+        self.written = 0
+        self._pending: list[tuple] = []
+
+        # isolation_level=None: 트랜잭션 경계를 직접 BEGIN/COMMIT으로 관리
+        # 파이프라인의 write 단계 스레드에서 사용하므로 check_same_thread=False (한 번에 한 스레드만 사용)
+        self._conn = sqlite3.connect(db_path, isolation_level=None, timeout=BUSY_TIMEOUT_MS / 1000,
+                                     check_same_thread=False)
+        self._conn.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}")
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            ensure_summary_schema(self._conn.cursor())
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+
+    def add(self, term_id: int, summary_text: str, keywords: list[str], content_hash: str | None = None):
+        self._pending.append((term_id, summary_text, ','.join(keywords), content_hash))
+        if len(self._pending) >= self.flush_size:
+            self.flush()
+
+    def _latest_revisions(self, cur: sqlite3.Cursor, term_ids: list[int]) -> dict[int, int]:
+        latest: dict[int, int] = {}
+        for start in range(0, len(term_ids), _SQL_CHUNK):
+            chunk = term_ids[start:start + _SQL_CHUNK]
+            placeholders = ",".join("?" for _ in chunk)
+            cur.execute(f"""
+                SELECT term_id, MAX(revision_no)
+                FROM term_summaries
+                WHERE term_id IN ({placeholders})
+                GROUP BY term_id
+            """, chunk)
+            latest.update((tid, rev or 0) for tid, rev in cur.fetchall())
+        return latest
+
+    def flush(self):
+        """ 모아둔 요약을 한 트랜잭션으로 저장 """
+        if not self._pending:
+            return
+        cur = self._conn.cursor()
+        cur.execute("BEGIN IMMEDIATE")  # 쓰기 잠금 확보 후 리비전 계산
+        try:
+            latest = self._latest_revisions(cur, list({row[0] for row in self._pending}))
+            rows, keywords_by_term = [], {}
+            for term_id, summary_text, keywords_str, content_hash in self._pending:
+                rev = latest.get(term_id, 0) + 1
+                latest[term_id] = rev
+                rows.append((term_id, f"v{rev}", rev, summary_text, keywords_str, content_hash))
+                keywords_by_term[term_id] = normalize_keywords(keywords_str)  # 같은 약관이 여러 번이면 마지막 것
+            cur.executemany("""
+                INSERT INTO term_summaries (term_id, revision_version, revision_no, summary_text, keywords, content_hash)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, rows)
+            replace_keywords(cur, keywords_by_term)
+            cur.execute("COMMIT")
+        except Exception:
+            cur.execute("ROLLBACK")
+            raise
+        self.written += len(self._pending)
+        self._pending.clear()
+
+    def close(self):
+        try:
+            self.flush()
+        finally:
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
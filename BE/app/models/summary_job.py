@@ -0,0 +1,26 @@
+# app/models/summary_job.py
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, Index, func, text
+from app.db.base import Base
+
+class SummaryJob(Base):
+    """ 요약 작업 큐 (처리는 app/model/summary_worker.py, 스키마는 app/model/job_queue.py와 동일) """
+    __tablename__ = "summary_jobs"
+
+    id = Column(Integer, primary_key=True)
+    term_id = Column(Integer, ForeignKey("terms.id", ondelete="CASCADE"), index=True, nullable=False)
+    # 워커(sqlite3)도 같은 테이블에 INSERT 하므로 기본값은 DB 쪽(server_default)에도 둔다
+    status = Column(String(16), nullable=False, default="queued", server_default="queued")  # queued / running / done / failed
+    requested = Column(Integer, nullable=False, default=1, server_default=text("1"))  # 합쳐진 요청 수
+    error = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow, server_default=func.current_timestamp(), nullable=False)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+    heartbeat_at = Column(DateTime, nullable=True)  # 처리 중인 워커의 lease 갱신 시각
+
+    __table_args__ = (
+        Index("ix_summary_jobs_status_id", "status", "id"),
+        # 약관당 대기 작업은 하나 (중복 요청 합치기)
+        Index("ux_summary_jobs_queued_term", "term_id", unique=True,
+              sqlite_where=text("status = 'queued'"), postgresql_where=text("status = 'queued'")),
+    )
@@ -10,3 +10,4 @@ class Term(Base):
     content = Column(Text, nullable=False)
     summary = Column(Text)
     is_active = Column(Integer, nullable=False, default=1)  # 1=활성, 0=삭제(비활성) soft-delete 처리
+    articles_version = Column(Integer, nullable=True)  # term_articles를 만든 파서 버전 (articles.ARTICLES_VERSION)
@@ -0,0 +1,19 @@
+# app/models/term_article.py
+from sqlalchemy import Column, Integer, String, ForeignKey, Index
+from app.db.base import Base
+
+class TermArticle(Base):
+    """ 약관 본문의 조(제N조) 목차. 약관 생성/수정 시 app.model.articles.split_articles로 다시 만든다 """
+    __tablename__ = "term_articles"
+
+    term_id = Column(Integer, ForeignKey("terms.id", ondelete="CASCADE"), primary_key=True)
+    seq = Column(Integer, primary_key=True)           # 본문 내 순서 (0부터)
+    article_no = Column(Integer, nullable=False)      # 제5조의2 → 5
+    article_sub = Column(Integer, nullable=False, default=0)  # 제5조의2 → 2, 없으면 0
+    heading = Column(String(200), nullable=False, default="")
+    start_byte = Column(Integer, nullable=False)      # Term.content의 UTF-8 byte 오프셋 [start, end)
+    end_byte = Column(Integer, nullable=False)
+
+    __table_args__ = (
+        Index("ix_term_articles_no", "term_id", "article_no", "article_sub"),
+    )
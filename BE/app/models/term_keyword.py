@@ -0,0 +1,16 @@
+# app/models/term_keyword.py
+from sqlalchemy import Column, Integer, String, ForeignKey, Index
+from app.db.base import Base
+
+class TermKeyword(Base):
+    """ 약관별 최신 요약의 키워드 (배치 SummaryWriter가 요약 저장 시 교체) """
+    __tablename__ = "term_keywords"
+
+    term_id = Column(Integer, ForeignKey("terms.id", ondelete="CASCADE"), primary_key=True)
+    keyword = Column(String(100), primary_key=True)  # 표시용 (summary_writer.normalize_keyword, 대소문자 유지)
+    rank = Column(Integer, nullable=False)  # 요약에서의 순서 (0부터)
+    keyword_norm = Column(String(100), nullable=True)  # 중복 제거/조회용 키 (summary_writer.keyword_key)
+
+    __table_args__ = (
+        Index("ix_term_keywords_norm", "keyword_norm", "term_id"),
+    )
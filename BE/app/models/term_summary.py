@@ -1,6 +1,6 @@
 # app/models/term_summary.py
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, UniqueConstraint
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, UniqueConstraint, Index
 from sqlalchemy.orm import relationship
 from app.db.base import Base
 
@@ -11,14 +11,17 @@ class TermSummary(Base):
     term_id = Column(Integer, ForeignKey("terms.id", ondelete="CASCADE"), index=True, nullable=False)
 
     revision_version = Column(String(50), nullable=True, index=True)
+    revision_no = Column(Integer, nullable=True)  # revision_version('v3')의 정수값, MAX 집계용
     summary_text = Column(Text, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     keywords = Column(Text, nullable=True)
+    content_hash = Column(String(64), nullable=True)  # 요약 당시 약관 본문 sha256
 
     term = relationship("Term", backref="summaries")
 
     # 유니크 키
     __table_args__ = (
         UniqueConstraint("term_id", "revision_version", name="uq_term_rev"),
+        Index("ix_term_summaries_term_rev_no", "term_id", "revision_no"),
     )
 
@@ -0,0 +1,29 @@
+# app/routers/admin_profiles.py
+
+from fastapi import APIRouter, HTTPException, Depends
+from fastapi.responses import PlainTextResponse
+from typing import List
+from app.core import profiling
+from app.core.auth import require_admin
+
+router = APIRouter(
+    prefix="/admin/profiles",
+    tags=["admin-profiles"],
+    dependencies=[Depends(require_admin)],  # 토큰 인증
+)
+
+@router.get("/", response_model=List[dict])
+async def list_profiles():
+    """관리자: 최근 프로파일 리포트 목록 (X-Profile: 1 또는 ?profile=1 로 요청한 것)"""
+    return profiling.list_reports()
+
+@router.get("/{profile_id}", response_class=PlainTextResponse)
+async def download_profile(profile_id: int):
+    """관리자: 프로파일 리포트 내려받기 (SQL 실행 시간 + cProfile 결과, 텍스트)"""
+    report = profiling.get_report(profile_id)
+    if not report:
+        raise HTTPException(status_code=404, detail="해당 ID의 프로파일을 찾을 수 없습니다 (오래된 리포트는 삭제됨).")
+    return PlainTextResponse(
+        report.render(),
+        headers={"Content-Disposition": f'attachment; filename="profile-{profile_id}.txt"'},
+    )
@@ -1,46 +1,108 @@
 # app/routers/admin_terms.py
 
-from fastapi import APIRouter, HTTPException, Depends
-from typing import List
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from typing import List, Optional
 from app.schemas.term import TermDetail
 from app.schemas.term_admin import TermCreate, TermUpdate, TermOut
+from app.schemas.summary_job import SummaryJobOut
 from app.services import term_service
 from app.core.auth import require_admin
+from app.db.routing import read_primary
+from app.db.session import pool_stats
 
 router = APIRouter(
     prefix="/admin/terms",
     tags=["admin-terms"],
-    dependencies=[Depends(require_admin)],  # 토큰 인증
+    dependencies=[Depends(require_admin), Depends(read_primary)],  # 토큰 인증, 조회는 primary에서 (read-your-writes)
 )
 
 @router.get("/", response_model=List[TermOut])
-def list_all_terms(q: str = ""):
+async def list_all_terms(
+    response: Response,
+    q: str = "",
+    limit: Optional[int] = Query(None, ge=1, le=500, description="페이지 크기 (없으면 전체)"),
+    after_id: Optional[int] = Query(None, description="이전 페이지 마지막 id (X-Next-After-Id 헤더 값)"),
+):
     """관리자: 전체 약관 검색/열람 (활성/비활성 포함)"""
-    return term_service.search_terms(q=q)
+    terms = await term_service.search_terms_async(q=q, limit=limit, after_id=after_id)
+    term_service.set_next_page_header(response, terms, limit)
+    return terms
+
+@router.get("/cache/stats", response_model=dict)
+async def get_cache_stats():
+    """관리자: public 조회 캐시 적중률 등 통계"""
+    return term_service.cache_stats()
+
+@router.get("/db/stats", response_model=dict)
+async def get_db_pool_stats():
+    """관리자: DB 커넥션 풀 현황 (사용 중/overflow/대기 시간/타임아웃)"""
+    return pool_stats()
+
+@router.get("/export")
+async def export_terms(only_active: bool = False):
+    """관리자: 전체 약관을 NDJSON으로 스트리밍 내보내기 (줄마다 id/title/content/is_active)"""
+    return StreamingResponse(
+        term_service.iter_terms_ndjson(only_active=only_active),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="terms.ndjson"'},
+    )
+
+@router.post("/bulk", response_model=dict)
+async def bulk_create_terms(request: Request):
+    """
+    관리자: NDJSON 본문으로 약관 일괄 등록 (줄마다 {"title": ..., "content": ...})
+    응답: {"inserted": n, "ids": [...], "errors": [{"line": 줄 번호, "error": 사유}]}
+    """
+    return await term_service.bulk_create_terms_async(request.stream())
+
+@router.get("/jobs", response_model=List[SummaryJobOut])
+async def list_summary_jobs(
+    status: Optional[str] = Query(None, pattern="^(queued|running|done|failed)$"),
+    limit: int = Query(50, ge=1, le=500),
+):
+    """관리자: 최근 요약 작업 목록"""
+    return await term_service.list_summary_jobs_async(status=status, limit=limit)
+
+@router.get("/jobs/{job_id}", response_model=SummaryJobOut)
+async def get_summary_job(job_id: int):
+    """관리자: 요약 작업 상태 (queued/running/done/failed)"""
+    job = await term_service.get_summary_job_async(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="해당 ID의 작업을 찾을 수 없습니다.")
+    return job
+
+@router.post("/{term_id}/summarize", response_model=SummaryJobOut, status_code=202)
+async def summarize_term(term_id: int):
+    """관리자: 요약 작업 등록 (상주 워커가 처리, 같은 약관의 대기 작업이 있으면 합쳐짐)"""
+    job = await term_service.enqueue_summary_async(term_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="해당 ID의 약관을 찾을 수 없습니다.")
+    return job
 
 @router.get("/{term_id}", response_model=TermDetail)
-def get_admin_term_detail(term_id: int):
+async def get_admin_term_detail(term_id: int):
     # 관리자 상세는 비활성도 조회 가능하게 하려면 is_active 필터 제거된 전용 함수 만들어도 됨
-    term = term_service.get_term_by_id(term_id)  # public 필터(활성만) 쓰면 비활성은 못 봄
+    term = await term_service.get_term_by_id_async(term_id)  # public 필터(활성만) 쓰면 비활성은 못 봄
     if not term:  # 필요하면 admin용 get_admin_term_by_id 구현해서 is_active 무시 가능
         raise HTTPException(status_code=404, detail="해당 ID의 약관을 찾을 수 없습니다.")
     return term
 
 @router.post("/", response_model=dict, status_code=201)
-def create_term(payload: TermCreate):
-    new_id = term_service.create_term(payload)
+async def create_term(payload: TermCreate):
+    new_id = await term_service.create_term_async(payload.model_dump())
     return {"id": new_id}
 
 @router.put("/{term_id}", response_model=dict)
-def update_term(term_id: int, payload: TermUpdate):
-    ok = term_service.update_term(term_id, payload)
+async def update_term(term_id: int, payload: TermUpdate):
+    ok = await term_service.update_term_async(term_id, payload.model_dump(exclude_unset=True))
     if not ok:
         raise HTTPException(status_code=404, detail="해당 ID의 약관을 찾을 수 없습니다.")
     return {"updated": True}
 
 @router.delete("/{term_id}", response_model=dict)
-def delete_term(term_id: int):
-    ok = term_service.delete_term(term_id)
+async def delete_term(term_id: int):
+    ok = await term_service.soft_delete_term_async(term_id)
     if not ok:
         raise HTTPException(status_code=404, detail="해당 ID의 약관을 찾을 수 없습니다.")
     return {"deleted": True}
@@ -0,0 +1,35 @@
+# app/routers/metrics.py
+
+from fastapi import APIRouter, Response
+from app.core import metrics
+from app.db import routing
+from app.db.session import pool_stats
+from app.services import term_service
+
+router = APIRouter(tags=["metrics"])
+
+_CACHE_FIELDS = ("size", "maxsize", "hits", "misses", "evictions", "hit_ratio")
+_POOL_FIELDS = ("size", "checked_out", "overflow", "checkouts", "waits", "wait_avg_ms", "wait_max_ms", "timeouts")
+
+
+def _state_gauges() -> list:
+    """ 수집 시점의 public 조회 캐시 / DB 커넥션 풀 / 읽기 복제본 현황 """
+    cache = term_service.cache_stats()
+    pools = pool_stats()
+    replica = routing.stats()
+    return [
+        metrics.gauge_lines(f"term_cache_{field}", f"public 조회 캐시 {field}", [({}, cache[field])])
+        for field in _CACHE_FIELDS
+    ] + [
+        metrics.gauge_lines(f"db_pool_{field}", f"DB 커넥션 풀 {field}",
+                            [({"engine": name}, stats[field]) for name, stats in pools.items() if field in stats])
+        for field in _POOL_FIELDS
+    ] + [
+        metrics.gauge_lines("db_read_replica_down", "읽기 복제본 폴백 중이면 1",
+                            [({}, int(replica["replica_down"]))] if replica["enabled"] else []),
+    ]
+
+@router.get("/metrics", include_in_schema=False)
+async def read_metrics():
+    """Prometheus 텍스트 형식 지표 (라우트별 지연 시간, SQL 실행 시간, 캐시/풀 현황)"""
+    return Response(metrics.render(_state_gauges()), media_type=metrics.CONTENT_TYPE)
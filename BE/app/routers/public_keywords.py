@@ -0,0 +1,23 @@
+# app/routers/public_keywords.py
+
+from fastapi import APIRouter, Query, Response
+from typing import List, Optional
+from app.schemas.term import TermInList
+from app.services import term_service
+
+router = APIRouter(
+    prefix="/public/keywords",
+    tags=["public-keywords"],
+)
+
+@router.get("/{keyword}/terms", response_model=List[TermInList])
+async def read_terms_by_keyword(
+    keyword: str,
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=500, description="페이지 크기 (없으면 전체)"),
+    after_id: Optional[int] = Query(None, description="이전 페이지 마지막 id (X-Next-After-Id 헤더 값)"),
+):
+    """키워드가 붙은 활성 약관 목록 (요약 키워드 기준)"""
+    terms = await term_service.get_terms_by_keyword_async(keyword, limit=limit, after_id=after_id)
+    term_service.set_next_page_header(response, terms, limit)
+    return terms
@@ -1,8 +1,8 @@
 # app/routers/public_terms.py
 
-from fastapi import APIRouter, HTTPException
-from typing import List
-from app.schemas.term import TermInList, TermDetail, TermSummary
+from fastapi import APIRouter, HTTPException, Query, Response
+from typing import List, Optional
+from app.schemas.term import TermInList, TermDetail, TermSummary, RelatedTerm, TermArticles, TermArticle
 from app.services import term_service
 
 router = APIRouter(
@@ -11,23 +11,53 @@ router = APIRouter(
 )
 
 @router.get("/", response_model=List[TermInList])
-def read_terms_list():
+async def read_terms_list(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=500, description="페이지 크기 (없으면 전체)"),
+    after_id: Optional[int] = Query(None, description="이전 페이지 마지막 id (X-Next-After-Id 헤더 값)"),
+):
     """활성화된 약관의 목록(요약용 메타)"""
     # 필요 시 서비스에서 is_active=1 필터 적용
-    return term_service.get_all_terms(only_active=True)
+    terms = await term_service.get_all_terms_async(only_active=True, limit=limit, after_id=after_id)
+    term_service.set_next_page_header(response, terms, limit)
+    return terms
 
 @router.get("/{term_id}", response_model=TermDetail)
-def read_term_detail(term_id: int):
+async def read_term_detail(term_id: int):
     """특정 약관 전문 (public: 활성 항목만)"""
-    term = term_service.get_term_by_id(term_id, only_active=True)
+    term = await term_service.get_term_by_id_async(term_id, only_active=True)
     if not term:
         raise HTTPException(status_code=404, detail="해당 ID의 약관을 찾을 수 없습니다.")
     return term
 
 @router.get("/{term_id}/summary", response_model=TermSummary)
-def read_term_summary(term_id: int):
+async def read_term_summary(term_id: int):
     """특정 약관의 AI 요약본 (public: 활성 항목만)"""
-    summary = term_service.get_term_summary_by_id(term_id)
+    summary = await term_service.get_term_summary_by_id_async(term_id)
     if summary is None:
         raise HTTPException(status_code=404, detail="해당 ID의 약관을 찾을 수 없습니다.")
     return summary
+
+@router.get("/{term_id}/related", response_model=List[RelatedTerm])
+async def read_related_terms(term_id: int, limit: int = Query(10, ge=1, le=50)):
+    """요약 키워드를 많이 공유하는 다른 활성 약관"""
+    related = await term_service.get_related_terms_async(term_id, limit=limit)
+    if related is None:
+        raise HTTPException(status_code=404, detail="해당 ID의 약관을 찾을 수 없습니다.")
+    return related
+
+@router.get("/{term_id}/articles", response_model=TermArticles)
+async def read_term_articles(term_id: int):
+    """특정 약관의 조(제N조) 목차 (본문 없이 번호/제목만)"""
+    toc = await term_service.get_term_articles_async(term_id)
+    if toc is None:
+        raise HTTPException(status_code=404, detail="해당 ID의 약관을 찾을 수 없습니다.")
+    return toc
+
+@router.get("/{term_id}/articles/{no}", response_model=TermArticle)
+async def read_term_article(term_id: int, no: int, sub: int = Query(0, ge=0, description="제N조의M의 M")):
+    """특정 약관의 조 하나만 (예: /articles/5, 제5조의2는 /articles/5?sub=2)"""
+    article = await term_service.get_term_article_async(term_id, no, sub)
+    if article is None:
+        raise HTTPException(status_code=404, detail="해당 조를 찾을 수 없습니다.")
+    return article
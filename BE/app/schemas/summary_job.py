@@ -0,0 +1,16 @@
+# app/schemas/summary_job.py
+
+from datetime import datetime
+from typing import Optional
+from pydantic import BaseModel
+
+class SummaryJobOut(BaseModel):
+    id: int
+    term_id: int
+    status: str  # queued / running / done / failed
+    requested: int
+    error: Optional[str] = None
+    created_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    coalesced: Optional[bool] = None  # 요약 요청 응답에서만: 이미 대기 중인 작업에 합쳐졌는지
@@ -17,4 +17,31 @@ class TermSummary(BaseModel):
     title: str
     summary: str
     revision_version: Optional[str] = None
-    keywords: Optional[List[str]] = None
\ No newline at end of file
+    keywords: Optional[List[str]] = None
+
+class RelatedTerm(BaseModel):
+    id: int
+    title: str
+    shared: int  # 공유 키워드 수
+    shared_keywords: List[str]
+
+class ArticleInToc(BaseModel):
+    no: int
+    sub: int = 0          # 제5조의2 → 2
+    label: str            # "제5조의2"
+    heading: str          # 괄호 안 제목
+    bytes: int            # 본문 크기 (UTF-8)
+
+class TermArticles(BaseModel):
+    id: int
+    title: str
+    articles: List[ArticleInToc]
+
+class TermArticle(BaseModel):
+    id: int
+    title: str
+    no: int
+    sub: int = 0
+    label: str
+    heading: str
+    content: str
@@ -23,3 +23,5 @@ class TermOut(BaseModel):
     is_active: int
     created_at: Optional[str] = None
     updated_at: Optional[str] = None
+    content: Optional[str] = None  # 본문 앞부분 미리보기 (목록용, 전문은 상세 조회)
+    snippet: Optional[str] = None  # 검색 시 본문에서 검색어 주변 (<mark>로 강조)
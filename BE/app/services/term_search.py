@@ -0,0 +1,212 @@
+# app/services/term_search.py
+"""
+관리자 약관 검색용 전문(full-text) 인덱스.
+- SQLite FTS5 가상 테이블 terms_fts(rowid = terms.id)
+- 한국어는 띄어쓰기 단위가 길고 조사가 붙으므로 단어를 2글자 n-gram(bigram)으로 쪼개 색인한다.
+  예) "이용약관에" → "이용 용약 약관 관에"
+  검색어 전체도 같은 방식으로 쪼개 하나의 구(phrase)로 검색하므로 LIKE '%검색어%'와 같은 부분 일치가 된다.
+  여러 단어면 단어 순서와 인접도 지켜야 한다 ("이용 약관"은 "약관 ... 이용"과 맞지 않음).
+  차이: 단어 사이의 공백/문장부호는 구분하지 않는다 ("이용, 약관"도 "이용 약관"으로 찾음)
+- bm25 점수로 정렬 (제목 가중치가 더 큼)
+- 색인한 약관마다 제목+본문 해시를 terms_fts_docs에 둔다. 시작 시 terms와 해시를 비교해
+  ORM 밖(다른 프로세스, SQL 직접 수정)에서 바뀐 약관만 다시 색인한다 (건수가 같아도 내용이 다르면 찾아냄)
+- SQLite가 아니거나 FTS5가 없거나 1글자 단어가 있는 검색어면 None을 돌려주고, 호출 쪽에서 LIKE 검색으로 대체한다.
+"""
+import hashlib
+import html
+import logging
+import re
+from typing import List, Optional
+
+from sqlalchemy import bindparam, event, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from app.models.term import Term
+
+TITLE_WEIGHT = 10.0
+CONTENT_WEIGHT = 1.0
+SNIPPET_WIDTH = 40  # 하이라이트 앞뒤로 보여줄 글자 수
+FTS_VERSION = 1     # 색인 방식(ngram_text)을 바꾸면 올린다 → 해시가 달라져 전체 재색인
+SYNC_BATCH_SIZE = 500
+
+_fts_ready = False
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def ngram_text(value: str, n: int = 2) -> str:
+    """ 단어마다 n글자씩 겹쳐 자른 토큰을 공백으로 이어 붙인다 (n글자 미만 단어는 그대로) """
+    tokens: List[str] = []
+    for word in _WORD_RE.findall((value or "").lower()):
+        if len(word) <= n:
+            tokens.append(word)
+        else:
+            tokens.extend(word[i:i + n] for i in range(len(word) - n + 1))
+    return " ".join(tokens)
+
+
+def build_match_query(q: str) -> Optional[str]:
+    """
+    검색어를 FTS5 MATCH 식으로 변환. 검색어 전체의 bigram을 하나의 구(phrase)로 묶는다 (LIKE '%q%'와 같은 의미).
+    1글자 단어가 있으면 bigram으로 찾을 수 없으므로 None (LIKE로 대체)
+    """
+    words = _WORD_RE.findall((q or "").lower())
+    if not words or any(len(w) < 2 for w in words):
+        return None
+    return f'"{ngram_text(q)}"'
+
+
+def doc_hash(title: Optional[str], content: Optional[str]) -> str:
+    """ 색인한 내용의 해시 (terms_fts_docs). 색인 방식이 바뀌면 FTS_VERSION으로 달라진다 """
+    value = f"{FTS_VERSION}\0{title or ''}\0{content or ''}"
+    return hashlib.blake2b(value.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def is_enabled() -> bool:
+    return _fts_ready
+
+
+def ensure_fts_index(engine: Engine) -> bool:
+    """
+    terms_fts 테이블을 만들고, 내용이 terms와 다른 약관만 다시 색인한다 (sync_index).
+    SQLite가 아니거나 FTS5를 쓸 수 없으면 False (LIKE 검색 사용)
+    """
+    global _fts_ready
+    if engine.dialect.name != "sqlite":
+        _fts_ready = False
+        return False
+    try:
+        with engine.begin() as conn:
+            conn.execute(text(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS terms_fts USING fts5(title, content, tokenize='unicode61')"
+            ))
+            conn.execute(text("CREATE TABLE IF NOT EXISTS terms_fts_docs (id INTEGER PRIMARY KEY, hash TEXT NOT NULL)"))
+            changed = sync_index(conn)
+            if changed:
+                logging.info(f"FTS 인덱스: 내용이 바뀐 약관 {changed}건을 다시 색인했습니다.")
+    except OperationalError as e:
+        logging.warning(f"FTS5 인덱스를 사용할 수 없어 LIKE 검색을 사용합니다: {e}")
+        _fts_ready = False
+        return False
+    _fts_ready = True
+    return True
+
+
+def sync_index(conn: Connection) -> int:
+    """
+    terms와 색인 해시(terms_fts_docs)를 비교해 바뀌거나 새로 생긴 약관은 다시 색인하고, 없어진 약관은 지운다.
+    본문은 해시 계산에만 한 번 읽고, 다시 색인할 약관만 SYNC_BATCH_SIZE개씩 다시 읽는다. 다시 색인한 건수 반환
+    """
+    indexed = dict(conn.execute(text("SELECT id, hash FROM terms_fts_docs")).fetchall())
+    changed: List[int] = []
+    for term_id, title, content in conn.execute(text("SELECT id, title, content FROM terms")):
+        if indexed.pop(term_id, None) != doc_hash(title, content):
+            changed.append(term_id)
+    for term_id in indexed:  # 남은 것은 terms에서 지워진 약관
+        unindex_term(conn, term_id)
+    # 해시 없이 색인된 행(이전 버전의 색인, 해시 기록 전에 지워진 약관)도 정리
+    conn.execute(text("DELETE FROM terms_fts WHERE rowid NOT IN (SELECT id FROM terms)"))
+    for i in range(0, len(changed), SYNC_BATCH_SIZE):
+        rows = conn.execute(text("SELECT id, title, content FROM terms WHERE id IN :ids")
+                            .bindparams(bindparam("ids", expanding=True)),
+                            {"ids": changed[i:i + SYNC_BATCH_SIZE]}).fetchall()
+        index_terms(conn, rows)
+    return len(changed)
+
+
+def rebuild_index(conn: Connection):
+    conn.execute(text("DELETE FROM terms_fts"))
+    conn.execute(text("DELETE FROM terms_fts_docs"))
+    rows = conn.execute(text("SELECT id, title, content FROM terms")).fetchall()
+    index_terms(conn, rows)
+
+
+def index_terms(conn: Connection, rows):
+    """ (id, title, content) 목록을 색인 (이미 있으면 교체) """
+    rows = list(rows)
+    if not rows:
+        return
+    conn.execute(text("DELETE FROM terms_fts WHERE rowid = :id"), [{"id": r[0]} for r in rows])
+    conn.execute(
+        text("INSERT INTO terms_fts (rowid, title, content) VALUES (:id, :title, :content)"),
+        [{"id": r[0], "title": ngram_text(r[1]), "content": ngram_text(r[2])} for r in rows],
+    )
+    conn.execute(
+        text("INSERT OR REPLACE INTO terms_fts_docs (id, hash) VALUES (:id, :hash)"),
+        [{"id": r[0], "hash": doc_hash(r[1], r[2])} for r in rows],
+    )
+
+
+def unindex_term(conn: Connection, term_id: int):
+    conn.execute(text("DELETE FROM terms_fts WHERE rowid = :id"), {"id": term_id})
+    conn.execute(text("DELETE FROM terms_fts_docs WHERE id = :id"), {"id": term_id})
+
+
+# ORM으로 terms가 바뀌면 같은 트랜잭션 안에서 색인도 갱신
+@event.listens_for(Term, "after_insert")
+@event.listens_for(Term, "after_update")
+def _on_term_saved(mapper, connection, target):
+    if _fts_ready:
+        index_terms(connection, [(target.id, target.title, target.content)])
+
+
+@event.listens_for(Term, "after_delete")
+def _on_term_deleted(mapper, connection, target):
+    if _fts_ready:
+        unindex_term(connection, target.id)
+
+
+def search_ids(db: Session, q: str, limit: Optional[int] = None,
+               after_id: Optional[int] = None) -> Optional[List[int]]:
+    """
+    관련도 순 약관 id 목록. FTS를 쓸 수 없는 검색이면 None
+    페이지는 (bm25 점수, rowid) keyset으로 자른다. after_id는 이전 페이지 마지막 id이고,
+    그 행의 점수를 같은 MATCH로 다시 구해 그 뒤부터 이어 준다.
+    커서 행이 더 이상 검색되지 않으면(삭제/수정) 이어 볼 위치가 없으므로 빈 목록을 돌려준다.
+    """
+    match = build_match_query(q)
+    if not _fts_ready or match is None:
+        return None
+    score = f"bm25(terms_fts, {TITLE_WEIGHT}, {CONTENT_WEIGHT})"
+    params = {"match": match}
+    sql = f"SELECT rowid, {score} AS score FROM terms_fts WHERE terms_fts MATCH :match"
+    if after_id is not None:
+        cursor = db.execute(text(f"SELECT {score} FROM terms_fts WHERE terms_fts MATCH :match AND rowid = :after_id"),
+                            {"match": match, "after_id": after_id}).first()
+        if cursor is None:
+            return []
+        # 점수가 같으면 id 내림차순 (목록 화면과 같은 방향)
+        sql = (f"SELECT rowid FROM ({sql}) WHERE score > :after_score "
+               "OR (score = :after_score AND rowid < :after_id)")
+        params.update(after_score=cursor[0], after_id=after_id)
+    sql += " ORDER BY score, rowid DESC"
+    if limit is not None:
+        sql += " LIMIT :limit"
+        params["limit"] = limit
+    return [r[0] for r in db.execute(text(sql), params)]
+
+
+def make_snippet(value: str, q: str, width: int = SNIPPET_WIDTH) -> Optional[str]:
+    """ 원문에서 검색어가 처음 나오는 위치 주변을 잘라 <mark>로 강조 (HTML escape 처리) """
+    if not value or not q:
+        return None
+    words = sorted({w for w in _WORD_RE.findall(q.lower())}, key=len, reverse=True)
+    if not words:
+        return None
+    pattern = re.compile("|".join(re.escape(w) for w in words), re.IGNORECASE)
+    first = pattern.search(value)
+    if first is None:
+        return None
+    start = max(0, first.start() - width)
+    end = min(len(value), first.end() + width)
+    window = value[start:end]
+
+    out, pos = [], 0
+    for m in pattern.finditer(window):
+        out.append(html.escape(window[pos:m.start()]))
+        out.append(f"<mark>{html.escape(m.group(0))}</mark>")
+        pos = m.end()
+    out.append(html.escape(window[pos:]))
+    snippet = "".join(out).replace("\n", " ")
+    return ("…" if start > 0 else "") + snippet + ("…" if end < len(value) else "")
@@ -1,11 +1,38 @@
 # app/services/term_service.py
-from typing import List, Dict, Any, Optional
+"""
+약관 조회/관리 서비스.
+각 조회/수정 로직은 Session을 받는 내부 함수(_load_xxx, _xxx)로 한 번만 구현하고,
+- 동기 함수(get_all_terms 등): SessionLocal로 바로 실행 (배치/스크립트용)
+- 비동기 함수(get_all_terms_async 등): 라우터용.
+  DB_ASYNC=1이면 비동기 엔진 세션의 run_sync로, 아니면 동기 세션을 스레드풀에서 실행한다.
+- public 목록/상세/요약 조회는 DATABASE_READ_URL이 있으면 읽기 복제본에서 (_run_read, app.db.routing)
+"""
+from typing import List, Dict, Any, Optional, Callable, AsyncIterator, Iterator, Set, Tuple
+import asyncio
+import json
+import logging
 import re
-from sqlalchemy.orm import Session
-from sqlalchemy import or_
-from app.db.session import SessionLocal
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy import or_, func, case, cast, select, insert, update, delete, Text, LargeBinary
+from sqlalchemy.exc import IntegrityError
+from app.core.cache import TTLCache
+from app.core.profiling import bypass_cache, profiled
+from app.core.config import (
+    TERM_CACHE_SIZE, TERM_CACHE_TTL, DB_ASYNC, TERM_BULK_BATCH_SIZE, TERM_EXPORT_CHUNK_SIZE,
+)
+from app.db import routing
+from app.db.session import SessionLocal, AsyncSessionLocal, ReadSessionLocal, AsyncReadSessionLocal, engine
+from app.model.articles import ARTICLES_VERSION, article_rows
+from app.model.summary_writer import keyword_key
 from app.models.term import Term
+from app.models.summary_job import SummaryJob
+from app.models.term_article import TermArticle
+from app.models.term_keyword import TermKeyword
 from app.models.term_summary import TermSummary
+from app.services import term_search
+
+logger = logging.getLogger(__name__)
 
 # 첫 실행 편의를 위한 시드
 _FAKE = {
@@ -14,7 +41,89 @@ _FAKE = {
 }
 
 
+PREVIEW_CHARS = 200  # 관리자 목록 미리보기 글자 수
+
+# public 조회 결과 캐시
+# 키: ("list", only_active, limit, after_id) / ("detail", term_id, only_active) / ("summary", term_id)
+#     ("keyword", keyword, limit, after_id) / ("related", term_id, limit)
+#     ("toc", term_id) / ("article", term_id, no, sub)
+# 관리자 프로파일링 요청은 캐시를 거치지 않고 DB에서 읽는다 (리포트가 비지 않도록)
+_cache = TTLCache(maxsize=TERM_CACHE_SIZE, ttl=TERM_CACHE_TTL, bypass=bypass_cache)
+
+
+def _invalidate_term(term_id: Optional[int] = None):
+    """ 약관 생성/수정/삭제 시 목록(모든 페이지)/키워드 조회 + 해당 약관의 상세/요약 캐시 무효화 """
+    routing.mark_written(term_id)
+    _cache.invalidate_where(lambda key: key[0] in ("list", "keyword", "related"))
+    if term_id is not None:
+        _cache.invalidate(("detail", term_id, True), ("detail", term_id, False), ("summary", term_id), ("toc", term_id))
+        _cache.invalidate_where(lambda key: key[0] == "article" and key[1] == term_id)
+
+
+def invalidate_term_summary(term_id: int):
+    """
+    새 요약이 저장(커밋)된 뒤 호출.
+    요약은 배치 스크립트/요약 워커가 다른 프로세스에서 sqlite3로 저장하므로 이 프로세스는 저장 시점을 모른다.
+    워커가 끝낸 작업은 watch_summary_jobs가 찾아 이 함수를 부르고, 작업 큐를 거치지 않은 배치 실행의 요약은
+    TERM_CACHE_TTL이 지나야 반영된다.
+    """
+    routing.mark_written(term_id)
+    _cache.invalidate(("summary", term_id))
+    _cache.invalidate_where(lambda key: key[0] in ("keyword", "related"))
+
+
+def cache_stats() -> Dict[str, Any]:
+    return _cache.stats()
+
+
+def _run(fn: Callable, *args) -> Any:
+    """ 동기 세션으로 fn(db, *args) 실행 """
+    with SessionLocal() as db:
+        return fn(db, *args)
+
+
+async def _run_async(fn: Callable, *args) -> Any:
+    """ 라우터용: 비동기 엔진이 켜져 있으면 run_sync로, 아니면 스레드풀에서 fn(db, *args) 실행 """
+    fn = profiled(fn)  # 관리자 프로파일링 요청일 때만 cProfile로 측정
+    if DB_ASYNC:
+        async with AsyncSessionLocal() as db:
+            return await db.run_sync(fn, *args)
+    return await run_in_threadpool(_run, fn, *args)
+
+
+def _run_replica(fn: Callable, *args) -> Any:
+    with ReadSessionLocal() as db:
+        return fn(db, *args)
+
+
+def _run_read(fn: Callable, *args, term_id: Optional[int] = None) -> Any:
+    """ public 조회용 _run: replica를 쓸 수 있으면 replica에서, 오류가 나면 primary에서 다시 실행 """
+    if not routing.use_replica(term_id):
+        return _run(fn, *args)
+    try:
+        return _run_replica(fn, *args)
+    except routing.REPLICA_ERRORS as e:
+        routing.replica_failed(e)
+        return _run(fn, *args)
+
+
+async def _run_read_async(fn: Callable, *args, term_id: Optional[int] = None) -> Any:
+    """ public 조회용 _run_async (replica 선택/폴백은 _run_read와 같음) """
+    if not routing.use_replica(term_id):
+        return await _run_async(fn, *args)
+    try:
+        if DB_ASYNC:
+            async with AsyncReadSessionLocal() as db:
+                return await db.run_sync(profiled(fn), *args)
+        return await run_in_threadpool(_run_replica, profiled(fn), *args)
+    except routing.REPLICA_ERRORS as e:
+        routing.replica_failed(e)
+        return await _run_async(fn, *args)
+
+
 def _seed_if_empty(db: Session):
+    if db.info.get("replica"):
+        return  # 복제본에는 쓰지 않는다 (primary가 비어 있으면 primary 조회에서 시드)
     if db.query(Term).count() == 0:
         for t in _FAKE.values():
             db.add(Term(id=t["id"], title=t["title"], content=t["content"]))
@@ -23,143 +132,529 @@ def _seed_if_empty(db: Session):
 # -----------------------
 # Public: 목록(제목만), 상세, 요약
 # -----------------------
-def get_all_terms(only_active: bool = True) -> List[Dict[str, Any]]:
-    with SessionLocal() as db:
-        _seed_if_empty(db)
-        if only_active and hasattr(Term, "is_active"):
-            q = q.filter(Term.is_active == 1)
-        rows = db.query(Term.id, Term.title).order_by(Term.id.desc()).all()
-        return [{"id": r[0], "title": r[1]} for r in rows]
+def get_all_terms(only_active: bool = True, limit: Optional[int] = None,
+                  after_id: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    id 내림차순 목록. limit을 주면 keyset 페이지네이션:
+    after_id(이전 페이지 마지막 id)보다 작은 id부터 limit개
+    """
+    return _cache.get_or_load(("list", only_active, limit, after_id),
+                              lambda: _run_read(_load_all_terms, only_active, limit, after_id))
+
+async def get_all_terms_async(only_active: bool = True, limit: Optional[int] = None,
+                              after_id: Optional[int] = None) -> List[Dict[str, Any]]:
+    return await _cache.aget_or_load(("list", only_active, limit, after_id),
+                                     lambda: _run_read_async(_load_all_terms, only_active, limit, after_id))
+
+def _load_all_terms(db: Session, only_active: bool, limit: Optional[int],
+                    after_id: Optional[int]) -> List[Dict[str, Any]]:
+    _seed_if_empty(db)
+    q = db.query(Term.id, Term.title)
+    if only_active and hasattr(Term, "is_active"):
+        q = q.filter(Term.is_active == 1)
+    if after_id is not None:
+        q = q.filter(Term.id < after_id)
+    q = q.order_by(Term.id.desc())
+    if limit is not None:
+        q = q.limit(limit)
+    return [{"id": r[0], "title": r[1]} for r in q.all()]
 
 def get_term_by_id(term_id: int, only_active: bool = True) -> Optional[Dict[str, Any]]:
-    with SessionLocal() as db:
-        _seed_if_empty(db)
-        q= db.query(Term).filter(Term.id == term_id)
-        if only_active and hasattr(Term, "is_active"):
-            q = q.filter(Term.is_active == 1)
-        row = q.first()
-        if not row:
-            return None
-        return {"id": row.id, "title": row.title, "content": row.content}
+    return _cache.get_or_load(("detail", term_id, only_active),
+                              lambda: _run_read(_load_term_by_id, term_id, only_active, term_id=term_id))
+
+async def get_term_by_id_async(term_id: int, only_active: bool = True) -> Optional[Dict[str, Any]]:
+    return await _cache.aget_or_load(("detail", term_id, only_active),
+                                     lambda: _run_read_async(_load_term_by_id, term_id, only_active, term_id=term_id))
+
+def _load_term_by_id(db: Session, term_id: int, only_active: bool) -> Optional[Dict[str, Any]]:
+    _seed_if_empty(db)
+    q= db.query(Term).filter(Term.id == term_id)
+    if only_active and hasattr(Term, "is_active"):
+        q = q.filter(Term.is_active == 1)
+    row = q.first()
+    if not row:
+        return None
+    return {"id": row.id, "title": row.title, "content": row.content}
 
 
 def get_term_summary_by_id(term_id: int) -> Optional[Dict[str, Any]]:
-    print("### THIS FUNCTION IS RUNNING ###")
+    return _cache.get_or_load(("summary", term_id),
+                              lambda: _run_read(_load_term_summary_by_id, term_id, term_id=term_id))
 
+async def get_term_summary_by_id_async(term_id: int) -> Optional[Dict[str, Any]]:
+    return await _cache.aget_or_load(("summary", term_id),
+                                     lambda: _run_read_async(_load_term_summary_by_id, term_id, term_id=term_id))
+
+def _load_term_summary_by_id(db: Session, term_id: int) -> Optional[Dict[str, Any]]:
     """
     term_summaries에서 이미 생성된 요약만 조회한다.
     - Term.revision_version이 있으면 해당 버전으로 필터
     - 없으면 term_id 기준 최신(created_at DESC) 1건
     - 없으면 None 반환 (라우터에서 404 처리)
     """
-    with SessionLocal() as db:
-        _seed_if_empty(db)
+    _seed_if_empty(db)
+
+    term = db.query(Term).filter(Term.id == term_id).first()
+    if not term:
+        return None
 
-        term = db.query(Term).filter(Term.id == term_id).first()
-        if not term:
-            return None
+    # Term에 revision_version 필드가 있으면 그 값으로 요약 선택
+    rev = getattr(term, "revision_version", None)
 
-        # Term에 revision_version 필드가 있으면 그 값으로 요약 선택
-        rev = getattr(term, "revision_version", None)
+    q = db.query(TermSummary).filter(TermSummary.term_id == term_id)
+    if rev is not None:
+        q = q.filter(TermSummary.revision_version == rev)
 
-        q = db.query(TermSummary).filter(TermSummary.term_id == term_id)
-        if rev is not None:
-            q = q.filter(TermSummary.revision_version == rev)
+    row = q.order_by(TermSummary.created_at.desc()).first()
+    if row is None:
+        return None
 
-        row = q.order_by(TermSummary.created_at.desc()).first()
-        if row is None:
-            return None
-        
-        # keywords 문자열 → 리스트 변환
+    # 정규화된 term_keywords를 순서대로 사용, 없으면(이전 데이터) keywords 문자열 분리
+    keywords_list = [kw for (kw,) in db.query(TermKeyword.keyword)
+                     .filter(TermKeyword.term_id == term_id).order_by(TermKeyword.rank)]
+    if not keywords_list:
         raw_keywords = (getattr(row, "keywords", "") or "").strip()
         keywords_list = [
             k.strip() for k in re.split(r"[,\n;/|、，·•]", raw_keywords) if k.strip()
         ]
 
-        print("KW from DB:", row.keywords)
-        return {
-            "id": term.id,
-            "title": f"{term.title} (요약)",
-            "summary": row.summary_text or "",
-            "revision_version": getattr(row, "revision_version", None),
-            "keywords": keywords_list,
-        }
-    
+    logger.debug("summary loaded term_id=%s summary_id=%s keywords=%d", term_id, row.id, len(keywords_list))
+    return {
+        "id": term.id,
+        "title": f"{term.title} (요약)",
+        "summary": row.summary_text or "",
+        "revision_version": getattr(row, "revision_version", None),
+        "keywords": keywords_list,
+    }
+
+
+def get_term_articles(term_id: int) -> Optional[Dict[str, Any]]:
+    return _cache.get_or_load(("toc", term_id), lambda: _run(_load_term_articles, term_id))
+
+async def get_term_articles_async(term_id: int) -> Optional[Dict[str, Any]]:
+    return await _cache.aget_or_load(("toc", term_id), lambda: _run_async(_load_term_articles, term_id))
+
+def _load_term_articles(db: Session, term_id: int) -> Optional[Dict[str, Any]]:
+    """ 활성 약관의 조 목차 (본문 없이 번호/제목/크기만). 약관이 없으면 None """
+    term = db.query(Term.id, Term.title).filter(Term.id == term_id, Term.is_active == 1).first()
+    if not term:
+        return None
+    rows = (db.query(TermArticle.article_no, TermArticle.article_sub, TermArticle.heading,
+                     TermArticle.start_byte, TermArticle.end_byte)
+            .filter(TermArticle.term_id == term_id).order_by(TermArticle.seq).all())
+    return {
+        "id": term.id,
+        "title": term.title,
+        "articles": [{"no": r.article_no, "sub": r.article_sub, "label": _article_label(r.article_no, r.article_sub),
+                      "heading": r.heading, "bytes": r.end_byte - r.start_byte} for r in rows],
+    }
+
+def get_term_article(term_id: int, no: int, sub: int = 0) -> Optional[Dict[str, Any]]:
+    return _cache.get_or_load(("article", term_id, no, sub), lambda: _run(_load_term_article, term_id, no, sub))
+
+async def get_term_article_async(term_id: int, no: int, sub: int = 0) -> Optional[Dict[str, Any]]:
+    return await _cache.aget_or_load(("article", term_id, no, sub),
+                                     lambda: _run_async(_load_term_article, term_id, no, sub))
+
+def _load_term_article(db: Session, term_id: int, no: int, sub: int) -> Optional[Dict[str, Any]]:
+    """ 조 하나의 본문만 읽는다 (DB에서 byte 범위만 잘라 오므로 전체 본문을 가져오지 않음) """
+    body = func.substr(cast(Term.content, LargeBinary), TermArticle.start_byte + 1,
+                       TermArticle.end_byte - TermArticle.start_byte, type_=LargeBinary)
+    row = (db.query(Term.title, TermArticle.heading, body)
+           .join(TermArticle, TermArticle.term_id == Term.id)
+           .filter(Term.id == term_id, Term.is_active == 1,
+                   TermArticle.article_no == no, TermArticle.article_sub == sub)
+           .order_by(TermArticle.seq).first())
+    if not row:
+        return None
+    return {"id": term_id, "title": row[0], "no": no, "sub": sub, "label": _article_label(no, sub),
+            "heading": row[1], "content": bytes(row[2] or b"").decode("utf-8", errors="replace")}
+
+def _article_label(no: int, sub: int) -> str:
+    return f"제{no}조" + (f"의{sub}" if sub else "")
+
+def _store_articles(db: Session, term_id: int, content: str):
+    """ 본문이 저장/변경될 때 조 목차를 다시 만든다 (같은 트랜잭션) """
+    db.execute(delete(TermArticle).where(TermArticle.term_id == term_id))
+    rows = article_rows(term_id, content)
+    if rows:
+        db.execute(insert(TermArticle), rows)
+    db.execute(update(Term).where(Term.id == term_id).values(articles_version=ARTICLES_VERSION))
+
+
+def get_terms_by_keyword(keyword: str, limit: Optional[int] = None,
+                         after_id: Optional[int] = None) -> List[Dict[str, Any]]:
+    """ 키워드가 붙은 활성 약관 목록 (id 내림차순, keyset 페이지네이션) """
+    kw = keyword_key(keyword)
+    return _cache.get_or_load(("keyword", kw, limit, after_id),
+                              lambda: _run(_load_terms_by_keyword, kw, limit, after_id))
+
+async def get_terms_by_keyword_async(keyword: str, limit: Optional[int] = None,
+                                     after_id: Optional[int] = None) -> List[Dict[str, Any]]:
+    kw = keyword_key(keyword)
+    return await _cache.aget_or_load(("keyword", kw, limit, after_id),
+                                     lambda: _run_async(_load_terms_by_keyword, kw, limit, after_id))
+
+def _load_terms_by_keyword(db: Session, kw: str, limit: Optional[int],
+                           after_id: Optional[int]) -> List[Dict[str, Any]]:
+    # ix_term_keywords_norm(keyword_norm, term_id) 인덱스만으로 후보를 찾고 terms는 PK로 조인
+    q = (db.query(Term.id, Term.title)
+         .join(TermKeyword, TermKeyword.term_id == Term.id)
+         .filter(TermKeyword.keyword_norm == kw, Term.is_active == 1))
+    if after_id is not None:
+        q = q.filter(Term.id < after_id)
+    q = q.order_by(Term.id.desc())
+    if limit is not None:
+        q = q.limit(limit)
+    return [{"id": r[0], "title": r[1]} for r in q.all()]
+
+
+def get_related_terms(term_id: int, limit: int = 10) -> Optional[List[Dict[str, Any]]]:
+    """ 키워드를 많이 공유하는 활성 약관 순 (약관이 없으면 None) """
+    return _cache.get_or_load(("related", term_id, limit), lambda: _run(_load_related_terms, term_id, limit))
+
+async def get_related_terms_async(term_id: int, limit: int = 10) -> Optional[List[Dict[str, Any]]]:
+    return await _cache.aget_or_load(("related", term_id, limit),
+                                     lambda: _run_async(_load_related_terms, term_id, limit))
+
+def _load_related_terms(db: Session, term_id: int, limit: int) -> Optional[List[Dict[str, Any]]]:
+    if db.query(Term.id).filter(Term.id == term_id, Term.is_active == 1).first() is None:
+        return None
+    mine = db.query(TermKeyword.keyword_norm).filter(TermKeyword.term_id == term_id).subquery()
+    other = aliased(TermKeyword)
+    shared = func.count().label("shared")
+    rows = (db.query(Term.id, Term.title, shared)
+            .join(other, other.term_id == Term.id)
+            .filter(other.keyword_norm.in_(select(mine.c.keyword_norm)), Term.id != term_id, Term.is_active == 1)
+            .group_by(Term.id, Term.title)
+            .order_by(shared.desc(), Term.id.desc())
+            .limit(limit)
+            .all())
+    if not rows:
+        return []
+
+    # 공유 키워드 목록은 결과 약관들에 대해서만 PK 인덱스로 조회
+    shared_kw: Dict[int, List[str]] = {r.id: [] for r in rows}
+    for tid, kw in (db.query(other.term_id, other.keyword)
+                    .filter(other.term_id.in_(list(shared_kw)), other.keyword_norm.in_(select(mine.c.keyword_norm)))
+                    .order_by(other.term_id, other.rank)):
+        shared_kw[tid].append(kw)
+    return [{"id": r.id, "title": r.title, "shared": r.shared, "shared_keywords": shared_kw[r.id]} for r in rows]
+
 # -----------------------
 # Admin: 검색/목록, 생성, 수정, 삭제
 # -----------------------
-def search_terms(q: str = "") -> List[Dict[str, Any]]:
+def set_next_page_header(response, rows: List[Dict[str, Any]], limit: Optional[int]):
+    """ 페이지가 꽉 찼으면 다음 페이지 요청에 쓸 after_id를 X-Next-After-Id 헤더로 알려준다 """
+    if limit is not None and len(rows) == limit:
+        response.headers["X-Next-After-Id"] = str(rows[-1]["id"])
+
+
+def _preview_column():
+    """ content 앞부분만 SQL(substr)에서 잘라 온다 (본문 전체를 읽어 오지 않도록) """
+    head = func.substr(Term.content, 1, PREVIEW_CHARS, type_=Text)
+    return case((func.length(Term.content) > PREVIEW_CHARS, head + "…"), else_=head).label("preview")
+
+
+def search_terms(q: str = "", limit: Optional[int] = None, after_id: Optional[int] = None) -> List[Dict[str, Any]]:
     """
     관리자 목록: 현재 스키마(id, title, content)에 맞춘 최소 구현.
-    - q가 있으면 title/content LIKE 검색
-    - content는 미리보기 일부만 잘라서 반환
+    - q가 있으면 FTS5 bigram 인덱스로 관련도 순 검색 (사용 불가 시 title/content LIKE 검색)
+    - limit을 주면 keyset 페이지네이션 (after_id = 이전 페이지 마지막 id)
+      FTS 검색은 관련도 순서를 유지한 채 after_id 행 다음부터, 그 외에는 after_id보다 작은 id부터
+    - content는 SQL에서 앞 PREVIEW_CHARS자만 잘라 오고, 검색 시 snippet에 검색어 강조
     """
-    with SessionLocal() as db:
-        _seed_if_empty(db)
-        query = db.query(Term).order_by(Term.id.desc())
+    return _run(_search_terms, q, limit, after_id)
+
+async def search_terms_async(q: str = "", limit: Optional[int] = None,
+                             after_id: Optional[int] = None) -> List[Dict[str, Any]]:
+    return await _run_async(_search_terms, q, limit, after_id)
+
+def _search_terms(db: Session, q: str, limit: Optional[int], after_id: Optional[int]) -> List[Dict[str, Any]]:
+    _seed_if_empty(db)
+    ranked_ids = term_search.search_ids(db, q, limit=limit, after_id=after_id) if q else None
+    query = db.query(Term.id, Term.title, _preview_column())
+    if ranked_ids is not None:
+        by_id = {r.id: r for r in query.filter(Term.id.in_(ranked_ids)).all()} if ranked_ids else {}
+        rows = [by_id[i] for i in ranked_ids if i in by_id]
+    else:
         if q:
             like = f"%{q}%"
             query = query.filter(or_(Term.title.like(like), Term.content.like(like)))
+        if after_id is not None:
+            query = query.filter(Term.id < after_id)
+        query = query.order_by(Term.id.desc())
+        if limit is not None:
+            query = query.limit(limit)
         rows = query.all()
-        out: List[Dict[str, Any]] = []
-        for r in rows:
-            preview = (r.content or "")
-            if len(preview) > 200:
-                preview = preview[:200] + "…"
-            out.append({
-                "id": r.id,
-                "title": r.title,
-                # 아래 필드는 UI 호환용 자리 채움(모델에 컬럼 없으므로 None/기본값)
-                "version": None,
-                "effective_date": None,
-                "is_active": 1,  # 임시로 항상 활성 처리
-                "content": preview,
-            })
-        return out
+
+    # 강조 snippet은 검색 결과(한 페이지)에 대해서만 본문을 읽어 만든다
+    snippets: Dict[int, Optional[str]] = {}
+    if q and rows:
+        ids = [r.id for r in rows]
+        for term_id, content in db.query(Term.id, Term.content).filter(Term.id.in_(ids)):
+            snippets[term_id] = term_search.make_snippet(content, q)
+
+    out: List[Dict[str, Any]] = []
+    for r in rows:
+        preview = r.preview or ""
+        out.append({
+            "id": r.id,
+            "title": r.title,
+            # 아래 필드는 UI 호환용 자리 채움(모델에 컬럼 없으므로 None/기본값)
+            "version": None,
+            "effective_date": None,
+            "is_active": 1,  # 임시로 항상 활성 처리
+            "content": preview,
+            "snippet": snippets.get(r.id),
+        })
+    return out
 
 def create_term(payload: Dict[str, Any]) -> int:
     """
     관리자 생성: 최소 구현(title, content만 사용)
     payload 예: {"title": "...", "content": "...", (기타 필드는 무시)}
     """
+    return _run(_create_term, payload)
+
+async def create_term_async(payload: Dict[str, Any]) -> int:
+    return await _run_async(_create_term, payload)
+
+def _create_term(db: Session, payload: Dict[str, Any]) -> int:
     title = (payload.get("title") or "").strip()
     content = (payload.get("content") or "").strip()
     if not title:
         raise ValueError("title is required")
-    with SessionLocal() as db:
-        row = Term(title=title, content=content)
-        db.add(row)
-        db.commit()
-        db.refresh(row)
-        return row.id
+    row = Term(title=title, content=content)
+    db.add(row)
+    db.flush()
+    _store_articles(db, row.id, content)
+    db.commit()
+    db.refresh(row)
+    _invalidate_term(row.id)
+    return row.id
 
 def update_term(term_id: int, payload: Dict[str, Any]) -> bool:
     """
     관리자 수정: title/content/is_active(옵션) 업데이트 (존재 안 하면 False)
     """
-    with SessionLocal() as db:
-        row = db.query(Term).filter(Term.id == term_id).first()
-        if not row:
-            return False
-
-        # 제목/본문
-        if "title" in payload and payload["title"] is not None:
-            row.title = str(payload["title"])
-        if "content" in payload and payload["content"] is not None:
-            row.content = str(payload["content"])
-
-        # 소프트 삭제/복구 지원
-        if "is_active" in payload and payload["is_active"] is not None:
-            # 정수/불리언 섞여 들어와도 안전하게 처리
-            v = payload["is_active"]
-            row.is_active = int(v) if isinstance(v, (bool, int)) else int(str(v))
-
-        db.add(row)
-        db.commit()
-        return True
+    return _run(_update_term, term_id, payload)
+
+async def update_term_async(term_id: int, payload: Dict[str, Any]) -> bool:
+    return await _run_async(_update_term, term_id, payload)
+
+def _update_term(db: Session, term_id: int, payload: Dict[str, Any]) -> bool:
+    row = db.query(Term).filter(Term.id == term_id).first()
+    if not row:
+        return False
+
+    # 제목/본문
+    if "title" in payload and payload["title"] is not None:
+        row.title = str(payload["title"])
+    if "content" in payload and payload["content"] is not None:
+        row.content = str(payload["content"])
+        _store_articles(db, term_id, row.content)
+
+    # 소프트 삭제/복구 지원
+    if "is_active" in payload and payload["is_active"] is not None:
+        # 정수/불리언 섞여 들어와도 안전하게 처리
+        v = payload["is_active"]
+        row.is_active = int(v) if isinstance(v, (bool, int)) else int(str(v))
+
+    db.add(row)
+    db.commit()
+    _invalidate_term(term_id)
+    return True
 
 def soft_delete_term(term_id: int) -> bool:
     return update_term(term_id, {"is_active": 0})
 
+async def soft_delete_term_async(term_id: int) -> bool:
+    return await update_term_async(term_id, {"is_active": 0})
+
 def restore_term(term_id: int) -> bool:
     return update_term(term_id, {"is_active": 1})
+
+# -----------------------
+# Admin: NDJSON 일괄 등록/내보내기
+# -----------------------
+def _parse_bulk_line(line: bytes) -> Dict[str, Any]:
+    """ NDJSON 한 줄 → {"title", "content"} (create_term과 같은 규칙, 잘못된 줄은 ValueError) """
+    try:
+        obj = json.loads(line)
+    except (UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ValueError(f"invalid JSON: {e}")
+    if not isinstance(obj, dict):
+        raise ValueError("each line must be a JSON object")
+    title, content = obj.get("title"), obj.get("content")
+    if not isinstance(title, str) or not title.strip():
+        raise ValueError("title is required")
+    if content is not None and not isinstance(content, str):
+        raise ValueError("content must be a string")
+    return {"title": title.strip(), "content": (content or "").strip(), "is_active": 1}
+
+
+def _bulk_insert(db: Session, rows: List[Dict[str, Any]]) -> List[int]:
+    """ 한 트랜잭션에서 여러 행 INSERT (RETURNING으로 id 수집) + FTS 색인 """
+    ids = list(db.scalars(insert(Term).returning(Term.id, sort_by_parameter_order=True),
+                          [dict(r, articles_version=ARTICLES_VERSION) for r in rows]))
+    # ORM bulk INSERT는 after_insert 이벤트를 타지 않으므로 색인은 여기서 직접
+    if term_search.is_enabled():
+        term_search.index_terms(db.connection(), [(i, r["title"], r["content"]) for i, r in zip(ids, rows)])
+    articles = [a for i, r in zip(ids, rows) for a in article_rows(i, r["content"])]
+    if articles:
+        db.execute(insert(TermArticle), articles)
+    db.commit()
+    return ids
+
+
+async def _iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    buf = b""
+    async for chunk in chunks:
+        buf += chunk
+        *lines, buf = buf.split(b"\n")
+        for line in lines:
+            yield line
+    yield buf
+
+
+async def bulk_create_terms_async(chunks: AsyncIterator[bytes],
+                                  batch_size: int = TERM_BULK_BATCH_SIZE) -> Dict[str, Any]:
+    """
+    스트리밍 NDJSON 본문(줄마다 {"title": ..., "content": ...})을 읽으며 batch_size행씩 한 트랜잭션으로 저장.
+    잘못된 줄은 건너뛰고 errors에 줄 번호와 사유를 남긴다.
+    """
+    ids: List[int] = []
+    errors: List[Dict[str, Any]] = []
+    batch: List[Dict[str, Any]] = []
+    line_no = 0
+    async for line in _iter_lines(chunks):
+        line_no += 1
+        if not line.strip():
+            continue
+        try:
+            batch.append(_parse_bulk_line(line))
+        except ValueError as e:
+            errors.append({"line": line_no, "error": str(e)})
+            continue
+        if len(batch) >= batch_size:
+            ids += await _run_async(_bulk_insert, batch)
+            batch = []
+    if batch:
+        ids += await _run_async(_bulk_insert, batch)
+    if ids:
+        _invalidate_term()
+    return {"inserted": len(ids), "ids": ids, "errors": errors}
+
+
+def iter_terms_ndjson(only_active: bool = False, chunk_size: int = TERM_EXPORT_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    전체 약관을 NDJSON 줄 단위로 내보낸다.
+    서버 측 커서(stream_results)에서 chunk_size행씩 가져오므로 전체 목록을 메모리에 만들지 않는다.
+    """
+    stmt = select(Term.id, Term.title, Term.content, Term.is_active).order_by(Term.id)
+    if only_active:
+        stmt = stmt.where(Term.is_active == 1)
+    with engine.connect() as conn:
+        result = conn.execution_options(stream_results=True, yield_per=chunk_size).execute(stmt)
+        for rows in result.partitions():
+            yield "".join(
+                json.dumps({"id": r.id, "title": r.title, "content": r.content, "is_active": r.is_active},
+                           ensure_ascii=False) + "\n"
+                for r in rows
+            ).encode("utf-8")
+
+# -----------------------
+# Admin: 요약 작업 큐 (처리는 상주 워커 app/model/summary_worker.py)
+# -----------------------
+def _job_dict(job: SummaryJob, coalesced: Optional[bool] = None) -> Dict[str, Any]:
+    return {
+        "id": job.id, "term_id": job.term_id, "status": job.status, "requested": job.requested,
+        "error": job.error, "created_at": job.created_at, "started_at": job.started_at,
+        "finished_at": job.finished_at, "coalesced": coalesced,
+    }
+
+async def enqueue_summary_async(term_id: int) -> Optional[Dict[str, Any]]:
+    """ 요약 작업 등록. 같은 약관의 대기 작업이 있으면 그 작업에 합친다 (약관이 없으면 None) """
+    return await _run_async(_enqueue_summary, term_id)
+
+def _enqueue_summary(db: Session, term_id: int) -> Optional[Dict[str, Any]]:
+    if db.query(Term.id).filter(Term.id == term_id).first() is None:
+        return None
+    for _ in range(2):
+        queued = db.query(SummaryJob).filter(SummaryJob.term_id == term_id, SummaryJob.status == "queued")
+        job = queued.first()
+        if job is not None:
+            db.execute(update(SummaryJob).where(SummaryJob.id == job.id)
+                       .values(requested=SummaryJob.requested + 1))
+            db.commit()
+            db.refresh(job)
+            return _job_dict(job, coalesced=True)
+        job = SummaryJob(term_id=term_id, status="queued", requested=1)
+        db.add(job)
+        try:
+            db.commit()
+        except IntegrityError:
+            # 동시에 들어온 같은 약관 요청이 먼저 대기 작업을 만든 경우 → 그 작업에 합친다
+            db.rollback()
+            continue
+        db.refresh(job)
+        return _job_dict(job, coalesced=False)
+    raise RuntimeError(f"summary job enqueue failed for term {term_id}")
+
+async def get_summary_job_async(job_id: int) -> Optional[Dict[str, Any]]:
+    return await _run_async(_get_summary_job, job_id)
+
+def _get_summary_job(db: Session, job_id: int) -> Optional[Dict[str, Any]]:
+    job = db.get(SummaryJob, job_id)
+    return _job_dict(job) if job is not None else None
+
+async def list_summary_jobs_async(status: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
+    return await _run_async(_list_summary_jobs, status, limit)
+
+def _list_summary_jobs(db: Session, status: Optional[str], limit: int) -> List[Dict[str, Any]]:
+    q = db.query(SummaryJob)
+    if status:
+        q = q.filter(SummaryJob.status == status)
+    return [_job_dict(job) for job in q.order_by(SummaryJob.id.desc()).limit(limit)]
+
+async def watch_summary_jobs(interval: float):
+    """
+    lifespan 백그라운드 작업: 워커(다른 프로세스)가 끝낸 요약 작업을 interval초마다 찾아
+    해당 약관의 요약/키워드 캐시를 무효화한다 (작업 상태를 조회하지 않아도 TTL 전에 반영)
+    """
+    since, seen = await _run_async(_last_finished_jobs)
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            term_ids, since, seen = await _run_async(_finished_jobs_since, since, seen)
+        except Exception:
+            logger.exception("완료된 요약 작업 확인 실패")
+            continue
+        for term_id in term_ids:
+            invalidate_term_summary(term_id)
+
+def _finished_at():
+    # 워커는 CURRENT_TIMESTAMP 문자열로 저장하므로 DB 값 그대로 비교한다
+    return cast(SummaryJob.finished_at, Text)
+
+def _last_finished_jobs(db: Session) -> Tuple[str, Set[int]]:
+    """ 시작 시점의 기준: 가장 최근 완료 시각과 그 시각에 끝난 작업 id """
+    since = db.execute(select(func.max(_finished_at())).where(SummaryJob.status == "done")).scalar() or ""
+    seen = set(db.execute(select(SummaryJob.id).where(SummaryJob.status == "done", _finished_at() == since)).scalars())
+    return since, seen
+
+def _finished_jobs_since(db: Session, since: str, seen: Set[int]) -> Tuple[Set[int], str, Set[int]]:
+    """ since 이후(같은 시각이면 seen에 없는) 완료 작업의 약관 id와 새 기준 (since, seen) """
+    rows = db.execute(
+        select(SummaryJob.id, SummaryJob.term_id, _finished_at())
+        .where(SummaryJob.status == "done", _finished_at() >= since)
+    ).all()
+    rows = [r for r in rows if r[0] not in seen]
+    if not rows:
+        return set(), since, seen
+    latest = max(at for _, _, at in rows)
+    if latest != since:
+        seen = set()
+    return {term_id for _, term_id, _ in rows}, latest, seen | {job_id for job_id, _, at in rows if at == latest}
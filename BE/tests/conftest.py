@@ -0,0 +1,8 @@
+# tests/conftest.py
+import os
+import sys
+
+# BE 폴더 밖에서 pytest를 실행해도 app 패키지를 import 할 수 있도록
+BE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BE_DIR not in sys.path:
+    sys.path.insert(0, BE_DIR)
@@ -0,0 +1,56 @@
+# tests/test_articles.py
+from app.model.articles import article_rows, article_text, split_articles, split_segments
+
+
+def _labels(content):
+    return [(a.label, a.heading) for a in split_articles(content)]
+
+
+def test_paren_headings():
+    content = "제1조(목적) 이 약관은 ...\n제2조의2 (정의) 용어는 ...\n"
+    assert _labels(content) == [("제1조", "목적"), ("제2조의2", "정의")]
+
+
+def test_bracket_headings():
+    # 5번 약관 형식: "제N조 [ 제목 ]"
+    content = "전자서명 약관\n제1조 [ 목적 ] \n이 약관은 ...\n제2조 [ 용어의 정의 ] \n① 용어는 ...\n"
+    assert _labels(content) == [("제1조", "목적"), ("제2조", "용어의 정의")]
+
+
+def test_lenticular_bracket_headings():
+    content = "제1조【목적】 이 약관은 ...\n제2조 【정의】\n용어는 ...\n"
+    assert _labels(content) == [("제1조", "목적"), ("제2조", "정의")]
+
+
+def test_bare_title_headings():
+    content = "제1 조  약관의 적용  \n이 약관을 적용합니다.\n제 2 조  신청, 변경 및 해지 \n신청서를 제출합니다.\n"
+    assert _labels(content) == [("제1조", "약관의 적용"), ("제2조", "신청, 변경 및 해지")]
+
+
+def test_wrapped_references_are_not_headings():
+    content = ("제1조(목적) 이 약관은\n제3조에 따라 정합니다.\n제2조(정의) 용어는\n"
+               "제7조(이용제한)에 따릅니다.\n제3조 제1항에 따라 처리합니다.\n제3조(효력) 이 약관은 ...\n")
+    assert [a.label for a in split_articles(content)] == ["제1조", "제2조", "제3조"]
+
+
+def test_numbering_must_increase_and_addenda_stop():
+    content = "제1조(목적) 가\n제2조(정의) 나\n제1조(목적) 인용\n부 칙\n제1조(시행일) 이 약관은 ...\n"
+    articles = split_articles(content)
+    assert [a.label for a in articles] == ["제1조", "제2조"]
+    assert article_text(content, articles[-1]) == "제2조(정의) 나\n제1조(목적) 인용"
+
+
+def test_byte_offsets_and_rows():
+    content = "머리말\n제1조(목적) 가나다\n\n제2조(정의) 라마\n"
+    first, second = split_articles(content)
+    assert article_text(content, first) == "제1조(목적) 가나다"
+    assert article_text(content, second) == "제2조(정의) 라마"
+    assert content.encode("utf-8")[:first.start].decode("utf-8") == "머리말\n"
+    rows = article_rows(7, content)
+    assert [(r["term_id"], r["seq"], r["article_no"]) for r in rows] == [(7, 0, 1), (7, 1, 2)]
+
+
+def test_segments_cover_whole_text():
+    content = "머리말\n제1조(목적) 가\n제2조(정의) 나\n부칙\n시행일"
+    assert split_segments(content) == ["머리말", "제1조(목적) 가", "제2조(정의) 나\n부칙\n시행일"]
+    assert split_articles("") == [] and split_segments("본문만") == ["본문만"]
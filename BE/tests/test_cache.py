@@ -0,0 +1,120 @@
+# tests/test_cache.py
+import asyncio
+
+import pytest
+
+from app.core import cache as cache_module
+from app.core.cache import TTLCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_get_or_load_caches_and_counts():
+    cache = TTLCache(maxsize=4, ttl=60.0)
+    calls = []
+    load = lambda: calls.append(1) or "v"  # noqa: E731
+    assert cache.get_or_load("k", load) == "v"
+    assert cache.get_or_load("k", load) == "v"
+    assert len(calls) == 1
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (1, 1, 1)
+    assert stats["hit_ratio"] == 0.5
+
+
+def test_none_is_not_cached():
+    cache = TTLCache(maxsize=4, ttl=60.0)
+    calls = []
+    for _ in range(2):
+        assert cache.get_or_load("missing", lambda: calls.append(1)) is None
+    assert len(calls) == 2 and cache.stats()["size"] == 0
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = TTLCache(maxsize=4, ttl=10.0)
+    cache.set("k", "v")
+    clock[0] += 9.9
+    assert cache.get("k") == (True, "v")
+    clock[0] += 0.2
+    assert cache.get("k") == (False, None)
+    assert cache.stats()["size"] == 0  # 만료된 항목은 조회 시 지운다
+
+
+def test_lru_eviction_keeps_recently_used():
+    cache = TTLCache(maxsize=2, ttl=60.0)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")  # a를 최근 사용으로
+    cache.set("c", 3)
+    assert cache.get("b") == (False, None)
+    assert cache.get("a") == (True, 1) and cache.get("c") == (True, 3)
+    assert cache.stats()["evictions"] == 1
+
+
+def test_maxsize_zero_disables_cache():
+    cache = TTLCache(maxsize=0, ttl=60.0)
+    cache.set("k", "v")
+    assert cache.get("k") == (False, None)
+
+
+def test_invalidate_and_invalidate_where():
+    cache = TTLCache(maxsize=8, ttl=60.0)
+    for key in [("list", True), ("detail", 1), ("detail", 2), ("summary", 1)]:
+        cache.set(key, "v")
+    cache.invalidate(("summary", 1), ("absent",))
+    cache.invalidate_where(lambda key: key[0] == "detail" and key[1] == 1)
+    assert [k for k in [("list", True), ("detail", 1), ("detail", 2), ("summary", 1)] if cache.get(k)[0]] == [
+        ("list", True), ("detail", 2)]
+    cache.clear()
+    assert cache.stats()["size"] == 0
+
+
+def test_aget_or_load():
+    cache = TTLCache(maxsize=4, ttl=60.0)
+    calls = []
+
+    async def load():
+        calls.append(1)
+        return {"id": 1}
+
+    async def main():
+        return [await cache.aget_or_load(("detail", 1), load) for _ in range(3)]
+
+    assert asyncio.run(main()) == [{"id": 1}] * 3
+    assert len(calls) == 1
+
+
+def test_invalidate_during_load_does_not_store_stale_value():
+    cache = TTLCache(maxsize=4, ttl=60.0)
+
+    def load_then_invalidate():
+        cache.invalidate(("summary", 1))  # 이전 값을 읽는 도중에 새 요약이 저장됨
+        return "old"
+
+    assert cache.get_or_load(("summary", 1), load_then_invalidate) == "old"
+    assert cache.get(("summary", 1)) == (False, None)
+    assert cache.get_or_load(("summary", 1), lambda: "new") == "new"
+    assert cache.get(("summary", 1)) == (True, "new")
+
+
+def test_invalidate_where_during_async_load():
+    cache = TTLCache(maxsize=4, ttl=60.0)
+
+    async def load():
+        cache.invalidate_where(lambda key: key[0] == "keyword")
+        return ["old"]
+
+    asyncio.run(cache.aget_or_load(("keyword", "x"), load))
+    assert cache.get(("keyword", "x")) == (False, None)
+
+
+def test_bypassed_load_is_not_stored():
+    bypass = [True]
+    cache = TTLCache(maxsize=4, ttl=60.0, bypass=lambda: bypass[0])
+    assert cache.get_or_load("k", lambda: "profiled") == "profiled"
+    bypass[0] = False
+    assert cache.get("k") == (False, None)
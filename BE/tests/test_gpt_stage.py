@@ -0,0 +1,68 @@
+# tests/test_gpt_stage.py
+from types import SimpleNamespace
+
+import pytest
+from openai import APIStatusError, APITimeoutError
+
+from app.model import gpt_stage
+from app.model.fake_openai import FakeOpenAIServer
+from app.model.gpt_stage import create_with_retry, make_gpt_client
+
+MESSAGES = [{"role": "user", "content": "## 핵심 문장\n- 가나다\n## 초벌 키워드\n약관"}]
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """ 백오프 대기 시간을 기록만 하고 실제로는 기다리지 않는다 """
+    delays = []
+    monkeypatch.setattr(gpt_stage, "time", SimpleNamespace(sleep=delays.append))  # 가짜 서버의 sleep은 그대로
+    return delays
+
+
+def _call(server, timeout: float = 5.0, **kwargs):
+    client = make_gpt_client(base_url=server.base_url, timeout=timeout)
+    return create_with_retry(client, model="fake", messages=MESSAGES, timeout=timeout, **kwargs)
+
+
+def test_429_uses_retry_after(sleeps):
+    with FakeOpenAIServer(latency=0, script=[(429, 3)]) as server:
+        response = _call(server)
+    assert "가나다" in response.choices[0].message.content
+    assert server.requests == 2
+    assert sleeps == [3.0]
+
+
+def test_5xx_then_success(sleeps):
+    with FakeOpenAIServer(latency=0, script=[500, 503]) as server:
+        _call(server)
+    assert server.requests == 3
+    assert len(sleeps) == 2 and sleeps[0] < sleeps[1]  # 지수 백오프
+
+
+def test_timeout_is_retried(sleeps, caplog):
+    with FakeOpenAIServer(latency=0, script=["timeout"], timeout_delay=1.0) as server:
+        _call(server, timeout=0.2)
+    assert server.requests == 2 and len(sleeps) == 1
+    assert "APITimeoutError" in caplog.text
+
+
+def test_gives_up_after_retry_limit(sleeps):
+    with FakeOpenAIServer(latency=0, script=[500] * 5) as server:
+        with pytest.raises(APIStatusError) as exc:
+            _call(server, max_retries=2)
+    assert exc.value.status_code == 500
+    assert server.requests == 3 and len(sleeps) == 2
+
+
+def test_timeout_gives_up(sleeps):
+    with FakeOpenAIServer(latency=0, script=["timeout", "timeout"], timeout_delay=1.0) as server:
+        with pytest.raises(APITimeoutError):
+            _call(server, timeout=0.2, max_retries=1)
+    assert server.requests == 2
+
+
+def test_client_errors_are_not_retried(sleeps):
+    with FakeOpenAIServer(latency=0, script=[400]) as server:
+        with pytest.raises(APIStatusError):
+            _call(server)
+    assert server.requests == 1 and sleeps == []
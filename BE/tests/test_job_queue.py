@@ -0,0 +1,72 @@
+# tests/test_job_queue.py
+import sqlite3
+
+import pytest
+
+from app.model.job_queue import QUEUED, RUNNING, JobQueue
+
+
+@pytest.fixture
+def queue(tmp_path):
+    db_path = str(tmp_path / "jobs.db")
+    with JobQueue(db_path, lease_seconds=60) as q:
+        yield q
+
+
+def _add(q: JobQueue, term_id: int, status: str, heartbeat_age: int = 0, requested: int = 1) -> int:
+    cur = q._conn.execute(
+        "INSERT INTO summary_jobs (term_id, status, requested, started_at, heartbeat_at) "
+        "VALUES (?, ?, ?, datetime('now', ?), datetime('now', ?))",
+        (term_id, status, requested, f"-{heartbeat_age} seconds", f"-{heartbeat_age} seconds"),
+    )
+    return cur.lastrowid
+
+
+def _rows(q: JobQueue):
+    return q._conn.execute("SELECT id, term_id, status, requested FROM summary_jobs ORDER BY id").fetchall()
+
+
+def test_live_worker_jobs_are_not_requeued(queue):
+    job_id = _add(queue, 1, RUNNING, heartbeat_age=10)
+    assert queue.requeue_running() == 0
+    assert _rows(queue) == [(job_id, 1, RUNNING, 1)]
+
+
+def test_stale_jobs_are_requeued(queue):
+    job_id = _add(queue, 1, RUNNING, heartbeat_age=600)
+    assert queue.requeue_running() == 1
+    assert _rows(queue) == [(job_id, 1, QUEUED, 1)]
+    assert queue.claim(10) == [(job_id, 1)]
+
+
+def test_stale_job_merges_into_queued(queue):
+    queued = _add(queue, 1, QUEUED)
+    _add(queue, 1, RUNNING, heartbeat_age=600)
+    _add(queue, 1, RUNNING, heartbeat_age=600)
+    assert queue.requeue_running() == 2
+    assert _rows(queue) == [(queued, 1, QUEUED, 3)]
+
+
+def test_merge_keeps_stale_request_count(queue):
+    queued = _add(queue, 1, QUEUED, requested=2)
+    _add(queue, 1, RUNNING, heartbeat_age=600, requested=4)  # 처리 중에 다시 요청된 작업
+    assert queue.requeue_running() == 1
+    assert _rows(queue) == [(queued, 1, QUEUED, 6)]
+
+
+def test_heartbeat_extends_lease(queue):
+    job_id = _add(queue, 1, RUNNING, heartbeat_age=600)
+    queue.heartbeat([job_id])
+    assert queue.requeue_running() == 0
+
+
+def test_legacy_table_gets_heartbeat_column(tmp_path):
+    db_path = str(tmp_path / "legacy.db")
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE summary_jobs (id INTEGER PRIMARY KEY AUTOINCREMENT, term_id INTEGER NOT NULL, "
+                 "status VARCHAR(16) NOT NULL, requested INTEGER NOT NULL DEFAULT 1, error TEXT, "
+                 "created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP, started_at DATETIME, finished_at DATETIME)")
+    conn.close()
+    with JobQueue(db_path) as q:
+        columns = {row[1] for row in q._conn.execute("PRAGMA table_info(summary_jobs)")}
+    assert "heartbeat_at" in columns
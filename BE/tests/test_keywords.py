@@ -0,0 +1,50 @@
+# tests/test_keywords.py
+import sqlite3
+
+from app.model.summary_writer import ensure_summary_schema, keyword_key, normalize_keyword, normalize_keywords
+
+
+def test_normalize_keyword_keeps_case():
+    assert normalize_keyword("  KB   STAR\tCLUB ") == "KB STAR CLUB"
+    assert keyword_key("  KB   STAR\tCLUB ") == "kb star club"
+
+
+def test_normalize_keyword_nfc():
+    decomposed = "\u1100\u1161\u11a8"  # 각 (자모 분리형)
+    assert normalize_keyword(decomposed) == "\uac01"
+
+
+def test_normalize_keywords_dedup_case_insensitive():
+    assert normalize_keywords("KB STAR CLUB, kb star club, 대출이자,, 대출이자") == ["KB STAR CLUB", "대출이자"]
+    assert normalize_keywords(["예금", " 예금 ", ""]) == ["예금"]
+
+
+def test_legacy_lowercased_keywords_are_rebuilt():
+    conn = sqlite3.connect(":memory:")
+    cur = conn.cursor()
+    cur.execute("CREATE TABLE terms (id INTEGER PRIMARY KEY)")
+    cur.execute("INSERT INTO terms VALUES (8)")
+    cur.execute("CREATE TABLE term_keywords (term_id INTEGER NOT NULL, keyword VARCHAR(100) NOT NULL, "
+                "rank INTEGER NOT NULL, PRIMARY KEY (term_id, keyword))")
+    cur.execute("INSERT INTO term_keywords VALUES (8, 'kb star club', 0)")
+    ensure_summary_schema(cur)
+    cur.execute("INSERT INTO term_summaries (term_id, revision_version, keywords) VALUES (8, 'v1', 'KB STAR CLUB,예금')")
+    cur.execute("INSERT INTO term_keywords VALUES (8, 'kb star club', 0, NULL)")  # 컬럼 추가 전 행
+    ensure_summary_schema(cur)
+    rows = cur.execute("SELECT keyword, keyword_norm FROM term_keywords ORDER BY rank").fetchall()
+    assert rows == [("KB STAR CLUB", "kb star club"), ("예금", "예금")]
+
+
+def test_backfill_runs_once_even_without_keywords():
+    conn = sqlite3.connect(":memory:")
+    cur = conn.cursor()
+    cur.execute("CREATE TABLE terms (id INTEGER PRIMARY KEY)")
+    cur.execute("INSERT INTO terms VALUES (1)")
+    ensure_summary_schema(cur)
+    cur.execute("INSERT INTO term_summaries (term_id, revision_version, keywords) VALUES (1, 'v1', '')")
+    cur.execute("DELETE FROM schema_meta")  # 요약은 있지만 키워드는 하나도 없는 이전 DB
+    ensure_summary_schema(cur)
+    assert cur.execute("SELECT COUNT(*) FROM term_keywords").fetchone()[0] == 0
+    cur.execute("INSERT INTO term_keywords VALUES (1, '예금', 0, '예금')")
+    ensure_summary_schema(cur)  # 비어 있었다고 다시 지우고 채우지 않는다
+    assert cur.execute("SELECT keyword FROM term_keywords").fetchall() == [("예금",)]
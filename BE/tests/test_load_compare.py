@@ -0,0 +1,52 @@
+# tests/test_load_compare.py
+from app.bench.load import compare
+
+
+def _stats(p95=10.0, p99=20.0, rps=100.0, requests=100, errors=0):
+    return {"requests": requests, "errors": errors, "rps": rps, "p50_ms": 5.0, "p95_ms": p95, "p99_ms": p99}
+
+
+def _result(total, **endpoints):
+    return {"total": total, "endpoints": endpoints}
+
+
+def test_same_numbers_pass():
+    base = _result(_stats(), detail=_stats())
+    _lines, failures = compare(base, base, 0.2)
+    assert failures == []
+
+
+def test_latency_regression_fails():
+    base = _result(_stats(), detail=_stats())
+    cur = _result(_stats(p95=13.0), detail=_stats())
+    _lines, failures = compare(base, cur, 0.2)
+    assert failures == ["total p95_ms +30%"]
+
+
+def test_throughput_drop_fails():
+    base = _result(_stats(rps=100.0))
+    cur = _result(_stats(rps=70.0))
+    _lines, failures = compare(base, cur, 0.2)
+    assert failures == ["total rps -30%"]
+
+
+def test_fast_errors_fail():
+    base = _result(_stats(), detail=_stats())
+    cur = _result(_stats(p95=1.0, p99=1.0, rps=500.0, errors=40), detail=_stats(p95=1.0, p99=1.0, errors=40))
+    _lines, failures = compare(base, cur, 0.2)
+    assert any(f.startswith("total errors") for f in failures)
+    assert any(f.startswith("detail errors") for f in failures)
+
+
+def test_error_rate_threshold():
+    base = _result(_stats(errors=1))
+    assert compare(base, _result(_stats(errors=1)), 0.2)[1] == []
+    assert compare(base, _result(_stats(errors=3)), 0.2, max_error_rate=0.05)[1] == []
+    assert compare(base, _result(_stats(errors=3)), 0.2)[1] != []
+
+
+def test_new_endpoint_with_errors_fails():
+    base = _result(_stats())
+    cur = _result(_stats(), articles=_stats(errors=2))
+    _lines, failures = compare(base, cur, 0.2)
+    assert any(f.startswith("articles errors") for f in failures)
@@ -0,0 +1,64 @@
+# tests/test_migrations.py
+from sqlalchemy import create_engine, delete, insert, select, update
+
+from app.db.base import Base
+from app.db.migrations import backfill_term_articles, backfill_term_keywords
+from app.model.articles import ARTICLES_VERSION
+from app.models.term import Term
+from app.models.term_article import TermArticle
+from app.models.term_keyword import TermKeyword
+from app.models.term_summary import TermSummary
+
+
+def _engine():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine, tables=[Term.__table__, TermArticle.__table__])
+    return engine
+
+
+def test_backfill_records_version_and_skips_parsed_terms():
+    engine = _engine()
+    with engine.begin() as conn:
+        conn.execute(insert(Term), [
+            {"id": 1, "title": "a", "content": "제1조(목적) 가\n제2조(정의) 나"},
+            {"id": 2, "title": "b", "content": "조가 없는 동의서"},
+        ])
+    backfill_term_articles(engine)
+    with engine.begin() as conn:
+        assert conn.execute(select(Term.articles_version)).scalars().all() == [ARTICLES_VERSION] * 2
+        assert conn.execute(select(TermArticle.term_id)).scalars().all() == [1, 1]
+        # 이미 나눈 약관은 다시 읽지 않는다 (본문을 몰래 바꿔도 그대로)
+        conn.execute(update(Term).where(Term.id == 2).values(content="제1조(목적) 가"))
+    backfill_term_articles(engine)
+    with engine.begin() as conn:
+        assert conn.execute(select(TermArticle.term_id)).scalars().all() == [1, 1]
+
+
+def test_backfill_reparses_older_versions():
+    engine = _engine()
+    with engine.begin() as conn:
+        conn.execute(insert(Term), [{"id": 5, "title": "a", "content": "제1조 [ 목적 ] 가\n제2조 [ 정의 ] 나",
+                                     "articles_version": ARTICLES_VERSION - 1}])
+    backfill_term_articles(engine)
+    with engine.begin() as conn:
+        rows = conn.execute(select(TermArticle.article_no, TermArticle.heading).order_by(TermArticle.seq)).all()
+    assert [tuple(r) for r in rows] == [(1, "목적"), (2, "정의")]
+
+
+def test_keyword_backfill_uses_writer_implementation():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine, tables=[Term.__table__, TermSummary.__table__, TermKeyword.__table__])
+    with engine.begin() as conn:
+        conn.execute(insert(Term), [{"id": 1, "title": "a", "content": "가"}])
+        conn.execute(insert(TermSummary), [
+            {"term_id": 1, "revision_version": "v1", "keywords": "예금"},
+            {"term_id": 1, "revision_version": "v2", "keywords": "KB STAR CLUB, 대출"},
+        ])
+    backfill_term_keywords(engine)
+    with engine.begin() as conn:
+        rows = conn.execute(select(TermKeyword.keyword, TermKeyword.keyword_norm).order_by(TermKeyword.rank)).all()
+        assert [tuple(r) for r in rows] == [("KB STAR CLUB", "kb star club"), ("대출", "대출")]
+        conn.execute(delete(TermKeyword))
+    backfill_term_keywords(engine)  # 기록된 뒤에는 다시 채우지 않는다
+    with engine.begin() as conn:
+        assert conn.execute(select(TermKeyword.term_id)).all() == []
@@ -0,0 +1,36 @@
+# tests/test_pipeline.py
+import random
+import time
+
+from app.model.pipeline import Stage, StreamingPipeline
+
+
+def _run(ordered: bool, workers: int = 4, n: int = 40, fail=()):
+    rng = random.Random(0)
+    delays = [rng.uniform(0, 0.01) for _ in range(n)]
+    out = []
+
+    def slow(i):
+        time.sleep(delays[i])
+        if i in fail:
+            raise RuntimeError("boom")
+        return i
+
+    StreamingPipeline(range(n), [
+        Stage("gpt", slow, workers=workers, queue_size=4, ordered=ordered),
+        Stage("write", out.append),
+    ]).run()
+    return out
+
+
+def test_ordered_stage_keeps_input_order():
+    assert _run(ordered=True) == list(range(40))
+
+
+def test_unordered_stage_emits_in_completion_order():
+    out = _run(ordered=False)
+    assert sorted(out) == list(range(40)) and out != list(range(40))
+
+
+def test_failed_items_do_not_block_later_ones():
+    assert _run(ordered=True, fail={0, 7}) == [i for i in range(40) if i not in (0, 7)]
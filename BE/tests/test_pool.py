@@ -0,0 +1,65 @@
+# tests/test_pool.py
+import threading
+import time
+
+from sqlalchemy import create_engine, event, text
+
+from app.db.session import TimedQueuePool, _is_memory, _sqlite_pragmas
+
+
+def _engine(tmp_path, pool_size=1, max_overflow=0):
+    return create_engine(f"sqlite:///{tmp_path / 'pool.db'}", poolclass=TimedQueuePool,
+                         pool_size=pool_size, max_overflow=max_overflow, pool_timeout=5)
+
+
+def test_free_checkouts_are_not_waits(tmp_path):
+    engine = _engine(tmp_path)
+    for _ in range(5):
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+    stats = engine.pool.stats()
+    assert stats["checkouts"] == 5
+    assert stats["waits"] == 0 and stats["wait_avg_ms"] == 0.0
+
+
+def test_blocked_checkout_is_a_wait(tmp_path):
+    engine = _engine(tmp_path)
+    held = engine.connect()
+    got = threading.Event()
+
+    def other():
+        with engine.connect():
+            got.set()
+
+    thread = threading.Thread(target=other)
+    thread.start()
+    time.sleep(0.1)
+    assert not got.is_set()
+    held.close()
+    thread.join()
+    stats = engine.pool.stats()
+    assert stats["checkouts"] == 2
+    assert stats["waits"] == 1
+    assert stats["wait_max_ms"] >= 50
+
+
+def test_overflow_checkout_is_not_a_wait(tmp_path):
+    engine = _engine(tmp_path, max_overflow=1)
+    first, second = engine.connect(), engine.connect()
+    first.close()
+    second.close()
+    assert engine.pool.stats()["waits"] == 0
+
+
+def test_pragmas_follow_the_engine_url(tmp_path):
+    assert _is_memory("sqlite://") and _is_memory("sqlite+aiosqlite://") and _is_memory("sqlite:///:memory:")
+    assert not _is_memory(f"sqlite:///{tmp_path / 'a.db'}")
+    url = f"sqlite:///{tmp_path / 'replica.db'}"
+    engine = create_engine(url)
+    event.listen(engine, "connect", _sqlite_pragmas(url))
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+    memory = create_engine("sqlite://")
+    event.listen(memory, "connect", _sqlite_pragmas("sqlite://"))
+    with memory.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "memory"
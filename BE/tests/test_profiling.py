@@ -0,0 +1,26 @@
+# tests/test_profiling.py
+from app.core import profiling
+from app.core.cache import TTLCache
+
+
+def test_profiled_request_bypasses_cache():
+    cache = TTLCache(maxsize=8, ttl=60.0, bypass=profiling.bypass_cache)
+    calls = []
+
+    def load():
+        calls.append(1)
+        return "v"
+
+    assert cache.get_or_load("k", load) == "v"
+    assert cache.get_or_load("k", load) == "v"
+    assert len(calls) == 1  # 일반 요청은 캐시 적중
+
+    report = profiling.ProfileReport(0, "GET", "/public/terms/1", "")
+    token = profiling._current.set(report)
+    try:
+        assert cache.get_or_load("k", load) == "v"
+    finally:
+        profiling._current.reset(token)
+    assert len(calls) == 2
+    assert report.summary()["cache_bypass"] == 1
+    assert "cache_bypass=1" in report.render()
@@ -0,0 +1,47 @@
+# tests/test_routing.py
+import asyncio
+
+import pytest
+
+from app.db import routing
+
+
+@pytest.fixture
+def replica(monkeypatch):
+    monkeypatch.setattr(routing, "DATABASE_READ_URL", "sqlite:///replica.db")
+    monkeypatch.setattr(routing, "READ_YOUR_WRITES_WINDOW", 60.0)
+    monkeypatch.setattr(routing, "_recent_writes", {})
+    monkeypatch.setattr(routing, "_down_until", 0.0)
+
+
+def test_no_replica_configured(monkeypatch):
+    monkeypatch.setattr(routing, "DATABASE_READ_URL", "")
+    assert routing.use_replica(1) is False
+
+
+def test_read_your_writes(replica):
+    assert routing.use_replica(1) and routing.use_replica()
+    routing.mark_written(1)
+    assert not routing.use_replica(1)
+    assert not routing.use_replica()  # 목록
+    assert routing.use_replica(2)
+
+
+def test_replica_failure_falls_back(replica):
+    routing.replica_failed(RuntimeError("down"))
+    assert not routing.use_replica(1)
+
+
+def test_read_primary_is_reset_after_request(replica):
+    async def request():
+        gen = routing.read_primary()
+        await gen.__anext__()
+        assert not routing.use_replica(1)
+        await gen.aclose()
+
+    async def same_context_requests():
+        # ASGITransport처럼 관리자 요청 다음 조회가 같은 context에서 이어져도 replica를 쓴다
+        await request()
+        assert routing.use_replica(1)
+
+    asyncio.run(same_context_requests())
@@ -0,0 +1,94 @@
+# tests/test_sentence_cache.py
+import os
+import sqlite3
+
+from app.model.sentence_cache import SentenceScoreCache, model_fingerprint
+
+
+def _count(path) -> int:
+    with sqlite3.connect(path) as conn:
+        return conn.execute("SELECT COUNT(*) FROM sentence_scores").fetchone()[0]
+
+
+def test_eviction_is_shared_between_processes(tmp_path):
+    path = str(tmp_path / "cache.db")
+    # --workers 프로세스처럼 같은 파일을 각자 연다
+    a = SentenceScoreCache(path, "fp", max_entries=10)
+    b = SentenceScoreCache(path, "fp", max_entries=10)
+    a.put_many([f"a{i}" for i in range(8)], [0.5] * 8)
+    b.put_many([f"b{i}" for i in range(8)], [0.5] * 8)
+    assert _count(path) == 10
+    assert a.stats()["entries"] == b.stats()["entries"] == 10
+    assert b.evicted == 6
+    assert b.get_many([f"b{i}" for i in range(8)]) == {i: 0.5 for i in range(8)}  # 방금 넣은 항목은 남는다
+    a.close()
+    b.close()
+
+
+def test_duplicates_are_not_counted(tmp_path):
+    path = str(tmp_path / "cache.db")
+    cache = SentenceScoreCache(path, "fp", max_entries=10)
+    cache.put_many(["x", "y"], [0.1, 0.2])
+    cache.put_many(["x", "y", "z"], [0.1, 0.2, 0.3])
+    assert cache.stats()["entries"] == 3 and cache.evicted == 0
+    cache.close()
+
+
+def test_existing_file_without_counter(tmp_path):
+    path = str(tmp_path / "cache.db")
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE sentence_scores (key TEXT NOT NULL PRIMARY KEY, prob REAL NOT NULL, "
+                     "last_used INTEGER NOT NULL) WITHOUT ROWID")
+        conn.executemany("INSERT INTO sentence_scores VALUES (?, 0.5, ?)", [(f"k{i}", i) for i in range(5)])
+    cache = SentenceScoreCache(path, "fp", max_entries=6)
+    assert cache.stats()["entries"] == 5
+    cache.put_many(["n1", "n2"], [0.5, 0.5])
+    assert _count(path) == 6 and cache.evicted == 1
+    cache.close()
+
+
+def test_fingerprint_follows_loaded_weights(tmp_path):
+    from app.model.kobert import WEIGHTS_FILE, weights_path
+
+    pth = tmp_path / "model.pth"
+    pth.write_bytes(b"a" * 10)
+    model_dir = tmp_path / "local"
+    model_dir.mkdir()
+    assert weights_path(str(pth), str(model_dir)) == str(pth)
+    before = model_fingerprint(weights_path(str(pth), str(model_dir)), "eager")
+
+    (model_dir / WEIGHTS_FILE).write_bytes(b"b" * 10)  # export 후에는 safetensors를 읽는다
+    path = weights_path(str(pth), str(model_dir))
+    assert path == str(model_dir / WEIGHTS_FILE)
+    after = model_fingerprint(path, "eager")
+    assert after != before
+    assert model_fingerprint(path, "eager") == after
+    assert model_fingerprint(path, "int8") != after
+
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))  # 다시 저장됨
+    assert model_fingerprint(path, "eager") != after
+
+
+def _last_used(path, cache, sentence) -> int:
+    with sqlite3.connect(path) as conn:
+        return conn.execute("SELECT last_used FROM sentence_scores WHERE key = ?", (cache._key(sentence),)).fetchone()[0]
+
+
+def test_hits_are_written_with_next_put(tmp_path):
+    path = str(tmp_path / "cache.db")
+    cache = SentenceScoreCache(path, "fp", max_entries=3)
+    for s, p in [("old", 0.1), ("mid", 0.2), ("new", 0.3)]:
+        cache.put_many([s], [p])
+    stored = _last_used(path, cache, "old")
+    changes = cache._conn.total_changes
+    assert cache.get_many(["old", "missing"]) == {0: 0.1}
+    assert cache._conn.total_changes == changes  # 조회만으로는 쓰지 않는다
+    assert _last_used(path, cache, "old") == stored
+
+    cache.put_many(["newest"], [0.4])  # 조회 시각을 먼저 쓰므로 "old" 대신 "mid"가 지워진다
+    assert _last_used(path, cache, "old") > stored
+    assert cache.get_many(["old", "mid", "new", "newest"]) == {0: 0.1, 2: 0.3, 3: 0.4}
+    cache.close()
+    with sqlite3.connect(path) as conn:
+        assert conn.execute("SELECT MIN(last_used) FROM sentence_scores").fetchone()[0] > stored  # close 때 씀
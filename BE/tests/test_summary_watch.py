@@ -0,0 +1,42 @@
+# tests/test_summary_watch.py
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from app.db.base import Base
+from app.models.summary_job import SummaryJob
+from app.models.term import Term
+from app.services.term_service import _finished_jobs_since, _last_finished_jobs
+
+
+def _finish(db: Session, job_id: int, term_id: int, at: str):
+    # 워커처럼 sqlite 문자열로 저장
+    db.execute(text("INSERT INTO summary_jobs (id, term_id, status, requested, finished_at) "
+                    "VALUES (:id, :term_id, 'done', 1, :at)"), {"id": job_id, "term_id": term_id, "at": at})
+
+
+def test_finished_jobs_are_reported_once():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine, tables=[Term.__table__, SummaryJob.__table__])
+    with Session(engine) as db:
+        _finish(db, 1, 10, "2026-01-01 00:00:00")
+        since, seen = _last_finished_jobs(db)
+        assert (since, seen) == ("2026-01-01 00:00:00", {1})
+        assert _finished_jobs_since(db, since, seen)[0] == set()
+
+        # 같은 초에 끝난 작업과 그 뒤에 끝난 작업
+        _finish(db, 2, 20, "2026-01-01 00:00:00")
+        _finish(db, 3, 30, "2026-01-01 00:00:05")
+        term_ids, since, seen = _finished_jobs_since(db, since, seen)
+        assert term_ids == {20, 30}
+        assert (since, seen) == ("2026-01-01 00:00:05", {3})
+        assert _finished_jobs_since(db, since, seen)[0] == set()
+
+
+def test_empty_queue():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine, tables=[Term.__table__, SummaryJob.__table__])
+    with Session(engine) as db:
+        since, seen = _last_finished_jobs(db)
+        assert (since, seen) == ("", set())
+        _finish(db, 1, 10, "2026-01-01 00:00:00")
+        assert _finished_jobs_since(db, since, seen)[0] == {10}
@@ -0,0 +1,81 @@
+# tests/test_term_search.py
+import pytest
+from sqlalchemy import create_engine, insert, text, update
+from sqlalchemy.orm import Session
+
+from app.db.base import Base
+from app.models.term import Term
+from app.services import term_search
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    monkeypatch.setattr(term_search, "_fts_ready", False)  # 다른 테스트의 ORM 이벤트에 색인이 끼지 않도록 되돌린다
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine, tables=[Term.__table__])
+    with engine.begin() as conn:
+        conn.execute(insert(Term), [
+            {"id": 1, "title": "서비스 이용약관", "content": "회원은 서비스 이용 약관에 동의한다."},
+            {"id": 2, "title": "개인정보 처리방침", "content": "약관 변경 시 이용 제한을 안내한다."},
+        ])
+    assert term_search.ensure_fts_index(engine)
+    return engine
+
+
+def _search(engine, q):
+    with Session(engine) as db:
+        return sorted(term_search.search_ids(db, q))
+
+
+def _like(engine, q):
+    with Session(engine) as db:
+        rows = db.execute(text("SELECT id FROM terms WHERE title LIKE :q OR content LIKE :q ORDER BY id"),
+                          {"q": f"%{q}%"})
+        return [r[0] for r in rows]
+
+
+def test_multi_word_query_is_one_phrase():
+    assert term_search.build_match_query("이용 약관") == '"이용 약관"'
+    assert term_search.build_match_query("제 1 조") is None  # 1글자 단어 → LIKE
+
+
+@pytest.mark.parametrize("q", ["이용 약관", "약관 이용", "이용약관", "약관"])
+def test_phrase_matches_like(engine, q):
+    assert _search(engine, q) == _like(engine, q)
+
+
+def test_out_of_band_edits_are_reindexed(engine):
+    with engine.begin() as conn:
+        # ORM 이벤트 없이 바꾼 내용 (건수는 그대로)
+        conn.execute(update(Term).where(Term.id == 2).values(content="전자금융거래 기본약관"))
+        conn.execute(text("DELETE FROM terms WHERE id = 1"))
+        conn.execute(insert(Term).values(id=3, title="위치정보 약관", content="전자금융거래 안내"))
+    assert _search(engine, "전자금융") == []  # 아직 색인 전
+    with engine.begin() as conn:
+        assert term_search.sync_index(conn) == 2
+    assert _search(engine, "전자금융") == [2, 3]
+    assert _search(engine, "이용 약관") == []
+    with engine.begin() as conn:
+        assert term_search.sync_index(conn) == 0
+
+
+def test_pages_keep_relevance_order(engine):
+    with engine.begin() as conn:
+        # 제목 적중(id 1, 3)이 본문만 적중한 항목(id 2, 4)보다 앞서야 한다. id 순이면 4가 먼저 나온다
+        conn.execute(insert(Term), [
+            {"id": 3, "title": "전자금융 이용약관", "content": "전자금융거래 서비스"},
+            {"id": 4, "title": "위치정보 안내", "content": "서비스 이용 약관을 따른다."},
+        ])
+        term_search.sync_index(conn)
+    with Session(engine) as db:
+        ranked = term_search.search_ids(db, "약관")
+        assert set(ranked[:2]) == {1, 3} and set(ranked[2:]) == {2, 4}
+        pages, after_id = [], None
+        while True:
+            page = term_search.search_ids(db, "약관", limit=1, after_id=after_id)
+            if not page:
+                break
+            pages.extend(page)
+            after_id = page[-1]
+        assert pages == ranked
+        assert term_search.search_ids(db, "약관", limit=2, after_id=999) == []